@@ -7,53 +7,48 @@ Created on Mon Mar 30 15:55:25 2020
 1. Homogenizes discordant drug names across the different anticholinergic scale and creates a single data frame containing all scales.
 2. Creates a new scale that averages the scores from previously published scales (except meta-analysis-based scales).
 3. Exports a table with drugs as rows and anticholinergic scales as columns; it includes only drugs that were scored with >0 by at least one scale.
+4. Exports the same table as binary files (sorted drug names, drug x scale matrix, combination flags) that the later scripts load memory-mapped (with the hash of aas_combined.csv, so that they rebuild the files if the .csv changed).
 """
 
 import pandas as pd
 import numpy as np
 import re
-
-
-# read in aa-scales
-kiesel = (pd.read_csv ('Kiesel.csv').sort_values(by=['aa'], ascending = False)) 
-kiesel_duran = (pd.read_csv ('Kiesel_Duran.csv').sort_values(by=['aa'], ascending = False)) 
-ancelin = (pd.read_csv ('Ancelin.csv').sort_values(by=['aa'], ascending = False))
-boustani = (pd.read_csv ('Boustani.csv').sort_values(by=['aa'], ascending = False))
-carnahan = (pd.read_csv ('Carnahan.csv').sort_values(by=['aa'], ascending = False))
-cancelli = (pd.read_csv ('Cancelli.csv').sort_values(by=['aa'], ascending = False))
-chew = (pd.read_csv ('Chew.csv').sort_values(by=['aa'], ascending = False))
-rudolph = (pd.read_csv ('Rudolph_Sumukadas.csv').sort_values(by=['aa'], ascending = False))
-ehrt = (pd.read_csv ('Ehrt.csv').sort_values(by=['aa'], ascending = False))
-han = (pd.read_csv ('Han.csv').sort_values(by=['aa'], ascending = False))
-sittironnarit = (pd.read_csv ('Sittironnarit.csv').sort_values(by=['aa'], ascending = False))
-duran = (pd.read_csv ('Duran.csv').sort_values(by=['aa'], ascending = False))
-briet = (pd.read_csv ('Briet.csv').sort_values(by=['aa'], ascending = False))
-bishara = (pd.read_csv ('Bishara.csv').sort_values(by=['aa'], ascending = False))
-nery = (pd.read_csv ('nery.csv').sort_values(by=['aa'], ascending = False))
-jun = (pd.read_csv ('jun.csv').sort_values(by=['aa'], ascending = False))
-
-
-# rename the columns
-kiesel.columns = ['drug', 'aa_kiesel']
-kiesel_duran.columns = ['drug', 'aa_kiesel_duran']
-ancelin.columns = ['drug', 'aa_ancelin']
-boustani.columns = ['drug', 'aa_boustani']
-carnahan.columns = ['drug', 'aa_carnahan']
-cancelli.columns = ['drug', 'aa_cancelli']
-chew.columns = ['drug', 'aa_chew']
-rudolph.columns = ['drug', 'aa_rudolph']
-ehrt.columns = ['drug', 'aa_ehrt']
-han.columns = ['drug', 'aa_han']
-sittironnarit.columns = ['drug', 'aa_sittironnarit']
-duran.columns = ['drug', 'aa_duran']
-briet.columns = ['drug', 'aa_briet']
-bishara.columns = ['drug', 'aa_bishara']
-nery.columns = ['drug', 'aa_nery']
-jun.columns = ['drug', 'aa_jun']
-
-# create a list of scales 
-scales = [kiesel, kiesel_duran, ancelin, boustani, carnahan, cancelli, chew, rudolph, ehrt, han, sittironnarit, duran, briet, bishara, nery, jun]
-scales_names = ['Kiesel', 'Kiesel_Duran', 'Ancelin', 'Boustani', 'Carnahan', 'Cancelli', 'Chew', 'Rudolph', 'Ehrt', 'Han', 'Sittironnarit', 'Duran', 'Briet', 'Bishara','Nery','Jun']
+from helpers import REGEX_CHARACTERS, save_scale_table
+
+
+## Read in the aa-scales
+# list of the published scales: file, name, column with the scores in the combined table, and whether the scale counts towards the new
+# meta-scale; adding a scale only requires a new row here (the meta-scale columns come first in the exported table, in the order below)
+scale_list = pd.DataFrame([['Ancelin.csv', 'Ancelin', 'aa_ancelin', True],
+                           ['Chew.csv', 'Chew', 'aa_chew', True],
+                           ['Cancelli.csv', 'Cancelli', 'aa_cancelli', True],
+                           ['Han.csv', 'Han', 'aa_han', True],
+                           ['Rudolph_Sumukadas.csv', 'Rudolph', 'aa_rudolph', True],
+                           ['Ehrt.csv', 'Ehrt', 'aa_ehrt', True],
+                           ['Sittironnarit.csv', 'Sittironnarit', 'aa_sittironnarit', True],
+                           ['Boustani.csv', 'Boustani', 'aa_boustani', True],
+                           ['Carnahan.csv', 'Carnahan', 'aa_carnahan', True],
+                           ['Briet.csv', 'Briet', 'aa_briet', True],
+                           ['Bishara.csv', 'Bishara', 'aa_bishara', True],
+                           ['nery.csv', 'Nery', 'aa_nery', True],
+                           ['jun.csv', 'Jun', 'aa_jun', True],
+                           ['Kiesel.csv', 'Kiesel', 'aa_kiesel', False],
+                           ['Duran.csv', 'Duran', 'aa_duran', False],
+                           ['Kiesel_Duran.csv', 'Kiesel_Duran', 'aa_kiesel_duran', False]],
+                          columns = ['file', 'name', 'column', 'meta'])
+
+# drugs from Kiesel's and Duran's lists that were not on any other list, so that we can use those drugs in the development of the new meta-scale
+# (scale column, column of the add-on in the combined table, drugs)
+add_ons = [['aa_kiesel', 'aa_kiesel_add_on', ['rotigotine', 'aclidinium bromide', 'dimetindene', 'etoricoxib']],
+           ['aa_duran', 'aa_duran_add_on', ['ketotifen']]]
+
+# read in the scales and rename the columns
+scales = []
+for file, column in zip(scale_list['file'], scale_list['column']):
+    scale = (pd.read_csv (file).sort_values(by=['aa'], ascending = False))
+    scale.columns = ['drug', column]
+    scales.append(scale)
+scales_names = scale_list['name'].tolist()
 
 # iterate through the list created above and for all scales:
     # convert to lowercase
@@ -102,16 +97,45 @@ def findName(drug_name):
 
 
 
-# execute the replacing algorithm
+# words (runs of letters) in a drug name; a drug name can only be found (exact word match) in a name that contains all of its words
+def findWords(drug_name):
+    return set(re.findall(r'[a-zA-Z]+', drug_name))
+
+# put the drug names of all scales in one list and index the rows of the list by the words in them
+names = []
+for scale in scales:
+    names += scale['drug'].tolist()
+word_index = {}
+for row, drug_name in enumerate(names):
+    for word in findWords(drug_name):
+        word_index.setdefault(word, set()).add(row)
+
+# execute the replacing algorithm (the brand names are substituted one after another, as each substitution can create a name that a later brand name matches)
 drug_count = len(name_dict) # the count tracks the loop below
 for drug in name_dict: 
     print('Substituting ' + drug + ' with ' + str(name_dict[drug]) + '...' + '\n' + 'Drugs left: ' + str(drug_count))
-    for scale in scales:        
-        name_rows = scale.loc[:, 'drug'].apply(lambda x: findName(x)) # find rows with drug (exact word match) VERY SLOW BECAUSE OF REGEX
-        name_indices = list((name_rows[name_rows==1]).index) # mark the rows/indices of the data frame where the drug was found  
-        scale.loc[name_indices, 'drug'] = scale.loc[name_indices, 'drug'].str.replace(drug, name_dict[drug], regex=False)
+    drug_words = findWords(drug)
+    if len(drug_words) == 0 or any(char in REGEX_CHARACTERS for char in drug): # names that are used as regular expressions (or without words) are checked in all rows
+        name_rows = range(len(names))
+    else: # only check the rows that contain all words of the drug name
+        name_rows = set.intersection(*[word_index.get(word, set()) for word in drug_words])
+    for row in name_rows:
+        if findName(names[row]): # find rows with drug (exact word match)
+            drug_name = names[row].replace(drug, name_dict[drug])
+            # update the index with the words of the new name
+            for word in findWords(names[row]) - findWords(drug_name):
+                word_index[word].discard(row)
+            for word in findWords(drug_name):
+                word_index.setdefault(word, set()).add(row)
+            names[row] = drug_name
     drug_count -= 1 # track progress
 
+# write the new names back to the scales
+row = 0
+for scale in scales:
+    scale['drug'] = names[row:(row + len(scale))]
+    row += len(scale)
+
 
 ## Remove potential duplicates from each scale
 # identify scales with duplicate drug entries
@@ -123,95 +147,50 @@ for scale in scales:
         duplicates = 'No.'
     print(scales_names[count] + ' duplicates? ' + duplicates)
     count += 1
-# remove duplicates
-kiesel = kiesel[~kiesel.duplicated(['drug'])]
-kiesel_duran = kiesel_duran[~kiesel_duran.duplicated(['drug'])]
-ancelin = ancelin[~ancelin.duplicated(['drug'])]
-boustani = boustani[~boustani.duplicated(['drug'])]
-carnahan = carnahan[~carnahan.duplicated(['drug'])]
-cancelli = cancelli[~cancelli.duplicated(['drug'])]
-chew = chew[~chew.duplicated(['drug'])]
-rudolph = rudolph[~rudolph.duplicated(['drug'])]
-ehrt = ehrt[~ehrt.duplicated(['drug'])]
-han = han[~han.duplicated(['drug'])]
-sittironnarit = sittironnarit[~sittironnarit.duplicated(['drug'])]
-duran = duran[~duran.duplicated(['drug'])]
-nery = nery[~nery.duplicated(['drug'])]
-jun = jun[~jun.duplicated(['drug'])]
+# remove duplicates (the first entry of a drug is kept)
+scales = [scale[~scale.duplicated(['drug'])] for scale in scales]
 
 
 
 
 
 ## Prepare the new data frame.
-# create a data frame that includes only those drugs from Kiesel's and Duran's lists that were not on any other list
-# so that we can use those drugs in the development of the new meta-scale
-kiesel_add_on = (kiesel.loc[(kiesel['drug']=='rotigotine') | (kiesel['drug']=='aclidinium bromide') | (kiesel['drug']=='dimetindene') | (kiesel['drug']=='etoricoxib')]).copy()
-kiesel_add_on.columns = ['drug', 'aa_kiesel_add_on']
-duran_add_on = (duran.loc[(duran['drug']=='ketotifen')]).copy()
-duran_add_on.columns = ['drug', 'aa_duran_add_on']
-
-# merge all scales into one data frame
-scales = pd.merge(ancelin.copy(), chew.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), cancelli.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), han.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), rudolph.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), ehrt.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), sittironnarit.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), boustani.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), carnahan.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), briet.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), bishara.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), nery.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), jun.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), kiesel_add_on.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), duran_add_on.copy(), on='drug', how='outer')
-scales = scales[~scales.duplicated(['drug'])]
-
-
-# create columns indicating the number of times that a certain score appears
-scales['aa_0'] = np.nan; scales['aa_05'] = np.nan; scales['aa_1'] = np.nan; scales['aa_2'] = np.nan; scales['aa_3'] = np.nan; scales['aa_4'] = np.nan
-
-scales['aa_0'] = (scales['aa_ancelin'] == 0).astype(int) + (scales['aa_chew'] == 0).astype(int) + (scales['aa_cancelli'] == 0).astype(int) \
-     + (scales['aa_han'] == 0).astype(int) + (scales['aa_rudolph'] == 0).astype(int) + (scales['aa_ehrt'] == 0).astype(int) + \
-     (scales['aa_sittironnarit'] == 0).astype(int) + (scales['aa_boustani'] == 0).astype(int) + (scales['aa_carnahan'] == 0).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 0).astype(int) + (scales['aa_duran_add_on'] == 0).astype(int) + (scales['aa_briet'] == 0).astype(int) + \
-         (scales['aa_bishara'] == 0).astype(int) + (scales['aa_nery'] == 0).astype(int) + (scales['aa_jun'] == 0).astype(int)
-
-scales['aa_05'] = (scales['aa_ancelin'] == 0.5).astype(int) + (scales['aa_chew'] == 0.5).astype(int) + (scales['aa_cancelli'] == 0.5).astype(int) \
-     + (scales['aa_han'] == 0.5).astype(int) + (scales['aa_rudolph'] == 0.5).astype(int) + (scales['aa_ehrt'] == 0.5).astype(int) + \
-     (scales['aa_sittironnarit'] == 0.5).astype(int) + (scales['aa_boustani'] == 0.5).astype(int) + (scales['aa_carnahan'] == 0.5).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 0.5).astype(int) + (scales['aa_duran_add_on'] == 0.5).astype(int) + (scales['aa_briet'] == 0.5).astype(int) + \
-         (scales['aa_bishara'] == 0.5).astype(int) + (scales['aa_nery'] == 0.5).astype(int) + (scales['aa_jun'] == 0.5).astype(int)
-     
-scales['aa_1'] = (scales['aa_ancelin'] == 1).astype(int) + (scales['aa_chew'] == 1).astype(int) + (scales['aa_cancelli'] == 1).astype(int) \
-     + (scales['aa_han'] == 1).astype(int) + (scales['aa_rudolph'] == 1).astype(int) + (scales['aa_ehrt'] == 1).astype(int) + \
-     (scales['aa_sittironnarit'] == 1).astype(int) + (scales['aa_boustani'] == 1).astype(int) + (scales['aa_carnahan'] == 1).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 1).astype(int) + (scales['aa_duran_add_on'] == 1).astype(int) + (scales['aa_briet'] == 1).astype(int) + \
-         (scales['aa_bishara'] == 1).astype(int) + (scales['aa_nery'] == 1).astype(int) + (scales['aa_jun'] == 1).astype(int)
-     
-scales['aa_2'] = (scales['aa_ancelin'] == 2).astype(int) + (scales['aa_chew'] == 2).astype(int) + (scales['aa_cancelli'] == 2).astype(int) \
-     + (scales['aa_han'] == 2).astype(int) + (scales['aa_rudolph'] == 2).astype(int) + (scales['aa_ehrt'] == 2).astype(int) + \
-     (scales['aa_sittironnarit'] == 2).astype(int) + (scales['aa_boustani'] == 2).astype(int) + (scales['aa_carnahan'] == 2).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 2).astype(int) + (scales['aa_duran_add_on'] == 2).astype(int) + (scales['aa_briet'] == 2).astype(int) + \
-         (scales['aa_bishara'] == 2).astype(int) + (scales['aa_nery'] == 2).astype(int) + (scales['aa_jun'] == 2).astype(int)
-          
-scales['aa_3'] = (scales['aa_ancelin'] == 3).astype(int) + (scales['aa_chew'] == 3).astype(int) + (scales['aa_cancelli'] == 3).astype(int) \
-     + (scales['aa_han'] == 3).astype(int) + (scales['aa_rudolph'] == 3).astype(int) + (scales['aa_ehrt'] == 3).astype(int) + \
-     (scales['aa_sittironnarit'] == 3).astype(int) + (scales['aa_boustani'] == 3).astype(int) + (scales['aa_carnahan'] == 3).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 3).astype(int) + (scales['aa_duran_add_on'] == 3).astype(int) + (scales['aa_briet'] == 3).astype(int) + \
-         (scales['aa_bishara'] == 3).astype(int) + (scales['aa_nery'] == 3).astype(int) + (scales['aa_jun'] == 3).astype(int)
-
-scales['aa_4'] = (scales['aa_ancelin'] == 4).astype(int) + (scales['aa_chew'] == 4).astype(int) + (scales['aa_cancelli'] == 4).astype(int) \
-     + (scales['aa_han'] == 4).astype(int) + (scales['aa_rudolph'] == 4).astype(int) + (scales['aa_ehrt'] == 4).astype(int) + \
-     (scales['aa_sittironnarit'] == 4).astype(int) + (scales['aa_boustani'] == 4).astype(int) + (scales['aa_carnahan'] == 4).astype(int) \
-     + (scales['aa_kiesel_add_on'] == 4).astype(int) + (scales['aa_duran_add_on'] == 4).astype(int) + (scales['aa_briet'] == 4).astype(int) + \
-         (scales['aa_bishara'] == 4).astype(int) + (scales['aa_nery'] == 4).astype(int) + (scales['aa_jun'] == 4).astype(int)
-          
-# add Duran's and Kiesel's scales to the end of the data frame
-scales = pd.merge(scales.copy(), kiesel.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), duran.copy(), on='drug', how='outer')
-scales = pd.merge(scales.copy(), kiesel_duran.copy(), on='drug', how='outer')
+# stack all scales into one long table with a row for each drug and scale
+scales_long = []
+for scale in scales:
+    scale_long = scale.copy()
+    scale_long.columns = ['drug', 'aa']
+    scale_long['column'] = scale.columns[1]
+    scales_long.append(scale_long)
+# the add-ons are the rows of their scale with the listed drugs
+scale_columns = scale_list['column'].tolist()
+for column, add_on_column, add_on_drugs in add_ons:
+    scale_long = scales_long[scale_columns.index(column)]
+    scale_long = (scale_long.loc[scale_long['drug'].isin(add_on_drugs)]).copy()
+    scale_long['column'] = add_on_column
+    scales_long.append(scale_long)
+scales_long = pd.concat(scales_long, ignore_index=True)
+
+# the columns of the combined table: the scales in the new meta-scale and the add-ons, followed by the other scales
+meta_columns = scale_list.loc[scale_list['meta'], 'column'].tolist() + [add_on_column for column, add_on_column, add_on_drugs in add_ons]
+other_columns = scale_list.loc[~scale_list['meta'], 'column'].tolist()
+
+# align all scales into a single drug x scale matrix (drugs in the order in which they first appear in the scales, meta-scale first)
+drug_order = pd.concat([scales_long.loc[scales_long['column'].isin(meta_columns)], scales_long.loc[scales_long['column'].isin(other_columns)]])['drug'].unique()
+scales = scales_long.pivot(index='drug', columns='column', values='aa').reindex(index=drug_order, columns=meta_columns + other_columns)
+scales.columns.name = None
+
+# count the number of times that a certain score appears among the scales in the new meta-scale (only for drugs that are on those scales)
+scores = [0, 0.5, 1, 2, 3, 4]
+score_columns = ['aa_0', 'aa_05', 'aa_1', 'aa_2', 'aa_3', 'aa_4']
+meta_drugs = scales_long.loc[scales_long['column'].isin(meta_columns), 'drug'].unique()
+score_counts = (scales.loc[meta_drugs, meta_columns].to_numpy()[:, :, np.newaxis] == np.array(scores)).sum(axis=1)
+score_counts = pd.DataFrame(score_counts, index=meta_drugs, columns=score_columns).reindex(drug_order) # drugs that are only on Duran's and Kiesel's scales get NaN
+
+# put the counts between the meta-scale columns and Duran's and Kiesel's scales
+scales = pd.concat([scales[meta_columns], score_counts, scales[other_columns]], axis=1)
+scales.index.name = 'drug'
+scales = scales.reset_index()
 
 ax1 = scales.plot.scatter(x='aa_kiesel',
                       y='aa_duran',
@@ -224,3 +203,4 @@ scales = scales.loc[(scales['aa_05']!=0) | (scales['aa_1']!=0) | (scales['aa_2']
 
 # export
 meds = scales.to_csv('aas_combined.csv',index=False, header=True)
+save_scale_table('aas_combined', scales, scale_columns) # aas_combined.drugs.npy, aas_combined.scores.npy, etc.
@@ -19,76 +19,40 @@ The columns retained in the exported data frame are:
 """
 
 import os
-import re
+from multiprocessing import Pool
 import pandas as pd
 import numpy as np
+from helpers import DrugMatcher, SubstitutionCache, map_unique
 
 
 os.chdir('D:\\PhD\\MAIN')
 
+# number of rows of the GP prescriptions that are read, cleaned, and exported at a time; with a chunk size, peak memory is set by the
+# chunk size rather than by the size of the cohort (None reads the whole file at once)
+chunk_size = None
+# on-disk cache of the brand-name substitutions (None disables the cache) and the maximum number of substitutions kept in it; when the
+# file with alternative drug names changes, only new prescriptions and those containing a changed brand name are substituted again
+cache_file = 'substitution_cache.sqlite'
+cache_size = 5000000
+# number of processes that clean the prescriptions; with more than one, the rows are split into shards by participant id (the same
+# participant always goes to the same shard) and the shards are cleaned in parallel (1 cleans everything in this process)
+n_processes = 1
 
-## Read in the data and prepare it.
-meds = pd.read_csv('UK Biobank/Processed files/Tables/gp_scripts_python.csv', header=0, sep=",", dtype = str, encoding = 'cp1252')
-meds.drop(['Unnamed: 0'], axis=1, inplace=True) # drop unnecessary column
-meds.columns = ['id', 'data_provider', 'date', 'read_code', 'bnf', 'dmd', 'prescription', 'quantity'] # re-name the columns
-meds.loc[:,'prescription'] = meds.loc[:,'prescription'].str.lower() # convert prescription names to lowercase
 
+## Read in the look-up tables and prepare them.
 codes = pd.read_csv('UK Biobank/Suppl. info/Prescription codes/read-codes.csv', sep=",", dtype = str, encoding = "cp1252") # read in the codes
 codes.columns = ['code', 'drug', 'status_flag'] # re-name the columns
 codes['code'] = codes.code.astype(str) # change codes to strings
 codes['code'] = codes.loc[:,'code'].apply(str.strip) # remove leading and trailing white spaces from read-codes in the read-code data frame
-meds.loc[meds['read_code'].isna(), 'read_code'] = 'unknown' # change NA values in read_code column into 'unknown'
-meds['read_code'] = meds.loc[:,'read_code'].apply(str.strip) # remove white spaces from read-codes in the prescriptions data frame
 codes = codes.drop_duplicates(subset = 'code') # drop duplicate rows
 
-
-
-
-## Some read-codes contain two 0s at the end; remove those.
-# helper function to remove the additional 0's in some read-codes
-def remove_00(code):
-    if (code != 'unknown') & (len(code)==7) & (code[-2:len(code)]=='00'): # do not change the 'unknown'-strings, change only those with two 0s at the end
-        new_code = code[0:-2] # retain everything but the last two characters of the string
-        return new_code
-    else:
-        return code
-
-meds['read_code'] = meds['read_code'].apply(remove_00) # run the helper function to remove the 00s
-
-
-
-
-## Use the read-code list to supplement the data frame.
 # create a dictionary with read-code/drug-name pairs
 read_code_dict = (codes.groupby('code')['drug'].apply(lambda x: x.tolist())).to_dict()
 # the prescriptions are individual lists; transform them to strings
 for key in read_code_dict.keys():
     read_code_dict[key] = ''.join(read_code_dict[key])
-
-# helper code to fill read-codes into the 'meds' dataset
-def find_read_code(code):
-    try:
-        read_code = read_code_dict[code]
-    except: # if the code doesn't exist, flag as "unknown"
-        read_code = 'unknown'
-    return read_code
-
-# create a column for read-code-supplemented information
-meds['prescription_read'] = np.nan
-# plug each read-code in our sample into the dictionary as a key and create an additional column from the values
-meds['prescription_read'] = meds.loc[:,'read_code'].apply(lambda x: find_read_code(x))
-#convert to lowercase
-meds.loc[:,'prescription_read'] = meds.loc[:,'prescription_read'].str.lower()
-# put read-code-supplied drugs into the drug column
-meds.loc[meds['prescription'].isna(), 'prescription'] = (meds.loc[meds['prescription'].isna(), 'prescription_read']).copy()
-# change 'unknown' in prescription column back to NaN
-meds.loc[meds['prescription']=='unknown', 'prescription'] = np.nan
-
-
-
-
-
-## Standardize drug names for all anticholinergic drugs based on BNF
+# the same pairs as a series indexed by read-code (drug names in lowercase), so that the read-codes can be looked up all at once
+read_code_names = pd.Series(read_code_dict, dtype=object).str.lower()
 
 # read in the file with alternative drug names
 drug_names = pd.read_csv('anticholinergic burden scales/alternative drug names_reformatted.csv', header=0, dtype = str, encoding = 'cp1252')
@@ -101,70 +65,147 @@ drug_names = (drug_names.loc[~drug_names['generic'].isnull()]).copy()
 # create dictionary with alternative-/brand- and generic drug names
 name_dict = dict(zip(drug_names['brand'], drug_names['generic']))
 
-# function to find the drug name
-def findName(drug_name):
-    # Regex: one of the characters in the bracket or start of string or space; drug name; one of the characters in the bracket or space or end of string
-    pattern = re.search(r'([^a-zA-Z]+|^)({0})([^a-zA-Z]+|$)'.format(drug), drug_name)
-    if pattern:
-        return 1
-    else: return 0
-
-# create a temporary data frame to speed up search
-temp_frame = meds['prescription'].to_frame()
-temp_frame['prescription_new'] = 'NULL'
-drug_count = len(name_dict) # the count tracks the loop below
-for drug in name_dict:
-    print('Substituting ' + drug + ' with ' + str(name_dict[drug]) + '...' + '\n' + 'Drugs left: ' + str(drug_count))
-    name_finds = (temp_frame.loc[temp_frame['prescription'].str.contains(drug, na=False), 'prescription'].apply(lambda x: findName(x))) # find rows with drug (exact word match)
-    name_indices = name_finds[name_finds==1]
-    drug_count -= 1
-    if len(name_indices)>0:
-        temp_frame.loc[name_indices.index, 'prescription_new'] = (temp_frame.loc[name_indices.index, 'prescription'].str.replace(drug, name_dict[drug], regex=False)).copy() # replace the drug
-        temp_frame.loc[name_indices.index, 'prescription_new'] = (temp_frame.loc[name_indices.index, 'prescription_new'].str.replace('ee', 'e')).copy() # in some subsitutions, a drug name gets replaced by a drug name that ends with an e (dicycloverin --> dicycloverine); this leads to an additional 'e' after subsitution (dicycloverine --> dicycloverinee)
-
-
-# attach temporary frame as new prescription column
-meds['prescription_new'] = (temp_frame['prescription_new']).copy()
-
-# rename columns
-meds = meds.rename(columns = {'prescription':'prescription_old', 'prescription_new':'prescription'})
-
-# for the prescriptions that weren't changed: set them to the same value as the old prescriptions
-meds.loc[meds['prescription']=='NULL', 'prescription'] = (meds['prescription_old']).copy()
+# build the matcher once from all brand names (in the order of the dictionary)
+brand_names = list(name_dict.keys())
+brand_matcher = DrugMatcher(brand_names)
+substitution_cache = None # opened on first use, so that each process has its own connection to the cache file
 
-# based on skimming through the data frame, some entries have to be manually altered
-meds.loc[meds['prescription'].str.contains('patch', na=False), 'prescription'] = (meds.loc[meds['prescription'].str.contains('patch', na=False), 'prescription'].str.replace('hyoscine', 'hyoscine hydrobromide')).copy()
-meds.loc[meds['prescription'].str.contains('300', na=False), 'prescription'] = (meds.loc[meds['prescription'].str.contains('300', na=False), 'prescription'].str.replace('hyoscine', 'hyoscine hydrobromide')).copy()
-meds.loc[meds['prescription'].str.contains('400', na=False), 'prescription'] = (meds.loc[meds['prescription'].str.contains('400', na=False), 'prescription'].str.replace('hyoscine', 'hyoscine hydrobromide')).copy()
-meds.loc[meds['prescription'].str.contains('600', na=False), 'prescription'] = (meds.loc[meds['prescription'].str.contains('600', na=False), 'prescription'].str.replace('hyoscine', 'hyoscine hydrobromide')).copy()
-
-
-
-
-## Misc. cleaning
-# remove participants that have opted outs
+# participants that have opted out
 opt_out = pd.read_csv('UK Biobank/Raw files/participant opt-out.csv')
 opt_out.columns = ['id']
-meds['id'] = meds['id'].astype(str)
 opt_out['id'] = opt_out['id'].astype(str)
-meds = meds.loc[~meds['id'].isin(opt_out.id)] 
-meds = meds.reset_index(drop=True)
-# remove rows with blank prescription column
-meds = meds.loc[meds['prescription'].notnull()]
-# remove rows with blank/invalid date
-meds = meds.loc[~meds['date'].isna(), :] 
+
+# invalid dates
 invalid_dates = ["01/01/1901", "02/02/1902", "03/03/1903", "07/07/2037"]
-meds = meds.loc[~meds['date'].isin(invalid_dates), :]
-#remove unnecessary columns
-meds.drop(['read_code','bnf','dmd','prescription_read'], axis=1, inplace=True)
-# change all prescriptions to strings
-meds['prescription'] = meds.prescription.astype(str)
-# convert to lowercase
-meds.loc[:,'prescription'] = meds['prescription'].str.lower()
-#remove potential white-space from the front of prescription names
-meds['prescription'] = meds.loc[:,'prescription'].apply(str.strip)
-#remove all '|' characters, as it will be used as a column separator
-meds['prescription'] = meds['prescription'].str.replace('|', ' ')
-
-#export to .csv
-prescriptions = meds.to_csv('2_prescriptions_readv2_v2.csv', index=False, header=True, sep='|')
+
+
+
+
+## Helper functions used in the cleaning below.
+
+# helper function to remove white spaces and the additional 0's in some read-codes
+def remove_00(read_codes):
+    read_codes = read_codes.str.strip()
+    with_00 = (read_codes != 'unknown') & (read_codes.str.len()==7) & (read_codes.str.endswith('00')) # do not change the 'unknown'-strings, change only those with two 0s at the end
+    read_codes.loc[with_00] = read_codes.loc[with_00].str[:-2] # retain everything but the last two characters of the string
+    return read_codes
+
+# helper code to look up the drug names of the read-codes
+def find_read_code(read_codes):
+    return read_codes.map(read_code_names).fillna('unknown') # if the code doesn't exist, flag as "unknown"
+
+# function to substitute the brand names in a single prescription
+def substituteName(prescription):
+    # find all brand names in the prescription (exact word match) in a single scan
+    found = brand_matcher.matched(prescription)
+    if len(found)==0:
+        return 'NULL'
+    # if several brand names are found, the one that comes last in the dictionary is substituted (each substitution is made on the original prescription and overwrites the previous ones)
+    drug = brand_names[max(found)]
+    prescription_new = prescription.replace(drug, name_dict[drug]) # replace the drug
+    return prescription_new.replace('ee', 'e') # in some subsitutions, a drug name gets replaced by a drug name that ends with an e (dicycloverin --> dicycloverine); this leads to an additional 'e' after subsitution (dicycloverine --> dicycloverinee)
+
+# function to substitute the brand names in the distinct prescriptions (through the cache, if there is one)
+def substituteNames(prescriptions):
+    global substitution_cache
+    if cache_file is None:
+        return prescriptions.apply(substituteName)
+    if substitution_cache is None:
+        substitution_cache = SubstitutionCache(cache_file, name_dict, max_entries = cache_size)
+    return substitution_cache.substitute(prescriptions, lambda x: x.apply(substituteName))
+
+# based on skimming through the data frame, some entries have to be manually altered
+def fixHyoscine(prescriptions):
+    for term in ['patch', '300', '400', '600']:
+        prescriptions.loc[prescriptions.str.contains(term, na=False)] = (prescriptions.loc[prescriptions.str.contains(term, na=False)].str.replace('hyoscine', 'hyoscine hydrobromide')).copy()
+    return prescriptions
+
+# helper function to clean the text of the distinct prescriptions
+def cleanText(prescriptions):
+    # change all prescriptions to strings
+    prescriptions = prescriptions.astype(str)
+    # convert to lowercase
+    prescriptions = prescriptions.str.lower()
+    #remove potential white-space from the front of prescription names
+    prescriptions = prescriptions.apply(str.strip)
+    #remove all '|' characters, as it will be used as a column separator
+    return prescriptions.str.replace('|', ' ')
+
+
+
+
+## Clean the prescriptions; every step only needs the rows at hand, so this can be done on the whole table or on chunks of rows.
+def cleanChunk(meds):
+    # prepare the data
+    meds.drop(['Unnamed: 0'], axis=1, inplace=True) # drop unnecessary column
+    meds.columns = ['id', 'data_provider', 'date', 'read_code', 'bnf', 'dmd', 'prescription', 'quantity'] # re-name the columns
+    meds.loc[:,'prescription'] = map_unique(meds['prescription'], lambda x: x.str.lower()) # convert prescription names to lowercase (once for each distinct prescription)
+    meds.loc[meds['read_code'].isna(), 'read_code'] = 'unknown' # change NA values in read_code column into 'unknown'
+
+    ## Remove white spaces from read-codes; some read-codes also contain two 0s at the end; remove those.
+    meds['read_code'] = map_unique(meds['read_code'], remove_00) # run the helper function on each distinct read-code
+
+    ## Use the read-code list to supplement the data frame.
+    # look up each distinct read-code in our sample (drug names are already in lowercase) and create an additional column from the names
+    meds['prescription_read'] = map_unique(meds['read_code'], find_read_code)
+    # put read-code-supplied drugs into the drug column
+    meds.loc[meds['prescription'].isna(), 'prescription'] = (meds.loc[meds['prescription'].isna(), 'prescription_read']).copy()
+    # change 'unknown' in prescription column back to NaN
+    meds.loc[meds['prescription']=='unknown', 'prescription'] = np.nan
+
+    ## Standardize drug names for all anticholinergic drugs based on BNF
+    # substitute the brand names once for each distinct prescription and broadcast the results to all rows
+    meds['prescription_new'] = map_unique(meds['prescription'], substituteNames)
+    # rename columns
+    meds = meds.rename(columns = {'prescription':'prescription_old', 'prescription_new':'prescription'})
+    # for the prescriptions that weren't changed: set them to the same value as the old prescriptions
+    meds.loc[meds['prescription']=='NULL', 'prescription'] = (meds['prescription_old']).copy()
+    # manual alterations
+    meds['prescription'] = map_unique(meds['prescription'], fixHyoscine)
+
+    ## Misc. cleaning
+    # remove participants that have opted outs
+    meds['id'] = meds['id'].astype(str)
+    meds = meds.loc[~meds['id'].isin(opt_out.id)] # the row index is kept, so that the rows of the shards can be put back in order
+    # remove rows with blank prescription column
+    meds = meds.loc[meds['prescription'].notnull()]
+    # remove rows with blank/invalid date
+    meds = meds.loc[~meds['date'].isna(), :] 
+    meds = meds.loc[~meds['date'].isin(invalid_dates), :]
+    #remove unnecessary columns
+    meds.drop(['read_code','bnf','dmd','prescription_read'], axis=1, inplace=True)
+    # clean the text of the prescriptions
+    meds['prescription'] = map_unique(meds['prescription'], cleanText)
+    return meds
+
+
+
+
+# split the rows of a chunk into shards by the hash of the participant id (the hash is the same on every run and machine)
+def shardById(meds):
+    shard = pd.util.hash_pandas_object(meds.iloc[:, 1], index=False) % n_processes # the id is the second column of the raw file
+    return [meds_shard for shard_count, meds_shard in meds.groupby(shard.values)]
+
+
+
+
+## Read in the data, clean it, and export to .csv (chunk by chunk, if chunk_size is set).
+# the guard keeps the worker processes from running this part when they import the script
+if __name__ == '__main__':
+    meds = pd.read_csv('UK Biobank/Processed files/Tables/gp_scripts_python.csv', header=0, sep=",", dtype = str, encoding = 'cp1252', chunksize = chunk_size)
+    if chunk_size is None:
+        meds = [meds] # the whole table is a single chunk
+    pool = Pool(n_processes) if n_processes > 1 else None
+    print('Substituting ' + str(len(name_dict)) + ' brand names...')
+    for chunk_count, chunk in enumerate(meds):
+        print('Cleaning chunk ' + str(chunk_count + 1) + '...')
+        if pool is None:
+            chunk = cleanChunk(chunk)
+        else:
+            # clean the shards in parallel and put the rows back in their original order
+            chunk = pd.concat(pool.map(cleanChunk, shardById(chunk))).sort_index()
+        # the first chunk creates the file (with the header), the others are appended to it
+        prescriptions = chunk.to_csv('2_prescriptions_readv2_v2.csv', index=False, header=(chunk_count == 0), sep='|', mode=('w' if chunk_count == 0 else 'a'))
+    if pool is not None:
+        pool.close()
+        pool.join()
@@ -16,207 +16,162 @@ The following new columns are ADDED:
     - 'drug_present': was the drug present on the anticholinergic scale (1) or not (0)
     - 'aa': anticholinergic score of the drug based on the scale
     - 'drug_scale': the name of the drug as it appears in the scale
+    - 'route': bit flags for the administration route and formulation terms in the prescription (see ROUTE_FLAGS in helpers.py)
 """
 
 import os
-import re
+from multiprocessing import Pool
+import numpy as np
 import pandas as pd
+from scipy import sparse
+from helpers import NON_ORAL_ROUTES, DrugMatcher, MatchCache, ScaleTable, classify_routes, encode, decode, has_route, map_unique, sum_scores
 
 
 os.chdir('D:\\PhD\\MAIN')
 
+# on-disk cache of the prescription x drug matches of the last run (None disables the cache); when the scales change (a corrected score,
+# an added drug), only the prescriptions that contain an added drug are searched again, and all scores are recomputed from the matches
+match_file = '3_aa_scales_v2_matches'
+# number of processes that search the prescriptions and classify their administration routes; with more than one, the distinct
+# prescriptions are split into chunks that are processed in parallel (1 does everything in this process)
+n_processes = 1
 
 
-## Read in the files, and properly format.
-
-meds = pd.read_csv('UK Biobank/Processed files/tables/2_prescriptions_readv2_v2.csv', header=0, sep="|", dtype = str, encoding = 'cp1252')
-# change all prescriptions to strings
-meds['prescription'] = meds.prescription.astype(str)
-# convert to lowercase
-meds.loc[:,'prescription'] = meds['prescription'].str.lower()
-#remove potential white-space from the front of prescription names
-meds['prescription'] = meds.loc[:,'prescription'].apply(str.strip)
-
-# read in aa-scales
-scales = pd.read_csv('anticholinergic burden scales/aas_combined.csv')
-# remove duplicates
-scales.drug.value_counts()
-scales = scales[~scales.duplicated(['drug'])]
-
-# separate into individual scales
-ancelin = scales[['drug','aa_ancelin']]; ancelin = ancelin.loc[ancelin['aa_ancelin']!=0]
-boustani = scales[['drug','aa_boustani']]; boustani = boustani.loc[boustani['aa_boustani']!=0]
-carnahan = scales[['drug','aa_carnahan']]; carnahan = carnahan.loc[carnahan['aa_carnahan']!=0]
-cancelli = scales[['drug','aa_cancelli']]; cancelli = cancelli.loc[cancelli['aa_cancelli']!=0]
-chew = scales[['drug','aa_chew']]; chew = chew.loc[chew['aa_chew']!=0]
-han = scales[['drug','aa_han']]; han = han.loc[han['aa_han']!=0]
-rudolph = scales[['drug','aa_rudolph']]; rudolph = rudolph.loc[rudolph['aa_rudolph']!=0]
-ehrt = scales[['drug','aa_ehrt']]; ehrt = ehrt.loc[ehrt['aa_ehrt']!=0]
-sittironnarit = scales[['drug','aa_sittironnarit']]; sittironnarit = sittironnarit.loc[sittironnarit['aa_sittironnarit']!=0]
-kiesel = scales[['drug','aa_kiesel']]; kiesel = kiesel.loc[kiesel['aa_kiesel']!=0]
-duran = scales[['drug','aa_duran']]; duran = duran.loc[duran['aa_duran']!=0]
-briet = scales[['drug','aa_briet']]; briet = briet.loc[briet['aa_briet']!=0]
-bishara = scales[['drug','aa_bishara']]; bishara = bishara.loc[bishara['aa_bishara']!=0]
-nery = scales[['drug','aa_nery']]; nery = nery.loc[nery['aa_nery']!=0]
-jun = scales[['drug','aa_jun']]; jun = jun.loc[jun['aa_jun']!=0]
-
-
-
-
-## Supplement the prescriptions with anticholinergic scores
-
-# create dictionaries with drugs as keys and anticholinergic activity as values
-ancelin_dict = dict(zip(ancelin['drug'], ancelin['aa_ancelin']))
-boustani_dict = dict(zip(boustani['drug'], boustani['aa_boustani']))
-carnahan_dict = dict(zip(carnahan['drug'], carnahan['aa_carnahan']))
-cancelli_dict = dict(zip(cancelli['drug'], cancelli['aa_cancelli']))
-chew_dict = dict(zip(chew['drug'], chew['aa_chew']))
-han_dict = dict(zip(han['drug'], han['aa_han']))
-rudolph_dict = dict(zip(rudolph['drug'], rudolph['aa_rudolph']))
-ehrt_dict = dict(zip(ehrt['drug'], ehrt['aa_ehrt']))
-sittironnarit_dict = dict(zip(sittironnarit['drug'], sittironnarit['aa_sittironnarit']))
-kiesel_dict = dict(zip(kiesel['drug'], kiesel['aa_kiesel']))
-duran_dict = dict(zip(duran['drug'], duran['aa_duran']))
-briet_dict = dict(zip(briet['drug'], briet['aa_briet']))
-bishara_dict = dict(zip(bishara['drug'], bishara['aa_bishara']))
-nery_dict = dict(zip(nery['drug'], nery['aa_nery']))
-jun_dict = dict(zip(jun['drug'], jun['aa_jun']))
-
-# helper code for finding the exact drug name among the prescriptions
-    # Regex for pattern: a character except one of those in the bracket or start of string; drug name; a character except one of those in the bracket or end of string
-def findDrug(prescription):
-    pattern = re.search(r'([^a-zA-Z]+|^)({0})([^a-zA-Z]+|$)'.format(drug), prescription)
-    if pattern:
-        return 1
-    else: return 0
-
-# create a column for the anticholinergic activity of the drug
-meds['aa_ancelin'] = 0
-meds['aa_boustani'] = 0
-meds['aa_carnahan'] = 0
-meds['aa_cancelli'] = 0
-meds['aa_chew'] = 0
-meds['aa_han'] = 0
-meds['aa_rudolph'] = 0
-meds['aa_ehrt'] = 0
-meds['aa_sittironnarit'] = 0
-meds['aa_briet'] = 0
-meds['aa_bishara'] = 0
-meds['aa_nery'] = 0
-meds['aa_jun'] = 0
-meds['aa_kiesel'] = 0
-meds['aa_duran'] = 0
-meds['scale_name'] = 'unknown' # drug name as listed on the anticholinergic scale (makes it easier later on, because it removes the dose, etc.)
-drug_count = len(scales) # the count tracks the loop below
-for drug in scales['drug']:
-    print('Drugs left: ' + str(drug_count) + '\n' + 'Searching for ' + drug + '...')
-    drug_finds = (meds.loc[meds['prescription'].str.contains(drug, na=False), 'prescription'].apply(lambda x: findDrug(x))) # find rows with drug
-    drug_indices = (drug_finds[drug_finds==1]).index
-    # look up the anticholinergic score in the dictionary
-    if len(drug_indices)>0:
-        if drug in ancelin_dict:
-            meds.loc[drug_indices,'aa_ancelin'] += ancelin_dict[drug]
-        if drug in boustani_dict:
-            meds.loc[drug_indices,'aa_boustani'] += boustani_dict[drug]
-        if drug in carnahan_dict:
-            meds.loc[drug_indices,'aa_carnahan'] += carnahan_dict[drug]
-        if drug in cancelli_dict:
-            meds.loc[drug_indices,'aa_cancelli'] += cancelli_dict[drug]
-        if drug in chew_dict:
-            meds.loc[drug_indices,'aa_chew'] += chew_dict[drug]
-        if drug in han_dict:
-            meds.loc[drug_indices,'aa_han'] += han_dict[drug]
-        if drug in rudolph_dict:
-            meds.loc[drug_indices,'aa_rudolph'] += rudolph_dict[drug]
-        if drug in ehrt_dict:
-            meds.loc[drug_indices,'aa_ehrt'] += ehrt_dict[drug]
-        if drug in sittironnarit_dict:
-            meds.loc[drug_indices,'aa_sittironnarit'] += sittironnarit_dict[drug]
-        if drug in briet_dict:
-            meds.loc[drug_indices,'aa_briet'] += briet_dict[drug]
-        if drug in bishara_dict:
-            meds.loc[drug_indices,'aa_bishara'] += bishara_dict[drug]
-        if drug in nery_dict:
-            meds.loc[drug_indices,'aa_nery'] += nery_dict[drug]
-        if drug in jun_dict:
-            meds.loc[drug_indices,'aa_jun'] += jun_dict[drug]            
-        if drug in kiesel_dict:
-            meds.loc[drug_indices,'aa_kiesel'] += kiesel_dict[drug]
-        if drug in duran_dict:
-            meds.loc[drug_indices,'aa_duran'] += duran_dict[drug]
-        meds.loc[(meds.index.isin(drug_indices)) & (meds['scale_name']=='unknown'), 'scale_name'] = drug # add drug name as listed on the scale (do it only for prescriptions for which drug_scale=='unknown')
-    drug_count -= 1 # update count
-
-
-
-
-# for drug combinations that some scales assign aa-scores that are not just simple additions of the individual drugs
-# (Han et al.: acetominophen/codeine, acetominophen/codeine/caffeine; Rudolph et al.: carbidopa/levodopa),
-# assign prescriptions with those combinations, the score for the combination
-
-# re-define the function without the '/' so that it identifies only combos of the two drugs in question and not additional ones
-def findCombo(prescription):
-    pattern = re.search(r'([^a-zA-Z]+|^)({0})([^a-zA-Z]+|$)'.format(drug), prescription)
-    if pattern:
-        return 1
-    else: return 0
 
+## Read in the scales (every worker process does this too; the scales are memory-mapped, so they are not copied into each task)
+
+# read in aa-scales (the binary version of aas_combined.csv written by 0b_combine_scales.py; duplicates are already removed)
+scales = ScaleTable('anticholinergic burden scales/aas_combined')
+# the scales used for scoring
+scale_columns = ['aa_ancelin', 'aa_boustani', 'aa_carnahan', 'aa_cancelli', 'aa_chew', 'aa_han', 'aa_rudolph', 'aa_ehrt', 'aa_sittironnarit',
+                 'aa_kiesel', 'aa_duran', 'aa_briet', 'aa_bishara', 'aa_nery', 'aa_jun']
+# drug combinations that some scales assign aa-scores that are not just simple additions of the individual drugs
+# (Han et al.: acetominophen/codeine, acetominophen/codeine/caffeine; Rudolph et al.: carbidopa/levodopa)
 combos = ['paracetamol/codeine/caffeine', 'paracetamol/codeine', 'carbidopa/levodopa', 'diphenoxylate/atropine']
-drug_count = len(combos) # the count tracks the loop below
-for drug in combos:
-    print('Drugs left: ' + str(drug_count) + '\n' + 'Searching for ' + drug + '...')
-    drug_finds = (meds.loc[meds['prescription'].str.contains(drug, na=False), 'prescription'].apply(lambda x: findCombo(x))) # find rows with drug
-    drug_indices = (drug_finds[drug_finds==1]).index
-    # look up the anticholinergic score in the dictionary
-    if len(drug_indices)>0:
-        if drug in ancelin_dict:
-            meds.loc[drug_indices,'aa_ancelin'] = ancelin_dict[drug]
-        if drug in boustani_dict:
-            meds.loc[drug_indices,'aa_boustani'] = boustani_dict[drug]
-        if drug in carnahan_dict:
-            meds.loc[drug_indices,'aa_carnahan'] = carnahan_dict[drug]
-        if drug in cancelli_dict:
-            meds.loc[drug_indices,'aa_cancelli'] = cancelli_dict[drug]
-        if drug in chew_dict:
-            meds.loc[drug_indices,'aa_chew'] = chew_dict[drug]
-        if drug in han_dict:
-            meds.loc[drug_indices,'aa_han'] = han_dict[drug]
-        if drug in rudolph_dict:
-            meds.loc[drug_indices,'aa_rudolph'] = rudolph_dict[drug]
-        if drug in ehrt_dict:
-            meds.loc[drug_indices,'aa_ehrt'] = ehrt_dict[drug]
-        if drug in sittironnarit_dict:
-            meds.loc[drug_indices,'aa_sittironnarit'] = sittironnarit_dict[drug]
-        if drug in briet_dict:
-            meds.loc[drug_indices,'aa_briet'] = briet_dict[drug]
-        if drug in bishara_dict:
-            meds.loc[drug_indices,'aa_bishara'] = bishara_dict[drug]   
-        if drug in nery_dict:
-            meds.loc[drug_indices,'aa_nery'] = nery_dict[drug]
-        if drug in jun_dict:
-            meds.loc[drug_indices,'aa_jun'] = jun_dict[drug]              
-        if drug in kiesel_dict:
-            meds.loc[drug_indices,'aa_kiesel'] = kiesel_dict[drug]
-        if drug in duran_dict:
-            meds.loc[drug_indices,'aa_duran'] = duran_dict[drug]
-        meds.loc[(meds.index.isin(drug_indices)) & (meds['scale_name']=='unknown'), 'scale_name'] = drug # add drug name as listed on the scale (do it only for prescriptions for which drug_scale=='unknown')
-    drug_count -= 1 # update count
-
-
-
-
-## Misc. cleaning
-
-# flag the prescriptions with a potentially topical, ophthalmic, otic, or nasal administration route
-
-# list with words that indicate "invalid" administration route
-funky_administration = ['topical','ophthalmic','otic','nasal', 'nose drop', 'nose drops', 'cream', 'eye drp', 'eye susp', 'ear drop', \
-                        'ear drops', 'oint', 'spray', 'gel', 'eye dro', ' dro ', 'paste', 'lotion', 'drops', 'neomycin', 'pyrilamine',
-                        'ketorolac', 'betaxolol', 'ear dro', 'emedastine']
-meds['admin_oral'] = '1'
-for admin in funky_administration:
-    print('Checking for "' + str(admin) + '"' + '...')
-    meds.loc[meds['prescription'].str.contains(admin, regex=False, na=False), 'admin_oral'] = '0' # all non-orally and non-inhaled drugs
-
-# export to .csv
-prescriptions = meds.to_csv('3_aa_scales_v2.csv',index=False, header=True, sep='|')
+
+# build the matcher once from the scale drugs (in the order of the scales) and the combinations that are not on the scales (at the end);
+# it finds the drugs with the same word boundaries as the regex r'([^a-zA-Z]+|^)(drug)([^a-zA-Z]+|$)'
+scale_drugs = scales.drugs_in_order()
+match_names = scale_drugs + [combo for combo in combos if combo not in set(scale_drugs)]
+drug_matcher = DrugMatcher(match_names)
+pool = None # the worker processes (created below, if n_processes > 1)
+
+
+
+
+## Functions that process the distinct prescriptions chunk by chunk in the worker processes
+
+# find the drugs in a chunk of prescriptions (the result is a sparse prescription x drug matrix)
+def matchChunk(prescriptions):
+    return drug_matcher.match_matrix(prescriptions)
+
+# find the drugs in a list of prescriptions, in parallel if there is a pool (the chunks are put back together in their original order)
+def matchPrescriptions(prescriptions):
+    if pool is None:
+        return drug_matcher.match_matrix(prescriptions)
+    chunks = [[prescriptions[i] for i in chunk] for chunk in np.array_split(np.arange(len(prescriptions)), n_processes * 4)]
+    matches = sparse.vstack(pool.map(matchChunk, chunks), format='csr')
+    matches.sort_indices()
+    return matches
+
+# classify the administration routes of the prescriptions, in parallel if there is a pool
+def classifyRoutes(prescriptions):
+    if pool is None:
+        return classify_routes(prescriptions)
+    return pd.concat(pool.map(classify_routes, [prescriptions.iloc[chunk] for chunk in np.array_split(np.arange(len(prescriptions)), n_processes * 4)]))
+
+
+
+
+# the guard keeps the worker processes from running this part when they import the script
+if __name__ == '__main__':
+    pool = Pool(n_processes) if n_processes > 1 else None
+
+    ## Read in the files, and properly format.
+
+    meds = pd.read_csv('UK Biobank/Processed files/tables/2_prescriptions_readv2_v2.csv', header=0, sep="|", dtype = str, encoding = 'cp1252')
+    # change all prescriptions to strings
+    meds['prescription'] = meds.prescription.astype(str)
+    # convert to lowercase and remove potential white-space from the front of prescription names (once for each distinct prescription)
+    meds['prescription'] = map_unique(meds['prescription'], lambda x: x.str.lower().apply(str.strip))
+
+    # the text is searched only once for each distinct prescription ('prescriptions'); the results are broadcast back to the rows through the codes
+    prescription_codes, prescriptions = encode(meds['prescription'])
+    prescriptions = prescriptions.to_frame()
+
+
+
+
+    ## Supplement the prescriptions with anticholinergic scores
+
+    # create a column for the anticholinergic activity of the drug
+    prescriptions['aa_ancelin'] = 0
+    prescriptions['aa_boustani'] = 0
+    prescriptions['aa_carnahan'] = 0
+    prescriptions['aa_cancelli'] = 0
+    prescriptions['aa_chew'] = 0
+    prescriptions['aa_han'] = 0
+    prescriptions['aa_rudolph'] = 0
+    prescriptions['aa_ehrt'] = 0
+    prescriptions['aa_sittironnarit'] = 0
+    prescriptions['aa_briet'] = 0
+    prescriptions['aa_bishara'] = 0
+    prescriptions['aa_nery'] = 0
+    prescriptions['aa_jun'] = 0
+    prescriptions['aa_kiesel'] = 0
+    prescriptions['aa_duran'] = 0
+    prescriptions['scale_name'] = 'unknown' # drug name as listed on the anticholinergic scale (makes it easier later on, because it removes the dose, etc.)
+    # find all scale drugs (and the combinations) in each prescription in a single scan; the result is a sparse prescription x drug matrix
+    print('Searching for ' + str(len(scales)) + ' drugs...')
+    if match_file is None:
+        drug_matches = matchPrescriptions(list(prescriptions['prescription']))
+    else:
+        drug_matches = MatchCache(match_file).match_matrix(drug_matcher, prescriptions['prescription'], matchPrescriptions)
+    # the scores of each prescription are the sums of the scores of the drugs found in it (one sparse x dense matrix product for all scales)
+    scores = np.vstack([scales.score_matrix(scale_columns), np.zeros((len(match_names) - len(scale_drugs), len(scale_columns)))])
+    prescriptions[scale_columns] = sum_scores(drug_matches, scores, scale_columns, prescriptions.index)
+    # add drug name as listed on the scale (the first one in the scale order, if a prescription contains several)
+    first_match = np.full(len(prescriptions), len(match_names))
+    has_match = drug_matches.getnnz(axis=1) > 0
+    first_match[has_match] = drug_matches.indices[drug_matches.indptr[:-1][has_match]]
+    has_drug = first_match < len(scale_drugs)
+    prescriptions.loc[has_drug, 'scale_name'] = [scale_drugs[i] for i in first_match[has_drug]]
+
+
+
+    # assign prescriptions with the combinations the score for the combination
+    # the rules are a table of combination x scale scores (NaN: the scale did not score the combination, and the sum is kept); a prescription
+    # gets the scores of the combinations found in it, and if it contains several, the later rule in the table wins
+    combo_rules = pd.DataFrame([scales.scores_of(combo, scale_columns) for combo in combos], index=combos, columns=scale_columns)
+    combo_matches = drug_matches[:, [match_names.index(combo) for combo in combos]].toarray() > 0
+    for column in scale_columns:
+        applies = combo_matches & combo_rules[column].notna().to_numpy()
+        has_rule = applies.any(axis=1)
+        if has_rule.any():
+            last_rule = len(combos) - 1 - np.argmax(applies[has_rule, ::-1], axis=1)
+            prescriptions.loc[has_rule, column] = combo_rules[column].to_numpy()[last_rule]
+    # add the combination as the drug name for prescriptions that have no drug on the scales (the first combination in the table)
+    has_combo = combo_matches.any(axis=1) & (prescriptions['scale_name'] == 'unknown').to_numpy()
+    prescriptions.loc[has_combo, 'scale_name'] = [combos[i] for i in np.argmax(combo_matches[has_combo], axis=1)]
+
+
+
+    ## Misc. cleaning
+
+    # flag the prescriptions with a potentially topical, ophthalmic, otic, or nasal administration route
+
+    # the words that indicate an "invalid" administration route (topical, ophthalmic, otic, nasal, drops, and drugs that are mostly given
+    # locally) are among the route flags in helpers.py; the flags are kept in the 'route' column, so that 3_getDose.py can use them too
+    routes = classifyRoutes(prescriptions['prescription'])
+    prescriptions['admin_oral'] = np.where(has_route(routes, *NON_ORAL_ROUTES), '0', '1') # all non-orally and non-inhaled drugs get '0'
+    prescriptions['route'] = routes
+
+    # attach the results to all prescriptions
+    meds = meds.join(decode(prescriptions.drop(columns = 'prescription'), prescription_codes, meds.index))
+
+    # export to .csv
+    prescriptions = meds.to_csv('3_aa_scales_v2.csv',index=False, header=True, sep='|')
+
+    if pool is not None:
+        pool.close()
+        pool.join()
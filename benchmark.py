@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+Times the Python scripts of the pipeline end-to-end on synthetic data (see synthetic_data.py).
+
+For each number of participants, synthetic inputs are written into <work directory>/<participants>, and every stage is run in its own process, in
+the working directory the script expects (the os.chdir('D:\\PhD\\MAIN') calls of the scripts are ignored). The outputs of a stage are copied to
+where the later stages read them from. For each stage, the following is recorded in <work directory>/benchmark_results.csv:
+    - 'participants', 'prescriptions': size of the synthetic data
+    - 'stage': the script
+    - 'status': 'ok', the error that stopped the script, or 'skipped: input missing' if a file that an earlier stage writes is missing (the
+      stage is then not run; synthetic_data.py writes the output of 5_covariate_addition.py, so that the stages after it run even if it fails)
+    - 'seconds': wall-clock time
+    - 'peak_memory_mb': peak resident memory of the process (None where it cannot be measured)
+    - 'prescriptions_per_second': throughput in GP prescription rows per second
+The output of each script is written to <work directory>/<participants>/<script>.log.
+
+Usage: python benchmark.py <work directory> [number of participants ...] (default: 1000 10000 100000 500000)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import pandas as pd
+import synthetic_data
+
+try:
+    import resource
+except ImportError: # not available on Windows
+    resource = None
+
+
+repo_dir = os.path.dirname(os.path.abspath(__file__))
+
+# the stages in the order in which they are run: script, working directory (relative to the base directory), the files it reads that earlier
+# stages write (relative to the base directory), and the outputs that are copied to the directories where the later stages read them from
+processed_dir = os.path.join('UK Biobank', 'Processed files')
+scales = os.path.join('anticholinergic burden scales', 'aas_combined.csv')
+id_present = os.path.join(processed_dir, 'Suppl. files', 'id_present.csv')
+demographics = os.path.join(processed_dir, 'tables', '6_demographics_v2.csv')
+stages = [['0b_combine_scales.py', 'anticholinergic burden scales', [], []],
+          ['1_clean.py', '.', [], [['2_prescriptions_readv2_v2.csv', [os.path.join(processed_dir, 'Tables'), os.path.join(processed_dir, 'tables'), os.path.join(processed_dir, 'Suppl. files')]]]],
+          ['0a_id_present.py', os.path.join(processed_dir, 'Suppl. files'), [os.path.join(processed_dir, 'Suppl. files', '2_prescriptions_readv2_v2.csv')], []],
+          ['2_aa_score.py', '.', [scales, os.path.join(processed_dir, 'tables', '2_prescriptions_readv2_v2.csv')],
+           [['3_aa_scales_v2.csv', [os.path.join(processed_dir, 'Tables'), os.path.join(processed_dir, 'tables')]]]],
+          ['3_getDose.py', '.', [scales, os.path.join(processed_dir, 'Tables', '3_aa_scales_v2.csv')],
+           [['4_aa_scales_dosage_v2.csv', [os.path.join(processed_dir, 'Tables'), os.path.join(processed_dir, 'tables')]]]],
+          ['4_get_aa_score_new.py', '.', [scales, os.path.join(processed_dir, 'tables', '4_aa_scales_dosage_v2.csv')],
+           [['5_aa_scales_dosage_v2.csv', [os.path.join(processed_dir, 'Tables'), os.path.join(processed_dir, 'tables')]]]],
+          ['5_covariate_addition.py', '.', [os.path.join(processed_dir, 'tables', '5_aa_scales_dosage_v2.csv')],
+           [['6_demographics_v2.csv', [os.path.join(processed_dir, 'Tables'), os.path.join(processed_dir, 'tables')]]]],
+          ['7_id_years.py', '.', [demographics, id_present], []],
+          ['8_id_years_drug_classes.py', '.', [demographics, id_present], []],
+          ['9_id_years_classes_lower.py', '.', [demographics, id_present], []]]
+
+
+
+
+## Running a single stage (in the child process)
+
+# peak resident memory of this process in MB
+def peakMemory():
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024 # bytes on macOS, kilobytes on Linux
+    try:
+        import psutil
+        return psutil.Process().memory_info().peak_wset / 1024**2 # Windows
+    except (ImportError, AttributeError):
+        return None
+
+# run a script in the current directory and write its peak memory and status to a .json file
+def runStage(script, stats_file):
+    import runpy
+    try:
+        import matplotlib
+        matplotlib.use('Agg') # 0b_combine_scales.py draws a plot
+    except ImportError:
+        pass
+    sys.path.insert(0, repo_dir)
+    os.chdir = lambda path: None # the scripts change to the directory of the real data
+    status = 'ok'
+    try:
+        runpy.run_path(os.path.join(repo_dir, script), run_name='__main__')
+    except BaseException as error:
+        status = type(error).__name__ + ': ' + str(error)
+    with open(stats_file, 'w') as file:
+        json.dump({'status': status, 'peak_memory_mb': peakMemory()}, file)
+
+
+
+
+## Running the benchmark
+
+# copy a file to a directory (unless it is already there, e.g. 'Tables' and 'tables' on a case-insensitive file system)
+def copyOutput(file, directory):
+    target = os.path.join(directory, os.path.basename(file))
+    if os.path.exists(target) and os.path.samefile(file, target):
+        return
+    shutil.copyfile(file, target)
+
+# generate the synthetic data for a number of participants and time all stages on it
+def benchmark(work_dir, n_participants):
+    base_dir = os.path.abspath(os.path.join(work_dir, str(n_participants)))
+    if os.path.exists(base_dir):
+        shutil.rmtree(base_dir)
+    print('Generating synthetic data for ' + str(n_participants) + ' participants...')
+    rows = synthetic_data.generate(base_dir, n_participants)
+    results = []
+    for script, stage_dir, inputs, outputs in stages:
+        print('Running ' + script + '...')
+        if not all(os.path.exists(os.path.join(base_dir, file)) for file in inputs):
+            results.append({'participants': n_participants, 'prescriptions': rows, 'stage': script, 'status': 'skipped: input missing',
+                            'seconds': None, 'peak_memory_mb': None, 'prescriptions_per_second': None})
+            print('    skipped: input missing')
+            continue
+        stats_file = os.path.join(base_dir, script + '.json')
+        with open(os.path.join(base_dir, script + '.log'), 'w') as log:
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--stage', script, stats_file], cwd=os.path.join(base_dir, stage_dir),
+                           stdout=log, stderr=subprocess.STDOUT)
+            seconds = time.perf_counter() - start
+        if os.path.exists(stats_file):
+            with open(stats_file) as file:
+                stats = json.load(file)
+        else:
+            stats = {'status': 'process ended without results', 'peak_memory_mb': None}
+        # copy the outputs for the later stages
+        for output, directories in outputs:
+            if os.path.exists(os.path.join(base_dir, stage_dir, output)):
+                for directory in directories:
+                    copyOutput(os.path.join(base_dir, stage_dir, output), os.path.join(base_dir, directory))
+        results.append({'participants': n_participants, 'prescriptions': rows, 'stage': script, 'status': stats['status'],
+                        'seconds': round(seconds, 2), 'peak_memory_mb': stats['peak_memory_mb'], 'prescriptions_per_second': round(rows / seconds)})
+        print('    ' + stats['status'] + ' (' + str(round(seconds, 1)) + ' s)')
+    return results
+
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--stage':
+        runStage(sys.argv[2], sys.argv[3])
+        sys.exit(0)
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    work_dir = sys.argv[1]
+    participants = [int(n) for n in sys.argv[2:]] if len(sys.argv) > 2 else [1000, 10000, 100000, 500000]
+    os.makedirs(work_dir, exist_ok=True)
+    results = []
+    for n_participants in participants:
+        results += benchmark(work_dir, n_participants)
+        # write the results after each size, so that they are kept if a larger size runs out of memory
+        pd.DataFrame(results).to_csv(os.path.join(work_dir, 'benchmark_results.csv'), index=False)
+    print(pd.DataFrame(results).to_string(index=False))
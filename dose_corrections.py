@@ -0,0 +1,1965 @@
+# -*- coding: utf-8 -*-
+"""
+Manual corrections of 3_getDose.py that are made drug by drug.
+
+They are kept apart from the script so that its worker processes (see n_processes in 3_getDose.py) can import them without running the
+script. Each correction only looks at the rows of one drug at a time, so they give the same result on any set of whole drugs (see
+run_per_drug in helpers.py).
+
+1. DOSE_RULES/correct_doses: the manual dose/unit corrections of section A4, as a table of rules.
+2. correct_quantities: the manual number/volume corrections of section B2.
+"""
+
+import numpy as np
+import pandas as pd
+from helpers import RULE_COLUMNS, apply_rules, has_route
+
+
+
+
+## A4. Manually correct the dose/units that do not fit to the straigthorward pattern above (i.e., where the dose for some reason does not correspond to 'dose_a1_number').
+
+# the manual corrections of each drug as a table of rules (see apply_rules in helpers.py for what the columns mean); 'frame' says whether the
+# rule is for the 'found' or the 'lost' rows
+DOSE_RULES = pd.DataFrame([
+    # aminophylline; NA: 225
+    ['aminophylline', 'lost', '225', None, None, 'dose', 225, None],
+
+    # azathioprine; NA: 50 is mg
+    ['azathioprine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # bromocriptine; NA: 1,2.5
+    ['bromocriptine', 'lost', '1', None, None, 'dose', 1, None],
+    ['bromocriptine', 'lost', '2.5', None, None, 'dose', 2.5, None],
+
+    # carbamazepine; NA: 100,200,400
+    ['carbamazepine', 'lost', '100', None, None, 'dose', 100, None],
+    ['carbamazepine', 'lost', '100', 'liquid', None, 'dose_units', 'mg/5ml', None],
+    ['carbamazepine', 'lost', '200', None, None, 'dose', 200, None],
+    ['carbamazepine', 'lost', '400', None, None, 'dose', 400, None],
+
+    # chlordiazepoxide; NA: 10,25
+    ['chlordiazepoxide', 'lost', '10', None, None, 'dose', 10, None],
+    ['chlordiazepoxide', 'lost', '25', None, None, 'dose', 125, None],
+
+    # colchicine; NA:500 is 0.5
+    ['colchicine', 'lost', '500', None, None, 'dose', 0.5, None],
+
+    # famotidine; NA:40mg
+    ['famotidine', 'lost', '40', None, None, 'dose', 40, None],
+
+    # fexofenadine; NA:120,180
+    ['fexofenadine', 'lost', '120', None, None, 'dose', 120, None],
+    ['fexofenadine', 'lost', '180', None, None, 'dose', 180, None],
+
+    # flavoxate; NA:200,100
+    ['flavoxate', 'lost', '200', None, None, 'dose', 200, None],
+    ['flavoxate', 'lost', '100', None, None, 'dose', 100, None],
+
+    # flunitrazepame; NA:1
+    ['flunitrazepame', 'lost', '1', None, None, 'dose', 1, None],
+
+    # fluvoxamine; NA:50,100
+    ['fluvoxamine', 'lost', '50', None, None, 'dose', 50, None],
+    ['fluvoxamine', 'lost', '100', None, None, 'dose', 100, None],
+
+    # isosorbide; NA:60,25,40,50,10
+    ['isosorbide', 'lost', '60', None, None, 'dose', 60, None],
+    ['isosorbide', 'lost', '25', None, None, 'dose', 25, None],
+    ['isosorbide', 'lost', '40', None, None, 'dose', 40, None],
+    ['isosorbide', 'lost', '50', None, None, 'dose', 50, None],
+    ['isosorbide', 'lost', '10', None, None, 'dose', 10, None],
+
+    # methocarbamol; NA:0.75
+    ['methocarbamol', 'lost', '0.75', None, None, 'dose', 0.75, None],
+
+    # naratriptan; NA:all 2.5
+    ['naratriptan', 'lost', None, None, None, 'dose', 2.5, None],
+
+    # nefazodone; NA:200,100
+    ['nefazodone', 'lost', '200', None, None, 'dose', 200, None],
+    ['nefazodone', 'lost', '100', None, None, 'dose', 100, None],
+
+    # nizatidine; NA:150,300
+    ['nizatidine', 'lost', '150', None, None, 'dose', 150, None],
+    ['nizatidine', 'lost', '300', None, None, 'dose', 300, None],
+
+    # oxazepam; NA:10,15,30
+    ['oxazepam', 'lost', '10', None, None, 'dose', 10, None],
+    ['oxazepam', 'lost', '15', None, None, 'dose', 15, None],
+    ['oxazepam', 'lost', '30', None, None, 'dose', 30, None],
+
+    # tiotropium; NA:0.018
+    ['tiotropium', 'lost', '0.018', None, None, 'dose', 0.018, None],
+
+    # trimipramine; NA:10,25,50
+    ['trimipramine', 'lost', '10', None, None, 'dose', 10, None],
+    ['trimipramine', 'lost', '25', None, None, 'dose', 25, None],
+    ['trimipramine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # alimemazine (30 and 7.5 are mg/5ml; 10 is mg)
+    ['alimemazine', 'found', None, None, ('dose_a1_number', '==', 30), 'dose_units', 'mg/5ml', None],
+    ['alimemazine', 'found', None, None, ('dose_a1_number', '==', 7.5), 'dose_units', 'mg/5ml', None],
+
+    # alverine (remove >120mg); NA: 60,120
+    ['alverine', 'found', None, None, ('dose_a1_number', '>', 120), 'dose_units', np.nan, None],
+    ['alverine', 'found', None, None, ('dose_a1_number', '>', 120), 'dose', np.nan, None],
+    ['alverine', 'found', '120', None, None, 'dose', 120, None],
+    ['alverine', 'lost', '60', None, None, 'dose', 60, None],
+    ['alverine', 'lost', '120', None, None, 'dose', 120, None],
+    ['alverine', 'lost', '120', None, None, 'dose_units', 'mg', None],
+
+    # amantadine (100 is mg, 50 is mg/5ml); NA: 100
+    ['amantadine', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['amantadine', 'lost', '100', None, None, 'dose', 100, None],
+
+    # amitriptyline 10,25,50 are mg or mg/5ml; when 1st is 2, use 2nd column
+    ['amitriptyline', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['amitriptyline', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['amitriptyline', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['amitriptyline', 'found', None, None, ('dose_a1_number', '==', 2), 'dose', None, 'dose_a2_number'],
+
+    # amoxicillin 250 is mg or mg/5ml; NA: 250/number or 125/250 is 250, 500 is mg
+    ['amoxicillin', 'found', None, 'liquid', ('dose_a1_number', '==', 250), 'dose_units', 'mg/5ml', None],
+
+    # ampicillin (125 is only mg/5ml, 250 is both mg and mg/5ml); NA: 100,250,500
+    ['ampicillin', 'found', None, None, ('dose_a1_number', '==', 125), 'dose_units', 'mg/5ml', None],
+    ['ampicillin', 'found', None, 'liquid', ('dose_a1_number', '==', 250), 'dose_units', 'mg/5ml', None],
+    ['ampicillin', 'lost', '100', None, None, 'dose', 100, None],
+    ['ampicillin', 'lost', '250', None, None, 'dose', 250, None],
+    ['ampicillin', 'lost', '500', None, None, 'dose', 500, None],
+
+    # aripiprazole (1mg/ml only, others are mg)
+    ['aripiprazole', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+
+    # atenolol (25 is both mg and mg/5ml; sometimes 1st, sometimes 2nd column); 12.5,50,100 are ok; 20 (is nifedipine) is 50; 2nd column when 2nd column is 12.5
+    ['atenolol', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['atenolol', 'found', None, None, [('dose_a1_number', '==', 20), ('dose_a2_number', '==', 20)], 'dose', 50, None],
+    ['atenolol', 'found', None, None, ('dose_a2_number', '==', 12.5), 'dose', 12.5, None],
+
+    # azatadine (0.5 is per 5ml, 1 is ok)
+    ['azatadine', 'found', None, None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/1ml', None],
+
+    # baclofen (remove 60); 5 may be mg/5ml
+    ['baclofen', 'found', None, None, ('dose_a1_number', '==', 60), 'dose', np.nan, None],
+    ['baclofen', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+
+    # benztropine also has 5% and 2.5% eye drops
+    ['benztropine', 'found', None, 'percentage', None, 'dose', np.nan, None],
+
+    # betaxolol 0.25% and 0.5% eye drops
+    ['betaxolol', 'found', None, 'percentage', None, 'dose', np.nan, None],
+
+    # bisacodyl 2.74mg/ml rectal solution; NA: 5,10
+    ['bisacodyl', 'found', None, None, ('dose_a1_number', '==', 2.74), 'dose_units', 'mg/1ml', None],
+    ['bisacodyl', 'lost', '5', None, None, 'dose', 5, None],
+    ['bisacodyl', 'lost', '10', None, None, 'dose', 10, None],
+
+    # brompheniramine 30 is 4/5mg/ml, 2 is mg/5ml; NA:2mg/5ml,12mg
+    ['brompheniramine', 'found', None, None, ('dose_a1_number', '==', 30), 'dose', 4, None],
+    ['brompheniramine', 'found', None, None, ('dose_a1_number', '==', 30), 'dose_units', 'mg/5ml', None],
+    ['brompheniramine', 'found', None, None, ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+
+    # buclizine keep only 3rd column; NA: pink=6.25
+    ['buclizine', 'found', None, None, ('dose_a3_number', 'notnull'), 'dose', None, 'dose_a3_number'],
+
+    # cefalexin 125/5 is mg/ml, 250, 500 are mg; NA: 250,500
+    ['cefalexin', 'found', None, None, ('dose_a1_number', '==', 125), 'dose_units', 'mg/5ml', None],
+    #['cefalexin', 'found', '250', 'liquid', None, 'dose_units', 'mg/5ml', None], # never applied: the text was searched in the 'lost' rows
+    #['cefalexin', 'found', '500', 'liquid', None, 'dose_units', 'mg/5ml', None], # never applied: the text was searched in the 'lost' rows
+    ['cefalexin', 'lost', '250', None, None, 'dose', 250, None],
+    ['cefalexin', 'lost', '500', None, None, 'dose', 500, None],
+
+    # cetirizine 1 is mg/1ml, 5 is mg/5ml, 42000 and 84000 are creams; NA: 10
+    ['cetirizine', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['cetirizine', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['cetirizine', 'found', None, None, ('dose_a1_number', '>', 40000), 'dose', np.nan, None],
+    ['cetirizine', 'found', None, None, ('dose_a1_number', '>', 40000), 'dose_units', np.nan, None],
+    ['cetirizine', 'lost', '10', None, None, 'dose', 10, None],
+
+    # chloroquine if 250 in second column, use second column; NA: 250,200,300
+    ['chloroquine', 'found', None, None, ('dose_a2_number', '==', 250), 'dose', 250, None],
+    ['chloroquine', 'lost', '250', None, None, 'dose', 250, None],
+    ['chloroquine', 'lost', '200', None, None, 'dose', 200, None],
+    ['chloroquine', 'lost', '300', None, None, 'dose', 300, None],
+
+    # chlorpromazine when 20mg and ml in title, it refers to 5/1, 100 is mg or mg/5ml, to 20/1; NA: 100,10,50
+    ['chlorpromazine', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/4ml', None],
+    ['chlorpromazine', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/5ml', None],
+    ['chlorpromazine', 'lost', '100', None, None, 'dose', 100, None],
+    ['chlorpromazine', 'lost', '10', None, None, 'dose', 10, None],
+    ['chlorpromazine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # ciclosporin 14000,7000,3500,1000 are eye ointments; 100 is mg or mg/ml; NA:100
+    ['ciclosporin', 'found', None, None, ('dose_a1_number', '>=', 1000), 'dose', np.nan, None],
+    ['ciclosporin', 'found', None, None, ('dose_a1_number', '>=', 1000), 'dose_units', np.nan, None],
+    ['ciclosporin', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['ciclosporin', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+    ['ciclosporin', 'found', None, 'liquid', ('dose_a1_number', '==', 200), 'dose_units', 'mg/5ml', None],
+    ['ciclosporin', 'lost', '50', None, None, 'dose', 100, None],
+
+    # cimetidine 250mg is 100/5 mg/ml suspension; 200 can be mg or mg/5ml; NA:200,400,800
+    ['cimetidine', 'found', None, None, ('dose_a1_number', '==', 250), 'dose', 100, None],
+    ['cimetidine', 'found', None, None, ('dose_a1_number', '==', 250), 'dose_units', 'mg/5ml', None],
+    ['cimetidine', 'found', None, 'liquid', ('dose_a1_number', '==', 200), 'dose_units', 'mg/5ml', None],
+    ['cimetidine', 'lost', '200', None, None, 'dose', 200, None],
+    ['cimetidine', 'lost', '400', None, None, 'dose', 400, None],
+    ['cimetidine', 'lost', '800', None, None, 'dose', 800, None],
+
+    # citalopram those that contain ml are 40mg/ml or mg; NA: 10,20
+    ['citalopram', 'found', None, 'liquid', ('dose_a1_number', '==', 40), 'dose_units', 'mg/1ml', None],
+    ['citalopram', 'lost', '10', None, None, 'dose', 10, None],
+    ['citalopram', 'lost', '20', None, None, 'dose', 20, None],
+
+    # clemastine 0.5 is mg/5ml; NA:1
+    ['clemastine', 'found', None, None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/5ml', None],
+    ['clemastine', 'lost', '1', None, None, 'dose', 1, None],
+
+    # clindamycin 10 is mg/ml, 75 is mg or mg/5ml, 150 is mg or mg/ml, 300 is mg, 1000 is 2% cream, 25000 is 1% gel, 30000 is 1%, 40000 is 2% cream, 50000 is 1% gel, 60000 is 1% gel, 80000 is 2% cream, 9000 is 1% gel, 10000 is 1% gel, 150000 is 1% gel, then several others have blank 1st column but are % gels/solutions/creams; NA:150
+    ['clindamycin', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['clindamycin', 'found', None, 'liquid', ('dose_a1_number', '==', 75), 'dose_units', 'mg/5ml', None],
+    ['clindamycin', 'found', None, 'liquid', ('dose_a1_number', '==', 150), 'dose_units', 'mg/1ml', None],
+    ['clindamycin', 'found', None, None, ('dose_a1_number', '>', 1000), 'dose', np.nan, None],
+    ['clindamycin', 'found', None, None, ('dose_a1_number', '>', 1000), 'dose_units', np.nan, None],
+    ['clindamycin', 'lost', '150', None, None, 'dose', 150, None],
+
+    # clonazepam 0.5 is mg, 0.25 is mg/5ml, 1 is mg/ml, 2 is mg; NA:500 is 0.5
+    ['clonazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/5ml', None],
+    ['clonazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 0.25), 'dose_units', 'mg/5ml', None],
+    ['clonazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['clonazepam', 'lost', '500', None, None, 'dose', 0.5, None],
+
+    # desloratadine 0.5 and 2.5 are 0.5/1, 5 is mg; NA:10
+    ['desloratadine', 'found', None, None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/1ml', None],
+    ['desloratadine', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/5ml', None],
+    ['desloratadine', 'lost', '10', None, None, 'dose', 10, None],
+
+    # dexamethasone 3.3.,3.8,4,5 mg/ml, 6.6,8 mg/2ml, 20mg/5ml; 0.5 and 2 are mg or mg/5ml
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 3.3), 'dose_units', 'mg/1ml', None],
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 3.8), 'dose_units', 'mg/1ml', None],
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 4.5), 'dose_units', 'mg/1ml', None],
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 6.6), 'dose_units', 'mg/2ml', None],
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 6.8), 'dose_units', 'mg/2ml', None],
+    ['dexamethasone', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/5ml', None],
+    ['dexamethasone', 'found', None, 'liquid', ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/5ml', None],
+    ['dexamethasone', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['dexamethasone', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['dexamethasone', 'found', None, 'liquid', ('dose_a1_number', '==', 4), 'dose_units', 'mg/1ml', None],
+    ['dexamethasone', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/1ml', None],
+
+    # dextromethorphan 7.33 is mg, 7.5, 10 are mg/5ml, 15 is mg/ml; when there is a 2nd column, use that one
+    ['dextromethorphan', 'found', None, None, ('dose_a1_number', '==', 7.5), 'dose_units', 'mg/5ml', None],
+    ['dextromethorphan', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['dextromethorphan', 'found', None, None, ('dose_a1_number', '==', 15), 'dose_units', 'mg/1ml', None],
+    ['dextromethorphan', 'found', None, None, ('dose_a2_number', 'notnull'), 'dose', None, 'dose_a2_number'],
+
+    # diazepam 1 is mg/5ml, 2.5 is mg/5ml or mg, 2 is mg or mg/5ml, 5 is mg or 5mg/2.5ml, 10 is mg or 10mg/2.5ml; NA:2,5mg
+    ['diazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['diazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/5ml', None],
+    ['diazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['diazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/2.5ml', None],
+    ['diazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/2.5ml', None],
+    ['diazepam', 'lost', '2.5', None, None, 'dose', 2.5, None],
+
+    # dicycloverine 10 is mg or 10/5 mg/ml; NA:10,20mg
+    ['dicycloverine', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['dicycloverine', 'lost', '10', None, None, 'dose', 10, None],
+    ['dicycloverine', 'lost', '20', None, None, 'dose', 20, None],
+
+    # digoxin 0.05 is mg/ml, all else is mg; NA: 125 is 0.125, 250 is 0.250
+    ['digoxin', 'found', None, None, ('dose_a1_number', '==', 0.05), 'dose_units', 'mg/1ml', None],
+    ['digoxin', 'lost', '125', None, None, 'dose', 0.125, None],
+    ['digoxin', 'lost', '250', None, None, 'dose', 0.25, None],
+
+    # diltiazem 60 is mg or mg/5ml; NA:200,300,90,120,180,60
+    ['diltiazem', 'found', None, 'liquid', ('dose_a1_number', '==', 60), 'dose_units', 'mg/5ml', None],
+    ['diltiazem', 'lost', '200', None, None, 'dose', 200, None],
+    ['diltiazem', 'lost', '300', None, None, 'dose', 300, None],
+    ['diltiazem', 'lost', '90', None, None, 'dose', 90, None],
+    ['diltiazem', 'lost', '120', None, None, 'dose', 120, None],
+    ['diltiazem', 'lost', '180', None, None, 'dose', 180, None],
+    ['diltiazem', 'lost', '60', None, None, 'dose', 60, None],
+
+    # dimenhydrinate is always 40; NA:40
+    ['dimenhydrinate', 'found', None, None, None, 'dose', 40, None],
+    ['dimenhydrinate', 'lost', None, None, None, 'dose', 40, None],
+
+    # dipyridamole 50 is mg/5ml, others are mg; NA:100mg
+    ['dipyridamole', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['dipyridamole', 'lost', '100', None, None, 'dose', 100, None],
+
+    # domperidone 1 and 5 is 1mg/ml and 5mg/5ml, else is mg; 500 is 10; NA: 10mg, 30,1,5
+    ['domperidone', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['domperidone', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['domperidone', 'found', None, None, ('dose_a1_number', '==', 500), 'dose', 10, None],
+    ['domperidone', 'lost', '1', None, None, 'dose', 1, None],
+    ['domperidone', 'lost', '1', None, None, 'dose_units', 'mg/1ml', None],
+    ['domperidone', 'lost', '10', None, None, 'dose', 10, None],
+    ['domperidone', 'lost', '10', None, None, 'dose_units', 'mg', None],
+    ['domperidone', 'lost', '30', None, None, 'dose', 30, None],
+    ['domperidone', 'lost', '5', None, None, 'dose', 5, None],
+    ['domperidone', 'lost', '5', None, None, 'dose_units', 'mg/5ml', None],
+
+    # dosulepin delete greater than 80; NA:25,75
+    ['dosulepin', 'found', None, None, ('dose_a1_number', '>', 80), 'dose', np.nan, None],
+    ['dosulepin', 'found', None, None, ('dose_a1_number', '>', 80), 'dose_units', np.nan, None],
+    #['dosulepin', 'found', '25', 'liquid', None, 'dose_units', 'mg/5ml', None], # never applied: the text was searched in the 'lost' rows
+    #['dosulepin', 'found', '75', 'liquid', None, 'dose_units', 'mg/5ml', None], # never applied: the text was searched in the 'lost' rows
+
+    ['dosulepin', 'lost', '25', None, None, 'dose', 25, None],
+    ['dosulepin', 'lost', '75', None, None, 'dose', 75, None],
+
+    # doxepine >75 is 5% cream, all else is mg
+    ['doxepine', 'found', None, None, ('dose_a1_number', '>', 75), 'dose', np.nan, None],
+    ['doxepine', 'found', None, None, ('dose_a1_number', '>', 75), 'dose_units', np.nan, None],
+
+    # escitalopram 20 may be mg or mg/ml
+    ['escitalopram', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/1ml', None],
+
+    # fluoxetine 20 may be mg or mg/5ml; NA:20
+    ['fluoxetine', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/5ml', None],
+    ['fluoxetine', 'lost', '20', None, None, 'dose', 20, None],
+
+    # gentamicin is only mg/ml (20/2ml, 40/1ml, 80/2ml) or cream/ointment; remove values >80
+    ['gentamicin', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/2ml', None],
+    ['gentamicin', 'found', None, None, ('dose_a1_number', '==', 40), 'dose_units', 'mg/1ml', None],
+    ['gentamicin', 'found', None, None, ('dose_a1_number', '==', 80), 'dose_units', 'mg/2ml', None],
+    ['gentamicin', 'found', None, None, ('dose_a1_number', '>', 80), 'dose_units', np.nan, None],
+
+    # glycopyrronium only mg/ml: (0.2/1, 0.6/3, 0.5/5, 1/5, 2/5); when 0.085 choose second column; over 2 is bogus
+    ['glycopyrronium', 'found', None, 'liquid', ('dose_a1_number', '==', 0.2), 'dose_units', 'mg/1ml', None],
+    ['glycopyrronium', 'found', None, None, ('dose_a1_number', '==', 0.6), 'dose_units', 'mg/3ml', None],
+    ['glycopyrronium', 'found', None, None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/5ml', None],
+    ['glycopyrronium', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['glycopyrronium', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['glycopyrronium', 'found', None, None, ('dose_a1_number', '==', 0.085), 'dose', None, 'dose_a2_number'],
+    ['glycopyrronium', 'found', None, None, ('dose_a1_number', '>', 2), 'dose', np.nan, None],
+    ['glycopyrronium', 'found', None, None, ('dose_a1_number', '>', 2), 'dose_units', np.nan, None],
+
+    # guaifenesin only  mg/ml: (7.5/5, 50/5, 66.67/5, 100/5)
+    ['guaifenesin', 'found', None, None, ('dose_a1_number', '==', 7.5), 'dose_units', 'mg/5ml', None],
+    ['guaifenesin', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['guaifenesin', 'found', None, None, ('dose_a1_number', '==', 66.67), 'dose_units', 'mg/5ml', None],
+    ['guaifenesin', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/5ml', None],
+
+    # haloperidol: 0.5mg, 1mg/ml, 1.5mg, 2mg/ml, 5mg or 5mg/ml, 10mg, 20mg, 50mg/ml, 100mg/ml; NA:500 is 0.5,5,20
+    ['haloperidol', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['haloperidol', 'found', None, None, ('dose_a1_number', '==', 2), 'dose_units', 'mg/1ml', None],
+    ['haloperidol', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/1ml', None],
+    ['haloperidol', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['haloperidol', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+    ['haloperidol', 'lost', '500', None, None, 'dose', 0.5, None],
+    ['haloperidol', 'lost', '5', None, None, 'dose', 5, None],
+    ['haloperidol', 'lost', '20', None, None, 'dose', 20, None],
+
+    # hydrocortisone 10mg or 10mg/5ml, 5mg, 2.5mg, 20mg, 25mg/1ml, 100mg/1ml, all else are creams and ointments
+    ['hydrocortisone', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['hydrocortisone', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/1ml', None],
+    ['hydrocortisone', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+
+    # hydroxyzine 10 can be mg or mg/5ml; NA:10,25
+    ['hydroxyzine', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['hydroxyzine', 'lost', '10', None, None, 'dose', 10, None],
+    ['hydroxyzine', 'lost', '25', None, None, 'dose', 25, None],
+
+    # hyoscine butylbromide 10mg or 10mg/5ml, 20mg/1ml; NA:10
+    ['hyoscine butylbromide', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['hyoscine butylbromide', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/1ml', None],
+    ['hyoscine butylbromide', 'lost', '10', None, None, 'dose', 10, None],
+
+    # hyoscine hydrobromide 1 and 1.5 is cream, 0.3mg, 0.4mg/ml, 0.15mg, 0.6mg/ml; NA:300 is 0.3
+    ['hyoscine hydrobromide', 'found', None, 'liquid', ('dose_a1_number', '==', 0.4), 'dose_units', 'mg/1ml', None],
+    ['hyoscine hydrobromide', 'found', None, 'liquid', ('dose_a1_number', '==', 0.6), 'dose_units', 'mg/1ml', None],
+    ['hyoscine hydrobromide', 'lost', '300', None, None, 'dose', 0.3, None],
+
+    # imipramine 25 can be mg or 25mg/5ml, 10 is mg; remove >25; NA:25
+    ['imipramine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['imipramine', 'found', None, None, ('dose_a1_number', '>', 25), 'dose', np.nan, None],
+    ['imipramine', 'found', None, None, ('dose_a1_number', '>', 25), 'dose_units', np.nan, None],
+    ['imipramine', 'lost', '25', None, None, 'dose', 25, None],
+
+    # ipratropium when with salbutamol, always choose smaller column; 0.25mg/ml, 0.5/2ml or 0.5/1ml; 2.5 to 0.5mg/2ml; NA:boehringer is 0.2mg/1ml; if with salbutamol then 0.2mg/1ml
+    ['ipratropium', 'found', 'salbutamol', None, None, 'dose', 0.2, None],
+    ['ipratropium', 'found', 'salbutamol', None, None, 'dose_units', 'mg/1ml', None],
+    ['ipratropium', 'found', None, None, ('dose_a1_number', '==', 0.25), 'dose_units', 'mg/1ml', None],
+    ['ipratropium', 'found', '2ml', None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/2ml', None],
+    ['ipratropium', 'found', '1ml', None, ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/1ml', None],
+    ['ipratropium', 'found', None, 'liquid', ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/1ml', None],
+    ['ipratropium', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose', 0.5, None],
+    ['ipratropium', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/2ml', None],
+    ['ipratropium', 'lost', 'salbutamol', None, None, 'dose', 1, None],
+    ['ipratropium', 'lost', 'salbutamol', None, None, 'dose_units', 'mg/1ml', None],
+
+    # ketamine 50mg/5ml, 100mg/5ml, 200mg/20ml, 500mg/10ml, 1000mg/10ml; NA:1 is 1/10ml
+    ['ketamine', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['ketamine', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/5ml', None],
+    ['ketamine', 'found', None, None, ('dose_a1_number', '==', 200), 'dose_units', 'mg/20ml', None],
+    ['ketamine', 'found', None, None, ('dose_a1_number', '==', 500), 'dose_units', 'mg/10ml', None],
+    ['ketamine', 'found', None, None, ('dose_a1_number', '==', 1000), 'dose_units', 'mg/10ml', None],
+    ['ketamine', 'lost', '1', None, None, 'dose', 1, None],
+    ['ketamine', 'lost', '1', None, None, 'dose_units', 'mg/10ml', None],
+
+    # ketorolac 10 is mg or mg/ml, 30 is mg/ml
+    ['ketorolac', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['ketorolac', 'found', None, None, ('dose_a1_number', '==', 30), 'dose_units', 'mg/1ml', None],
+
+    # ketotifen 0.25mg/ml, 1 mg
+    ['ketotifen', 'found', None, 'liquid', ('dose_a1_number', '==', 0.25), 'dose_units', 'mg/1ml', None],
+
+    # levofloxacin 5 is 5mg/ml, 500mg/100ml or 500mg
+    ['levofloxacin', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/1ml', None],
+    ['levofloxacin', 'found', None, 'liquid', ('dose_a1_number', '==', 500), 'dose_units', 'mg/100ml', None],
+
+    # levomepromazine 25mg/ml or mg; 2.5 is 25mg/ml; NA:25mg
+    ['levomepromazine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/1ml', None],
+    ['levomepromazine', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose', 25, None],
+    ['levomepromazine', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/1ml', None],
+    ['levomepromazine', 'lost', '25', None, None, 'dose', 25, None],
+
+    # lithium 520 is invalid; NA:400,250,200
+    ['lithium', 'found', None, None, ('dose_a1_number', '==', 520), 'dose', np.nan, None],
+    ['lithium', 'found', None, None, ('dose_a1_number', '==', 520), 'dose_units', np.nan, None],
+    ['lithium', 'found', None, 'liquid', None, 'dose', 520, None],
+    ['lithium', 'found', None, 'liquid', None, 'dose_units', 'mg/5ml', None],
+    ['lithium', 'lost', '400', None, None, 'dose', 400, None],
+    ['lithium', 'lost', '250', None, None, 'dose', 250, None],
+    ['lithium', 'lost', '200', None, None, 'dose', 200, None],
+
+    # lofepramine is 70mg or mg/5ml; NA:70
+    ['lofepramine', 'found', None, 'liquid', ('dose_a1_number', '==', 70), 'dose_units', 'mg/5ml', None],
+    ['lofepramine', 'lost', '70', None, None, 'dose', 70, None],
+
+    # loperamide 125 is 2; 0.2 is mg/ml, 1 is mg/5ml; NA:2mg when with simeticone, 2(mg)
+    ['loperamide', 'found', None, None, ('dose_a1_number', '==', 125), 'dose', 2, None],
+    ['loperamide', 'found', None, None, ('dose_a1_number', '==', 0.2), 'dose_units', 'mg/1ml', None],
+    ['loperamide', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['loperamide', 'lost', '2', None, None, 'dose', 2, None],
+    ['loperamide', 'lost', 'simeticone', None, None, 'dose', 2, None],
+
+    # loratadine 5 is 5mg/5ml
+    ['loratadine', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+
+    # lorazepam 4mg/1ml, 0.5/5ml, 1mg/5ml or mg; NA:1,2.5
+    ['lorazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 4), 'dose_units', 'mg/1ml', None],
+    ['lorazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 0.5), 'dose_units', 'mg/5ml', None],
+    ['lorazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['lorazepam', 'lost', '1', None, None, 'dose', 1, None],
+    ['lorazepam', 'lost', '2.5', None, None, 'dose', 2.5, None],
+
+    # metformin mg/ml: 500/5, 100/1; for 1,2,2.5,4,5,12.5,15,50 use 2nd column; NA:500,850; 850 when with pioglitazone
+    ['metformin', 'found', None, 'liquid', ('dose_a1_number', '==', 500), 'dose_units', 'mg/5ml', None],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/5ml', None],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 1), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 2), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 4), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 5), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 12.5), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', None, None, ('dose_a1_number', '==', 50), 'dose', None, 'dose_a2_number'],
+    ['metformin', 'found', 'rosiglitazone', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'vildagliptin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'linagliptin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'alogliptin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'dapagliflozin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'canagliflozin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'empagliflozin', None, None, 'dose', 1000, None],
+    ['metformin', 'found', 'saxagliptin', None, None, 'dose', 1000, None],
+    ['metformin', 'lost', '500', None, None, 'dose', 500, None],
+    ['metformin', 'lost', '850', None, None, 'dose', 850, None],
+    ['metformin', 'lost', 'pioglitazone', None, None, 'dose', 850, None],
+
+    # methylprednisolone 80/2; 40/1; 120/3; 10 is 40/1; delete over 120; NA:if with lidocaine, it's 40/1
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '==', 80), 'dose_units', 'mg/2ml', None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '==', 40), 'dose_units', 'mg/1ml', None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '==', 120), 'dose_units', 'mg/3ml', None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '==', 10), 'dose', 40, None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '>', 120), 'dose', np.nan, None],
+    ['methylprednisolone', 'found', None, None, ('dose_a1_number', '>', 120), 'dose_units', np.nan, None],
+    ['methylprednisolone', 'lost', 'lidocaine', None, None, 'dose', 40, None],
+    ['methylprednisolone', 'lost', 'lidocaine', None, None, 'dose_units', 'mg/1ml', None],
+
+    # metoprolol 5 is mg/5ml; 12.5 is 100; NA:50
+    ['metoprolol', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['metoprolol', 'found', None, None, ('dose_a1_number', '==', 12.5), 'dose', 100, None],
+    ['metoprolol', 'lost', '50', None, None, 'dose', 50, None],
+
+    # midazolam 10/2, 2/2, 5/5, 7.5/1.5, 50/10, 2.5/0.5
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/2ml', None],
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 2), 'dose_units', 'mg/2ml', None],
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 7.5), 'dose_units', 'mg/1.5ml', None],
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/10ml', None],
+    ['midazolam', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/0.5ml', None],
+
+    # mirtazapine 15/1 or mg; else is mg; NA:30
+    ['mirtazapine', 'found', None, 'liquid', ('dose_a1_number', '==', 15), 'dose_units', 'mg/1ml', None],
+    ['mirtazapine', 'lost', '30', None, None, 'dose', 30, None],
+
+    # nefopam delete 20; NA:30 all
+    ['nefopam', 'found', None, None, ('dose_a1_number', '==', 20), 'dose', 30, None],
+    ['nefopam', 'lost', None, None, None, 'dose', 30, None],
+
+    # nitrazepam 2.5 is mg/ml; NA:5
+    ['nitrazepam', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/1ml', None],
+    ['nitrazepam', 'lost', '5', None, None, 'dose', 5, None],
+
+    # olanzapine 2.5 is mg/ml or mg, remove 210
+    ['olanzapine', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/1ml', None],
+    ['olanzapine', 'found', None, None, ('dose_a1_number', '==', 210), 'dose', np.nan, None],
+    ['olanzapine', 'found', None, None, ('dose_a1_number', '==', 210), 'dose_units', np.nan, None],
+
+    # orphenadrine 25 is mg/5ml
+    ['orphenadrine', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+
+    # oxybutynin 2.5 is mg/5 and mg, 5 is mg/5 and mg; 3.9 (transdermal patch); NA:2.5,3,5
+    ['oxybutynin', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/5ml', None],
+    ['oxybutynin', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['oxybutynin', 'lost', '2.5', None, None, 'dose', 2.5, None],
+    ['oxybutynin', 'lost', '3', None, None, 'dose', 3, None],
+    ['oxybutynin', 'lost', '5', None, None, 'dose', 5, None],
+
+    # oxycodone 5 mg/5ml or mg, 10mg/ml or mg, 50mg/ml or mg, 20mg/2ml or mg
+    ['oxycodone', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['oxycodone', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['oxycodone', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['oxycodone', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/2ml', None],
+
+    # paliperidone 75mg/0.75ml, 100mg/ml, 150mg/1.5ml
+    ['paliperidone', 'found', None, 'liquid', ('dose_a1_number', '==', 75), 'dose_units', 'mg/0.75ml', None],
+    ['paliperidone', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+    ['paliperidone', 'found', None, 'liquid', ('dose_a1_number', '==', 150), 'dose_units', 'mg/1.5ml', None],
+
+    # paroxetine 10 is mg/5ml or mg, 20 is mg/10ml or mg; NA:20,30
+    ['paroxetine', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['paroxetine', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/10ml', None],
+    ['paroxetine', 'lost', '20', None, None, 'dose', 20, None],
+    ['paroxetine', 'lost', '30', None, None, 'dose', 30, None],
+
+    # phenobarbital 15 is mg/5ml or mg, 200 is 200/1ml or mg; NA:30,60
+    ['phenobarbital', 'found', None, 'liquid', ('dose_a1_number', '==', 15), 'dose_units', 'mg/5ml', None],
+    ['phenobarbital', 'found', None, 'liquid', ('dose_a1_number', '==', 200), 'dose_units', 'mg/1ml', None],
+    ['phenobarbital', 'lost', '30', None, None, 'dose', 30, None],
+    ['phenobarbital', 'lost', '60', None, None, 'dose', 60, None],
+
+    # phenytoin 30 is mg/5ml, 90 is mg/5ml; NA:100,300
+    ['phenytoin', 'found', None, None, ('dose_a1_number', '==', 30), 'dose_units', 'mg/5ml', None],
+    ['phenytoin', 'found', None, None, ('dose_a1_number', '==', 90), 'dose_units', 'mg/5ml', None],
+    ['phenytoin', 'lost', '100', None, None, 'dose', 100, None],
+    ['phenytoin', 'lost', '300', None, None, 'dose', 100, None],
+
+    # pramipexole use 2nd column if it contains anything
+    ['pramipexole', 'found', None, None, ('dose_a2_number', 'notnull'), 'dose', None, 'dose_a2_number'],
+
+    # prednisolone 5 is mg/5ml or mg, 20 is mg/100ml or mg, 25 is mg/ml or mg; >=30000, 1.9 are ointments; 1 when with cinchocaine; NA:1 when with cinchocaine, tab 5, tab 1, tab 2.5
+    ['prednisolone', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['prednisolone', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/100ml', None],
+    ['prednisolone', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/1ml', None],
+    ['prednisolone', 'found', None, None, ('dose_a1_number', '==', 1.9), 'dose', np.nan, None],
+    ['prednisolone', 'found', None, None, ('dose_a1_number', '==', 1.9), 'dose_units', np.nan, None],
+    ['prednisolone', 'found', None, None, ('dose_a1_number', '>=', 30000), 'dose', np.nan, None],
+    ['prednisolone', 'found', None, None, ('dose_a1_number', '>=', 30000), 'dose_units', np.nan, None],
+    ['prednisolone', 'lost', 'cinchocaine', None, None, 'dose', 1, None],
+    ['prednisolone', 'lost', '5', 'tablet', None, 'dose', 5, None],
+    ['prednisolone', 'lost', '1', 'tablet', None, 'dose', 1, None],
+    ['prednisolone', 'lost', '2.5', 'tablet', None, 'dose', 2.5, None],
+
+    # prochlorperazine 5 is mg/5ml and mg, 12.5 is mg/ml and mg, 25 is mg/2ml and mg; NA:3,5,12.5mg/ml,25mg/2ml
+    ['prochlorperazine', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['prochlorperazine', 'found', None, 'liquid', ('dose_a1_number', '==', 12.5), 'dose_units', 'mg/1ml', None],
+    ['prochlorperazine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/2ml', None],
+    ['prochlorperazine', 'lost', '3', None, None, 'dose', 3, None],
+    ['prochlorperazine', 'lost', '5', None, None, 'dose', 5, None],
+    ['prochlorperazine', 'lost', '12.5', None, None, 'dose', 12.5, None],
+    ['prochlorperazine', 'lost', '12.5', None, None, 'dose_units', 'mg/1ml', None],
+    ['prochlorperazine', 'lost', '25', None, None, 'dose', 25, None],
+    ['prochlorperazine', 'lost', '25', None, None, 'dose_units', 'mg/2ml', None],
+
+    # procyclidine 5 is mg/5ml, 2 is 2.5/5ml; NA:2.5,5
+    ['procyclidine', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['procyclidine', 'found', None, None, ('dose_a1_number', '==', 2), 'dose', 2.5, None],
+    ['procyclidine', 'found', None, None, ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['procyclidine', 'lost', '2.5', None, None, 'dose', 2.5, None],
+    ['procyclidine', 'lost', '5', None, None, 'dose', 5, None],
+
+    # promazine 25 is mg/5ml, 50 is mg/5ml; NA:25,50
+    ['promazine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['promazine', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['promazine', 'lost', '25', None, None, 'dose', 25, None],
+    ['promazine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # promethazine 5 is mg/5ml; NA:25
+    ['promethazine', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['promethazine', 'lost', '25', None, None, 'dose', 25, None],
+
+    # propantheline 15 is mg/5ml or mg; NA:15
+    ['propantheline', 'found', None, 'liquid', ('dose_a1_number', '==', 15), 'dose_units', 'mg/5ml', None],
+    ['propantheline', 'lost', '15', None, None, 'dose', 15, None],
+
+    # pyrilamine all are cream
+    ['pyrilamine', 'found', None, None, None, 'dose', np.nan, None],
+    ['pyrilamine', 'found', None, None, None, 'dose_units', np.nan, None],
+
+    # quetiapine 25 is mg or mg/5ml; remove the ones with several columns
+    ['quetiapine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['quetiapine', 'found', None, None, ('dose_a2_number', 'notnull'), 'dose', np.nan, None],
+    ['quetiapine', 'found', None, None, ('dose_a2_number', 'notnull'), 'dose_units', np.nan, None],
+
+    # ranitidine 75 is mg or mg/5ml, 150 is mg or mg/10ml; NA:150,300,75
+    ['ranitidine', 'found', None, 'liquid', ('dose_a1_number', '==', 75), 'dose_units', 'mg/5ml', None],
+    ['ranitidine', 'found', None, 'liquid', ('dose_a1_number', '==', 150), 'dose_units', 'mg/10ml', None],
+    ['ranitidine', 'lost', '150', None, None, 'dose', 150, None],
+    ['ranitidine', 'lost', '300', None, None, 'dose', 300, None],
+    ['ranitidine', 'lost', '75', None, None, 'dose', 75, None],
+
+    # sertraline 100 is mg or mg/5ml, 50 is mg or mg/5ml; NA:50,100
+    ['sertraline', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/5ml', None],
+    ['sertraline', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['sertraline', 'lost', '50', None, None, 'dose', 50, None],
+    ['sertraline', 'lost', '100', None, None, 'dose', 100, None],
+
+    # sumatriptan 6 is mg/0.5ml; 10 is either nasal or mg; 12 is mg/ml; 20 is nasal; NA:12mg/ml, 50,100
+    ['sumatriptan', 'found', None, 'liquid', ('dose_a1_number', '==', 6), 'dose_units', 'mg/0.5ml', None],
+    ['sumatriptan', 'found', None, 'liquid', ('dose_a1_number', '==', 12), 'dose_units', 'mg/1ml', None],
+    ['sumatriptan', 'lost', '12.5', None, None, 'dose', 12.5, None],
+    ['sumatriptan', 'lost', '12.5', None, None, 'dose_units', 'mg/1ml', None],
+    ['sumatriptan', 'lost', '50', None, None, 'dose', 50, None],
+    ['sumatriptan', 'lost', '100', None, None, 'dose', 100, None],
+
+    # temazepam 10 is mg or mg/5ml; NA:10mg,20mg
+    ['temazepam', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['temazepam', 'lost', '10', None, None, 'dose', 10, None],
+    ['temazepam', 'lost', '20', None, None, 'dose', 20, None],
+
+    # theophylline 60 is mg/5ml or mg; NA:400,300,200,250
+    ['theophylline', 'found', None, 'liquid', ('dose_a1_number', '==', 60), 'dose_units', 'mg/5ml', None],
+    ['theophylline', 'lost', '400', None, None, 'dose', 400, None],
+    ['theophylline', 'lost', '300', None, None, 'dose', 300, None],
+    ['theophylline', 'lost', '200', None, None, 'dose', 200, None],
+    ['theophylline', 'lost', '250', None, None, 'dose', 250, None],
+
+    # thioridazine 25 is mg/5ml or mg; NA:10,25,50
+    ['thioridazine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['thioridazine', 'lost', '10', None, None, 'dose', 10, None],
+    ['thioridazine', 'lost', '25', None, None, 'dose', 25, None],
+    ['thioridazine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # tizanidine 2 is mg or mg/5ml
+    ['tizanidine', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+
+    # tobramycin 80 is 80/2ml, 300 is mg/2ml
+    ['tobramycin', 'found', None, None, ('dose_a1_number', '==', 80), 'dose_units', 'mg/2ml', None],
+    ['tobramycin', 'found', None, None, ('dose_a1_number', '==', 300), 'dose_units', 'mg/2ml', None],
+
+    # tolterodine 2 is mg or mg/5ml; NA:1mg,2mg
+    ['tolterodine', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['tolterodine', 'lost', '1', None, None, 'dose', 1, None],
+    ['tolterodine', 'lost', '2', None, None, 'dose', 2, None],
+
+    # tramadol 100 is mg or mg/2ml; 325 is 37.5; NA:50,150,100 all mg
+    ['tramadol', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/2ml', None],
+    ['tramadol', 'found', None, None, ('dose_a1_number', '==', 325), 'dose', 37.5, None],
+    ['tramadol', 'lost', '50', None, None, 'dose', 50, None],
+    ['tramadol', 'lost', '150', None, None, 'dose', 150, None],
+    ['tramadol', 'lost', '100', None, None, 'dose', 100, None],
+
+    # trandolapril 180 is 2; NA:0.5,1,2
+    ['trandolapril', 'found', None, None, ('dose_a1_number', '==', 180), 'dose', 2, None],
+    ['trandolapril', 'lost', '0.5', None, None, 'dose', 0.5, None],
+    ['trandolapril', 'lost', '1', None, None, 'dose', 1, None],
+    ['trandolapril', 'lost', '2', None, None, 'dose', 2, None],
+
+    # trazodone 50 is mg or mg/5ml; NA:50,100,150
+    ['trazodone', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['trazodone', 'lost', '50', None, None, 'dose', 50, None],
+    ['trazodone', 'lost', '100', None, None, 'dose', 100, None],
+    ['trazodone', 'lost', '150', None, None, 'dose', 150, None],
+
+    # triamcinolone 5, 10, 20, 40 are mg/ml, 50 is mg/5ml, 80 is mg/2ml; 5000 or more is dermal paste
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/1ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/1ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 40), 'dose_units', 'mg/1ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '==', 80), 'dose_units', 'mg/2ml', None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '>=', 5000), 'dose', np.nan, None],
+    ['triamcinolone', 'found', None, None, ('dose_a1_number', '>=', 5000), 'dose_units', np.nan, None],
+
+    # trifluoperazine 1, 5 are mg or mg/5ml; NA:1,5,10
+    ['trifluoperazine', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['trifluoperazine', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['trifluoperazine', 'lost', '1', None, None, 'dose', 1, None],
+    ['trifluoperazine', 'lost', '5', None, None, 'dose', 5, None],
+    ['trifluoperazine', 'lost', '10', None, None, 'dose', 10, None],
+
+    # trihexyphenidyl 5, 2 are mg/5ml or mg
+    ['trihexyphenidyl', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['trihexyphenidyl', 'found', None, 'liquid', ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['trihexyphenidyl', 'found', '5', None, None, 'dose', 5, None],
+
+    # triprolidine 10 is OK, for the rest take 2nd column
+    ['triprolidine', 'found', None, None, ('dose_a1_number', '!=', 10), 'dose', None, 'dose_a2_number'],
+
+    # valproate 200 is mg or mg/5ml; NA:100,200,300,500 all mg
+    ['valproate', 'found', None, 'liquid', ('dose_a1_number', '==', 200), 'dose_units', 'mg/5ml', None],
+    ['valproate', 'lost', '100', None, None, 'dose', 100, None],
+    ['valproate', 'lost', '200', None, None, 'dose', 200, None],
+    ['valproate', 'lost', '300', None, None, 'dose', 300, None],
+    ['valproate', 'lost', '500', None, None, 'dose', 500, None],
+
+    # venlafaxine 37.5 and 75 is mg or mg/5ml; NA:37.5,75 all mg
+    ['venlafaxine', 'found', None, 'liquid', ('dose_a1_number', '==', 37.5), 'dose_units', 'mg/5ml', None],
+    ['venlafaxine', 'found', None, 'liquid', ('dose_a1_number', '==', 75), 'dose_units', 'mg/5ml', None],
+    ['venlafaxine', 'lost', '37.5', None, None, 'dose', 37.5, None],
+    ['venlafaxine', 'lost', '75', None, None, 'dose', 75, None],
+
+    # warfarin 1 is mg or mg/ml, 3 is mg or mg/5ml, 5 is mg or mg/5ml; NA:1,3,5
+    ['warfarin', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['warfarin', 'found', None, 'liquid', ('dose_a1_number', '==', 3), 'dose_units', 'mg/5ml', None],
+    ['warfarin', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['warfarin', 'lost', '1', None, None, 'dose', 1, None],
+    ['warfarin', 'lost', '3', None, None, 'dose', 3, None],
+    ['warfarin', 'lost', '5', None, None, 'dose', 5, None],
+
+    # zolmitriptan 5 is mg or mg/0.1ml; NA:2.5
+    ['zolmitriptan', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/0.1ml', None],
+    ['zolmitriptan', 'lost', '2.5', None, None, 'dose', 1, None],
+
+    # zuclopenthixol 200, 500, 50 are mg/ml;
+    ['zuclopenthixol', 'found', None, None, ('dose_a1_number', '==', 200), 'dose_units', 'mg/1ml', None],
+    ['zuclopenthixol', 'found', None, None, ('dose_a1_number', '==', 500), 'dose_units', 'mg/1ml', None],
+    ['zuclopenthixol', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+
+    # clomipramine 25 is mg or mg/5ml; NA's: 25, 50 both mg
+    ['clomipramine', 'found', None, 'liquid', ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['clomipramine', 'lost', '25', None, None, 'dose', 25, None],
+    ['clomipramine', 'lost', '50', None, None, 'dose', 50, None],
+
+    # metoclopramide 5 is mg or mg/5ml, 10 is mg or mg/2ml, 100 is mg/20ml, 500 and 900 2nd column; 5 with paracetamol, 10 when with aspirin; NA's: when with paracetamol 5; when with aspirin 10; tab AND 10 is 10; tab AND 5 is 5; inj AND 10 is 10/2
+    ['metoclopramide', 'found', None, 'liquid', ('dose_a1_number', '==', 5), 'dose_units', 'mg/5ml', None],
+    ['metoclopramide', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/2ml', None],
+    ['metoclopramide', 'found', None, 'liquid', ('dose_a1_number', '==', 100), 'dose_units', 'mg/20ml', None],
+    ['metoclopramide', 'found', None, 'liquid', ('dose_a1_number', '==', 500), 'dose', None, 'dose_a2_number'],
+    ['metoclopramide', 'found', None, 'liquid', ('dose_a1_number', '==', 900), 'dose', None, 'dose_a2_number'],
+    ['metoclopramide', 'found', 'paracetamol', None, None, 'dose', 5, None],
+    ['metoclopramide', 'found', 'aspirin', None, None, 'dose', 10, None],
+    ['metoclopramide', 'lost', 'paracetamol', None, None, 'dose', 5, None],
+    ['metoclopramide', 'lost', 'aspirin', None, None, 'dose', 10, None],
+    ['metoclopramide', 'lost', '10', 'tablet', None, 'dose', 10, None],
+    ['metoclopramide', 'lost', '5', 'tablet', None, 'dose', 5, None],
+    ['metoclopramide', 'lost', '10', 'injectable', None, 'dose', 10, None],
+    ['metoclopramide', 'lost', '10', 'injectable', None, 'dose_units', 'mg/2ml', None],
+
+    # captopril; NA: 12.5,25,50
+    ['captopril', 'lost', '12.5', None, None, 'dose', 12.5, None],
+    ['captopril', 'lost', '25', None, None, 'dose', 25, None],
+    ['captopril', 'lost', '50', None, None, 'dose', 50, None],
+
+    # cyclizine 10 is actually 30, 15 is mg/ml, 50 is either mg or 50/1
+    ['cyclizine', 'found', None, None, ('dose_a1_number', '==', 1), 'dose', 30, None],
+    ['cyclizine', 'found', None, None, ('dose_a1_number', '==', 15), 'dose_units', 'mg/1ml', None],
+    ['cyclizine', 'found', '1ml', None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['cyclizine', 'found', '5ml', None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+
+    # fluticasone/salmeterol always in combo 0.05/0.025, 0.125/0.025, 0.25/0.025, 0.1/0.05, 0.25/0.05, 0.5/0.05; NA's: 1st number always refers to fluticasone
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a1_number', '==', 0.125), 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a2_number', '==', 0.125), 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a1_number', '==', 0.1), 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a2_number', '==', 0.1), 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a1_number', '==', 0.5), 'dose', 0.55, None],
+    ['fluticasone/salmeterol', 'found', None, None, ('dose_a2_number', '==', 0.5), 'dose', 0.55, None],
+    ['fluticasone/salmeterol', 'found', None, None, [('dose_a2_number', '==', 0.05), ('dose_a1_number', '==', 0.025)], 'dose', 0.075, None],
+    ['fluticasone/salmeterol', 'found', None, None, [('dose_a2_number', '==', 0.25), ('dose_a1_number', '==', 0.025)], 'dose', 0.275, None],
+    ['fluticasone/salmeterol', 'found', None, None, [('dose_a1_number', '==', 0.25), ('dose_a2_number', '==', 0.05)], 'dose', 0.3, None],
+    ['fluticasone/salmeterol', 'found', None, None, [('dose_a2_number', '==', 0.25), ('dose_a1_number', '==', 0.05)], 'dose', 0.3, None],
+    ['fluticasone/salmeterol', 'found', ['50', 'evo'], None, None, 'dose', 0.075, None],
+    ['fluticasone/salmeterol', 'found', ['250', 'evo'], None, None, 'dose', 0.275, None],
+    ['fluticasone/salmeterol', 'found', ['125', 'evo'], None, None, 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', ['100', 'accu'], None, None, 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'found', ['250', 'accu'], None, None, 'dose', 0.275, None],
+    ['fluticasone/salmeterol', 'found', ['500', 'accu'], None, None, 'dose', 0.55, None],
+    ['fluticasone/salmeterol', 'lost', '50', None, None, 'dose', 0.075, None],
+    ['fluticasone/salmeterol', 'lost', '125', None, None, 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'lost', '100', None, None, 'dose', 0.15, None],
+    ['fluticasone/salmeterol', 'lost', '500', None, None, 'dose', 0.55, None],
+    ['fluticasone/salmeterol', 'lost', ['250', 'evo'], None, None, 'dose', 0.275, None],
+    ['fluticasone/salmeterol', 'lost', ['250', 'accu'], None, None, 'dose', 0.3, None],
+
+    # methadone 60mg/60ml, 50mg/5ml, 20mg/2ml, 10mg/ml, 1mg/ml; 5 is mg
+    ['methadone', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['methadone', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/2ml', None],
+    ['methadone', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['methadone', 'found', None, None, ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+
+    # methotrexate 2.5 is mg and mg/1ml, 10 is mg and mg/0.2ml, mg/0.4; 25/0.5, 25/1; 25/1.25; 15/0.3l; 20/0.4; 50/2; 7.5/.75; 12.5/0.25; 12.5/0.5; 17.5/0.35; 5/2; 22.5/0.45; 30/0.6; 50/2; 100/1; 1000/40; when 2nd is 10, it is 10/1; NA:2.5
+    ['methotrexate', 'found', None, 'liquid', ('dose_a1_number', '==', 2.5), 'dose_units', 'mg/1ml', None],
+    ['methotrexate', 'found', '0.2', 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/0.2ml', None],
+    ['methotrexate', 'found', '0.4', 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/0.4ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/1ml', None],
+    ['methotrexate', 'found', '0.5', None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/0.5ml', None],
+    ['methotrexate', 'found', '1.25', None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/1.25ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 15), 'dose_units', 'mg/0.3ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 20), 'dose_units', 'mg/0.4ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/2ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 7.5), 'dose_units', 'mg/0.75ml', None],
+    ['methotrexate', 'found', '0.25', None, ('dose_a1_number', '==', 12.5), 'dose_units', 'mg/0.25ml', None],
+    ['methotrexate', 'found', '0.5', None, ('dose_a1_number', '==', 12.5), 'dose_units', 'mg/0.5ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 17.5), 'dose_units', 'mg/0.35ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/2ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 22.5), 'dose_units', 'mg/0.45ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 30), 'dose_units', 'mg/0.6ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/2ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a1_number', '==', 1000), 'dose_units', 'mg/40ml', None],
+    ['methotrexate', 'found', None, None, ('dose_a2_number', '==', 10), 'dose', 10, None],
+    ['methotrexate', 'found', None, None, ('dose_a2_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['methotrexate', 'lost', '2.5', None, None, 'dose', 2.5, None],
+
+    # codeine 15 is mg or mg/ml, 25 is mg/5ml, 32.5 is 16mg/5ml, 3 is mg/5ml, 6.75 is mg/5ml; when with ibuprofen, paracetamol, or aspirin, take column that is smaller
+    ['codeine', 'found', None, 'liquid', ('dose_a1_number', '==', 15), 'dose_units', 'mg/1ml', None],
+    ['codeine', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/5ml', None],
+    ['codeine', 'found', None, None, ('dose_a1_number', '==', 32.5), 'dose', 16, None],
+    ['codeine', 'found', None, None, ('dose_a1_number', '==', 32.5), 'dose_units', 'mg/5ml', None],
+    ['codeine', 'found', None, None, ('dose_a1_number', '==', 3), 'dose_units', 'mg/5ml', None],
+    ['codeine', 'found', None, None, ('dose_a1_number', '==', 6.75), 'dose_units', 'mg/5ml', None],
+    ['codeine', 'found', 'ibuprofen', 'liquid', None, 'dose_units', 'mg/1ml', None],
+    ['codeine', 'found', 'ibuprofen', 'liquid', None, 'dose', None, ['dose_a1_number', 'dose_a2_number']],
+
+    # pethidine 10 is mg/ml, 50 is mg/ml or mg, 100 is mg/2ml, or 100/10ml; NA:50,100
+    ['pethidine', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['pethidine', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['pethidine', 'found', '2ml', None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/2ml', None],
+    ['pethidine', 'found', '10ml', None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/10ml', None],
+    ['pethidine', 'lost', '50', None, None, 'dose', 50, None],
+    ['pethidine', 'lost', '100', None, None, 'dose', 100, None],
+
+    # rotigotine several columns are multiple different doses, take average (2+4+6+8)/4 = 5
+    ['rotigotine', 'found', None, None, ('dose_a2_number', 'notnull'), 'dose', 5, None],
+
+    # risperidone 1 is mg or mg/ml; >6 is powder for injection; NA:3,6
+    ['risperidone', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['risperidone', 'lost', '3', None, None, 'dose', 3, None],
+    ['risperidone', 'lost', '6', None, None, 'dose', 6, None],
+
+    # levodopa it occurs with benserazide as levo/bense 50/12.5, 100/25; NA:see combo (x/x) occurrences with benserazide
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 50), 'dose', 50, None],
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 12.5), 'dose', 50, None],
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 25), 'dose', 100, None],
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 100), 'dose', 100, None],
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 62.5), 'dose', 50, None],
+    ['levodopa', 'found', None, None, ('dose_a1_number', '==', 125), 'dose', 100, None],
+
+    # diphenoxylate always always 2.5
+    ['diphenoxylate', 'found', None, None, None, 'dose', 2.5, None],
+
+    # diphenhydramine 7, 10, 12.5 are mg/5ml; 25 and 50 are ok, 2nd row and >50 are bogus
+    ['diphenhydramine', 'found', None, None, ('dose_a1_number', '==', 7), 'dose_units', 'mg/5ml', None],
+    ['diphenhydramine', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/5ml', None],
+    ['diphenhydramine', 'found', None, None, ('dose_a1_number', '==', 12.5), 'dose_units', 'mg/5ml', None],
+    ['diphenhydramine', 'found', None, None, ('dose_a1_number', '>', 50), 'dose', np.nan, None],
+    ['diphenhydramine', 'found', None, None, ('dose_a1_number', '>', 50), 'dose_units', np.nan, None],
+
+    # ephedrine <7 is bogus, most are nasal drops
+    ['ephedrine', 'found', None, None, ('dose_a1_number', '<', 7), 'dose', np.nan, None],
+    ['ephedrine', 'found', None, None, ('dose_a1_number', '<', 7), 'dose_units', np.nan, None],
+
+    # pseudoephedrine 300 is 45; 200 is 30; 30 is 30/5ml or 30 mg; 100 is 30/5mg/ml; 200 is 30; 500 is 30
+    ['pseudoephedrine', 'found', None, None, ('dose_a1_number', '==', 300), 'dose', 45, None],
+    ['pseudoephedrine', 'found', None, None, ('dose_a1_number', '==', 200), 'dose', 30, None],
+    ['pseudoephedrine', 'found', None, None, ('dose', '==', 100), 'dose_units', 'mg/5ml', None],
+    ['pseudoephedrine', 'found', None, None, ('dose', '==', 100), 'dose', 30, None],
+    ['pseudoephedrine', 'found', None, None, ('dose', '==', 200), 'dose', 30, None],
+    ['pseudoephedrine', 'found', None, None, ('dose', '==', 500), 'dose', 30, None],
+    ['pseudoephedrine', 'found', None, 'liquid', ('dose', '==', 30), 'dose_units', 'mg/5ml', None],
+
+    # mequitazine
+    ['mequitazine', 'found', None, None, ('dose_a1_number', '==', 300), 'dose', 45, None],
+
+    # morphine 1/1, 1/5, 8.4/1, 10/1 or mg, 15/1 or mg, 20/1 or mg, 30/1 or mg, 60/2 or mg
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', '5', 'liquid', ('dose_a1_number', '==', 1), 'dose_units', 'mg/5ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 8.4), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 15), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 30), 'dose_units', 'mg/1ml', None],
+    ['morphine', 'found', None, 'liquid', ('dose_a1_number', '==', 60), 'dose_units', 'mg/2ml', None],
+
+    # lansoprazole 500 is 30; 5 is 5mg/ml; 30 is mg or 30mg/5ml
+    ['lansoprazole', 'found', None, None, ('dose_a1_number', '==', 500), 'dose', 30, None],
+    ['lansoprazole', 'found', None, None, ('dose_a1_number', '==', 5), 'dose_units', 'mg/1ml', None],
+    ['lansoprazole', 'found', None, 'liquid', ('dose_a1_number', '==', 30), 'dose_units', 'mg/5ml', None],
+
+    # nifedipine 20 is mg or mg/ml, 50 is 20
+    ['nifedipine', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/1ml', None],
+    ['nifedipine', 'found', None, None, ('dose_a1_number', '==', 50), 'dose', 20, None],
+
+    # fluphenazine 12.5/0.5, 25/1, 50/0.5, 100/1, 1 is mg; 10 is 0.5
+    ['fluphenazine', 'found', None, None, ('dose_a1_number', '==', 12.5), 'dose_units', 'mg/0.5ml', None],
+    ['fluphenazine', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 'mg/1ml', None],
+    ['fluphenazine', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/0.5ml', None],
+    ['fluphenazine', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/1ml', None],
+    ['fluphenazine', 'found', None, None, ('dose_a1_number', '==', 10), 'dose', 0.5, None],
+
+    # perphenazine 10 and 25 are actually 2mg
+    ['perphenazine', 'found', None, None, ('dose_a1_number', '==', 10), 'dose', 2, None],
+    ['perphenazine', 'found', None, None, ('dose_a1_number', '==', 25), 'dose_units', 2, None],
+
+    # furosemide mg/ml can be 20mg/2ml, 40mg/5ml, 50mg/5ml, 80mg/8ml; 2.5 is 20, 5 is 40, 10 is 80, 50 is 2nd
+    ['furosemide', 'found', None, 'liquid', ('dose_a1_number', '==', 20), 'dose_units', 'mg/2ml', None],
+    ['furosemide', 'found', None, 'liquid', ('dose_a1_number', '==', 40), 'dose_units', 'mg/5ml', None],
+    ['furosemide', 'found', None, 'liquid', ('dose_a1_number', '==', 50), 'dose_units', 'mg/5ml', None],
+    ['furosemide', 'found', None, 'liquid', ('dose_a1_number', '==', 80), 'dose_units', 'mg/8ml', None],
+    ['furosemide', 'found', None, None, ('dose_a1_number', '==', 2.5), 'dose', 20, None],
+    ['furosemide', 'found', None, None, ('dose_a1_number', '==', 5), 'dose', 40, None],
+    ['furosemide', 'found', None, None, ('dose_a1_number', '==', 10), 'dose', 80, None],
+    ['furosemide', 'found', None, None, ('dose_a1_number', '==', 50), 'dose', None, 'dose_a2_number'],
+
+    # chlorphenamine 2/5, 10/1 are mg/ml
+    ['chlorphenamine', 'found', None, None, ('dose_a1_number', '==', 2), 'dose_units', 'mg/5ml', None],
+    ['chlorphenamine', 'found', None, None, ('dose_a1_number', '==', 10), 'dose_units', 'mg/1ml', None],
+
+    # pipotiazine: 50 is mg/1ml, 100 is mg/2ml
+    ['pipotiazine', 'found', None, None, ('dose_a1_number', '==', 50), 'dose_units', 'mg/1ml', None],
+    ['pipotiazine', 'found', None, None, ('dose_a1_number', '==', 100), 'dose_units', 'mg/2ml', None],
+
+    # amiodarone: NA: contains 200, 200
+    ['amiodarone', 'lost', '200', None, None, 'dose', 200, None],
+], columns=RULE_COLUMNS)
+
+# apply the rules to the rows found and lost in section A (the column 'state'; the rows are grouped by drug once, and the rules of a drug only
+# look at its rows); returns how many rows each rule changed and how long it took
+def correct_doses(meds):
+    found = (meds['state'] == 'found').to_numpy()
+    return pd.concat([apply_rules(meds, DOSE_RULES[DOSE_RULES['frame'] == 'found'], found),
+                      apply_rules(meds, DOSE_RULES[DOSE_RULES['frame'] == 'lost'], ~found)])
+
+
+
+
+## B2. manual correction
+
+# correct the numbers/volumes ('number', the only column changed) of the rows found, missing and unfound in section B1 (the column 'state')
+def correct_quantities(meds):
+    # the code below selects the rows of a partition with these masks
+    found = meds['state'] == 'found'
+    missing = meds['state'] == 'missing'
+    unfound = meds['state'] == 'unfound'
+
+    # for the missing values, there is some overlap between them, so these can be partially automated
+    # others will be supplemented manually below, along with the manual changes for non-missing rows
+
+    # a) choose the first number
+    drugs_1 = ['ampicillin','atropine','bisacodyl','brompheniramine','cefalexin','clemastine','clindamycin','dexamethasone', \
+               'dextromethorphan','dimenhydrinate','diphenoxylate','entacapone','ephedrine','glycopyrronium','guaifenesin','ketamine' \
+                   'ketotifen','methadone','methylprednisolone','midazolam','morphine','perphenazine','thioridazine','triamcinolone', \
+                       'triprolidine']
+    for drug in drugs_1:
+        meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+
+    # b) multiply first number and second number
+    drugs_1_2_a = ['aminophylline','azathioprine','celecoxib','chlortalidone','donepezil','doxepine','duloxetine','escitalopram', \
+                   'etoricoxib','famotidine','fentanyl','fesoterodine','fexofenadine','fluvoxamine','furosemide','hydralazine', \
+                       'levocetirizine','metoprolol','naratriptan','nefopam','nizatidine','oxazepam','oxcarbazepine','pethidine', \
+                           'propantheline','propiverine','reboxetine','rotigotine','selegiline','solifenacin','topiramate', \
+                               'trandolapril','tranylcypromine','trospium','zolmitriptan']
+    for drug in drugs_1_2_a:
+        meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+
+    # c) multiply first and second numbers only if '*' present in quantity; otherwise choose first number
+    drugs_1_2_b = ['amitriptyline','atenolol','baclofen','carbamazepine','carbidopa','chlorphenamine','chlorpromazine','ciclosporin','clomipramine', \
+                   'codeine','darifenacin','desloratadine','diazepam','dicycloverine','diltiazem','diphenhydramine','dipyridamole', \
+                       'domperidone','gentamicin','hyoscine butylbromide','imipramine','isosorbide','levodopa','lithium','loperamide', \
+                           'loratadine','lorazepam','metformin','methocarbamol','methotrexate','metoclopramide','mirtazapine', \
+                               'nifedipine','nitrazepam','nortriptyline','orphenadrine','phenobarbital','phenytoin','pramipexole', \
+                                   'procyclidine','promazine','promethazine','ranitidine','risperidone','temazepam','tiotropium', \
+                                       'tramadol','trazodone','triamterene','trifluoperazine','trihexyphenidyl','valproate','venlafaxine',
+                                       'fluticasone/salmeterol']
+    for drug in drugs_1_2_b:
+        meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+        meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+
+
+
+
+
+
+    # amiodarone: when 3rd, 56; NA: number_a1 (unless 2*28, then 56); NA: if 2nd==200, then 28; otherwise 1st*2nd
+    drug = 'amiodarone'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('2*28', na=False)), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a2'] == 200), 'number'] = 28
+
+    # aclidinium bromide
+    # ampicillin # 25 and 500 are 28
+    drug = 'ampicillin'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 25), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 500), 'number'] = 28
+
+    # atenolol 565 is 56, 784 is 28; when 3 exists, 1st*2nd
+    drug = 'atenolol'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 565), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 784), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # alprazolam 
+    # aminophylline when 3, 1*2
+    drug = 'aminophylline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # amoxapine
+    # asenapine
+    # azathioprine when 3, 1*2
+    drug = 'azathioprine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # bromocriptine
+    # bupropion >400 is 60
+    drug = 'bupropion'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] > 400), 'number'] = 60
+
+    # carbamazepine if >=4000, then 1st; if 3136, then 112; 2403 remove; 750 is 250; when 4th exists, it's 100
+    drug = 'carbamazepine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3136), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2403), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 750), 'number'] = 250
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number'] = 100
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number'] > 4000), 'number']).copy()
+
+    # carisoprodol
+    # celecoxib 7200 is 120; when 3, 1*2
+    drug = 'celecoxib'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 7200), 'number'] = 120
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # chlordiazepoxide
+    # clorazepate
+    # clozapine
+    # colchicine when 3, is 60; NA: 60
+    drug = 'colchicine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = 60
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 60
+
+    # cortisone
+    # cycloserine
+    # cyproheptadine
+    # darifenacin when 3, 1*2
+    drug = 'darifenacin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # desipramine
+    # digitoxin
+    # disopyramide 1 is bogus
+    drug = 'disopyramide'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = np.nan
+
+    # donepezil when 3, 1*2
+    drug = 'donepezil'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # duloxetine when 3, 1*2
+    drug = 'duloxetine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # ergotamine 10000 is 100; NA: if 'X', then 100; otherwise 30
+    drug = 'ergotamine'
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 30
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 10000), 'number'] = 100
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number'] = 100
+
+    # etoricoxib when3, 1*2
+    drug = 'etoricoxib'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # famotidine when 3, 1*2
+    drug = 'famotidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # fentanyl when 3, 1*2
+    drug = 'fentanyl'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # fesoterodine when 3, 1*2
+    drug = 'fesoterodine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # fexofenadine if contains month, multiply number by 30; if >=900, divide by 30
+    drug = 'fexofenadine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('month')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('month')), 'number_a1']).copy() * 30
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number_a1']).copy() / 30
+
+    # flavoxate when 3, 1*2; flavoxate: NA: 180
+    drug = 'flavoxate'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 180
+
+    # flunitrazepame
+    # flurazepam
+
+    # fluvoxamine when '/' in quantity, use a1
+    drug = 'fluvoxamine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('/', regex=False)), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('/', regex=False)), 'number_a1']).copy()
+
+    # hydralazine when 3, 1*2
+    drug = 'hydralazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # isosorbide 3136 is 56; when 3, 1*2
+    drug = 'isosorbide'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3136), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # levocetirizine >=900 divide by 30
+    drug = 'levocetirizine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number_a1']).copy() / 30
+
+    # loxapine
+    # lumiracoxib
+    # maprotiline
+    # meclizine
+    # methocarbamol 2016 is bogus, 14400 is 120
+    drug = 'methocarbamol'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2016), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 14400), 'number'] = 120
+
+    # naratriptan 1 is 6 when 3, 1*2
+    drug = 'naratriptan'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 6
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # nefazodone 1 is 7; when 3, is 56; NA: 56
+    drug = 'nefazodone'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 7
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 56
+
+    # nizatidine when 3, 1*2
+    drug = 'nizatidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # nortriptyline
+    # oxazepam when 3, 1*2
+    drug = 'oxazepam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # oxcarbazepine 3, 1*2
+    drug = 'oxcarbazepine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # oxitropium if >=100, divide by 100; NA: if '200', 200
+    drug = 'oxitropium'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 100), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 100), 'number_a1']) / 7
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'] == 200), 'number'] = 200
+
+    # pericyazine
+    # phenelzine
+    # phenindamine
+    # pheniramine
+    # pimozide
+    # prednisone
+    # propiverine if 3, 1*2
+    drug = 'propiverine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # protriptyline
+    # quinidine
+    # reboxetine if 3, 1*2
+    drug = 'reboxetine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # selegiline if 3, 1*2
+    drug = 'selegiline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # solifenacin if 3, 1*2
+    drug = 'solifenacin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # tiagabine
+    # tiotropium >=900, divide by 30; 3: if quantity has '*', then 1*2 (otherwise 1st column)
+    drug = 'tiotropium'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] >= 900), 'number_a1']).copy() / 30
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # topiramate if 3, 1*2
+    drug = 'topiramate'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # tranylcypromine if 3, 1*2
+    drug = 'tranylcypromine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # triamterene 3: if quantity has '*', then 1*2 (otherwise 1st column)
+    drug = 'triamterene'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # triazolam
+    # trimipramine; NA: if '*', 1st*2nd; otherwise 28
+    drug = 'trimipramine'
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 28
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # trospium if 3, 1*2
+    drug = 'trospium'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # vancomycin
+    # alimemazine if 3, 1*2; NA: if 'ml', then 3rd; otherwise 1st*2nd
+    drug = 'alimemazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a3']).copy()
+
+    # alverine if 3, 1*2; NA: if '*', then 1st*2nd; if 4th, 100
+    drug = 'alverine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number'] = 100
+
+    # amantadine; NA: if 'ml', 3rd, otherwise 1st*2nd
+    drug = 'amantadine'
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a3']).copy()
+
+    # amitriptyline if 3 and contains '*', 1*2 (otherwise, 1st)
+    drug = 'amitriptyline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # amoxicillin  >3000 is bogus; if 'day pack', 1st*28; if '1/52', 52; if 'ml', 1st; if '14+14', 28; if 1st==15, 15; if '*', 1*2; if 'Pack of', 60; if '500mg x 1', 21; NA: if '7', 28; if 'ml', 1st; if '*', 1st*2nd
+    drug = 'amoxicillin'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] > 3000), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('day pack')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('day pack')), 'number_a1']).copy() * 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('1/52')), 'number'] = 52
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('14+14')), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 15), 'number'] = 15
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('Pack of')), 'number'] = 60
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('500mg x 1')), 'number'] = 21
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('7', na=False)), 'number'] = 28
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('30 -', na=False)), 'number'] = 30
+
+    # ampicillin  if 3, take 2
+    drug = 'ampicillin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy() 
+
+    # aripiprazole if 3, 1*2; NA: if 'ml', 1st; if '*', 1st*2nd
+    drug = 'aripiprazole'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # atenolol 10000 is 100; 3: if 'ml' or 'capsule', 1st; if '*', 1*2; if '28x3', 84; if 4, 1*2; 
+    drug = 'atenolol'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 10000), 'number'] = 100 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('capsule')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('capsule')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('28x3')), 'number'] = 84 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number_a2']).copy()
+
+    # azatadine
+    # baclofen 3: if 'ml', 1st; if '*', 1*2
+    drug = 'baclofen'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a2']).copy()
+
+    # benztropine
+    # betaxolol
+    # bisacodyl
+    # brompheniramine if 3, use 1
+    drug = 'brompheniramine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+
+    # buclizine >1000 is 48; if 3, take a2; NA: 2nd
+    drug = 'buclizine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] > 1000), 'number'] = 48 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy() 
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+
+    # captopril if 3, 1*2; NA: 56
+    drug = 'captopril'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 56
+
+    # cefalexin
+    # cetirizine if 3rd: 1*2 (unless has 'ml', then 1st); 1st has '84', 84; NA: if '3 X 10', 30; if '4 Pack', 120; if *', 1st*2nd, otherwise 1st
+    drug = 'cetirizine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('84')), 'number'] = 84
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('3 X 10', na=False)), 'number'] = 30
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('4 Pack', na=False)), 'number'] = 120
+
+    # chloroquine 10976 is 112; if 3==14, 14; if 3==98, 14; if 2==250 AND 3==(100 OR 155), 1st; if 4, 1*2; NA: if 'tablet' or 'tabs', 1st
+    drug = 'chloroquine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 10976), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 14), 'number'] = 14
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 98), 'number'] = 14
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 250) & (meds['number_a3'] == 100), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 250) & (meds['number_a3'] == 100), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 250) & (meds['number_a3'] == 155), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 250) & (meds['number_a3'] == 155), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 4), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 4), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 4), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('tablet', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('tablet', na=False)), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('tabs', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('tabs', na=False)), 'number_a1']).copy()
+
+    # chlorpromazine if '1 month', 90
+    drug = 'chlorpromazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('1 month')), 'number'] = 90
+
+    # ciclosporin if 3, 1*2 (only if contains '*'; otherwise 1st)
+    drug = 'ciclosporin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # cimetidine when 3: if 2nd has '60', 60 (otherwise 1st); NA: if 'X', 60; if '*', 1st*2nd, otherwise 1st
+    drug = 'cimetidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 60), 'number'] = 60
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number'] = 60
+
+    # citalopram if 3 , 1*2 (unless 3rd is 3 OR 2, then take 2nd*3rd); NA: if '*', 1st* 2nd
+    drug = 'citalopram'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 2), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 2), 'number_a2']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 2), 'number_a3']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 3), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 3), 'number_a2']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a3'] == 3), 'number_a3']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # clemastine if 3, take 1
+    drug = 'clemastine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+
+    # clindamycin 
+    # clonazepam; NA: if 'ml', 1st
+    drug = 'clonazepam'
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # cyclizine when 'prescription' contains 'injection' AND not 'ergotamine' AND 1st==1, 5; when 3, 1; NA: if 'X', 100; otherwise 1st
+    drug = 'cyclizine'
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'injection')) & (~meds['prescription'].str.contains('ergotamine')) & (meds['number_a1'] == 1), 'number'] = 5
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number'] = 100
+
+    # desloratadine when 3, 1*2
+    drug = 'desloratadine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # dexamethasone 3: when 1st==1, 10; when 1st==10 OR 20, 10, 20; when 1st==2, 20; when 1st==3, 30; otherwise 1st
+    drug = 'dexamethasone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 1), 'number'] = 10
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 2), 'number'] = 20
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 3), 'number'] = 30
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 10), 'number'] = 10
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 20), 'number'] = 20
+
+    # dextromethorphan
+    # diazepam 2028 is 560; 24336 is 8736; if 3: if '*', 1*2; if 'rectal', 1st*5; otherwise 1st
+    drug = 'diazepam'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2028), 'number'] = 560
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 24336), 'number'] = 8736
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('rectal')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('rectal')), 'number_a1']).copy() * 5
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # dicycloverine when 3: '*' 1*2; when 1st==1, 100; otherwise 1st
+    drug = 'dicycloverine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull() & (meds['quantity_multiplier'])), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull() & (meds['quantity_multiplier'])), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 1), 'number'] = 100
+
+    # digoxin when 3, 1*2; NA: if 'ml', 1st; if '*', 1st*2nd
+    drug = 'digoxin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # diltiazem when 3: if '*', 1*2; otherwise 112
+    drug = 'diltiazem'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # dimenhydrinate when 3, 1st
+    drug = 'dimenhydrinate'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # dipyridamole 3: when 1st==120 OR 56 OR 60, 1st; when '*', 1*2; 
+    drug = 'dipyridamole'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 120), 'number'] = 120
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 56), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 60), 'number'] = 60
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # domperidone
+    # dosulepin if 3, 1*2; NA: if 'X' or '*', 1st*2nd; otherwise 1st
+    drug = 'dosulepin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False, regex = False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a2']).copy()
+
+    # doxepine
+    # escitalopram 3: 1*2
+    drug = 'escitalopram'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # fluoxetine 3: if 'ml' or 'milli', 1st; otherwise 1*2; NA: if 'X', 30; if *', 1st*2nd, otherwise 1st
+    drug = 'fluoxetine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('milli')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('milli')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number'] = 30
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # gentamicin 3:1*2
+    drug = 'gentamicin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # glycopyrronium
+    # guaifenesin
+    # haloperidol; NA: if '1 pack', 5; if '2 packs', 10; if '*', 1st*2nd; otherwise 1st
+    drug = 'haloperidol'
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('1 pack', na=False, regex = False)), 'number'] = 5
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('2 packs', na=False, regex = False)), 'number'] = 10
+
+    # hydrocortisone 560 is 56; 3: if '*', 1*2 (otherwise, 1st); NA: if 'supposit' or 'ampoule', 1st; if '*', 1st*2nd; if 'ml', 1st
+    drug = 'hydrocortisone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 560), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('supposit', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('supposit', na=False)), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('ampoule', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('ampoule', na=False)), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # hydroxyzine 3: if 'ml', 1st; otherwise 1*2; NA: if '2 X 14', 28; if '*', 1st*2nd; otherwise 1st
+    drug = 'hydroxyzine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('2 X 14', na=False)), 'number'] = 28
+
+    # hyoscine butylbromide 3: 1*2 (unless 'ml', then 1st)
+    drug = 'hyoscine butylbromide'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # hyoscine hydrobromide 3: if 1st==1 OR '*', 1*2; otherwise 1st; NA: if '10 X 1', 10; if '*', 1st*2nd; otherwise 1st
+    drug = 'hyoscine hydrobromide'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 1), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 1), 'number_a1']).copy() * meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a1'] == 1), 'number_a2'].copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1'].copy() * meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('10 X 1', na=False)), 'number'] = 10
+
+    # imipramine 3: if '*', 1*2; otherwise 1st
+    drug = 'imipramine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # ketamine
+    # ketorolac when 3, 1*2; NA: 10
+    drug = 'ketorolac'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 10
+
+    # ketotifen when 3, 1
+    drug = 'ketotifen'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # levofloxacin
+    # levomepromazine 3: when 2nd==10, 1st*2nd; otherwise 1st; NA: if 1st==1, 10; otherwise 1st
+    drug = 'levomepromazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() 
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 10), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 10), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a2'] == 10), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 10
+
+    # lithium 1 or 2 is 100 or 200; when 3: if '*', 1*2 (otherwise 1st)
+    drug = 'lithium'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 100 
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2), 'number'] = 200 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # lofepramine if contains 'month', 1st*56; 3: 1*2 (unless 'ml', then 1st); NA: if 1st==1 or 1st==2, 1st*56; if '*', 1st*2nd; otherwise 1st
+    drug = 'lofepramine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('month')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('month')), 'number_a1']).copy() * 56 
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number_a1']).copy() * 56
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 2), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 2), 'number_a1']).copy() * 56
+
+    # loperamide 3: 1*2 (unless 'ml', then 1st)
+    drug = 'loperamide'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (~has_route(meds['quantity_route'], 'liquid')), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # loratadine
+    # lorazepam if 3, 1*2
+    drug = 'lorazepam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+
+    # metformin if '8 weeks', 8*28; if '500 MG', 112; 11256 is 6272; 4:1*2;  3:'8*28'=224; 2nd==1, 1st; 2nd==2 OR 3 OR 4, 1st; (2nd==2 OR 3 OR 4) AND '*', 1st*2nd; 2nd==8, 224; 2nd== 12, 1*2; 2nd==15, 1st; 2nd==(28 OR 56 OR 84 OR 112 OR 120 OR 150 OR 168 OR 500), 1*2; 2nd==500 AND (3rd==5 OR 50), 1st
+    drug = 'metformin'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('8 weeks')), 'number'] = 224
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('500 MG')), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 11256), 'number'] = 6272
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 1), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 1), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 2), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 2), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 3), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 3), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 4), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 4), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 2) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 2) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 2) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 3) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 3) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 3) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 4) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 4) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 4) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 8), 'number'] = 224
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 12), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 12), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 12), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 15), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 15), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 28), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 28), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 28), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 56), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 56), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 56), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 84), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 84), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 84), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 112), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 112), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 112), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 120), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 120), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 120), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 150), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 150), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 150), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 168), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 168), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 168), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500) & (meds['number_a3'] == 5), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500) & (meds['number_a3'] == 5), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500) & (meds['number_a3'] == 50), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['number_a2'] == 500) & (meds['number_a3'] == 50), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('8*28')), 'number'] = 224
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a4'].isnull()), 'number_a2']).copy()
+
+    # methylprednisolone 63 is bogus; 3: 1st
+    drug = 'methylprednisolone'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 63), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # metoprolol 3: 1*2
+    drug = 'metoprolol'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # midazolam if 3: 1st
+    drug = 'midazolam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # mirtazapine if 3:1*2
+    drug = 'mirtazapine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # nefopam if 3, 1*2
+    drug = 'nefopam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # nitrazepam 3:1*2 (unless 'ml', then 1st)
+    drug = 'nitrazepam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # olanzapine 3: 1*2 (unless 'TEMW'); NA: if '*', 1st*2nd; if 'ml', 1st
+    drug = 'olanzapine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('TEMW')), 'number'] = np.nan
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # orphenadrine 3: 1*2
+    drug = 'orphenadrine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # oxybutynin 3: if '*', 1*2; if '1 2*56', 112; if '1 pack of 56', 56; otherwise 1st; NA: if '*', 1st*2nd; if 'ml', 1st; if 'pack', 2nd
+    drug = 'oxybutynin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('1 2*56')), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('1 pack of 56')), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack', na=False)), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'patch')), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'patch')), 'number_a1']).copy()
+
+    # oxycodone 3: if '*', 1*2; 'TTO.' is nan; otherwise 1st; NA: if '*', 1st*2nd; if 'ml', 1st
+    drug = 'oxycodone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('TTO.')), 'number'] = np.nan
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (~meds['quantity'].str.contains('14/7', na=False)), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (~meds['quantity'].str.contains('14/7', na=False)), 'number_a1']).copy()
+
+    # paliperidone
+    # paroxetine 1 is 30; 3: 1*2 (unless 'ml', then 1st); NA: if 'ml', 1st; otherwise, 1st*2nd
+    drug = 'paroxetine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 30
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # phenobarbital 1 is 28, 2 is 56; 3:1*2
+    drug = 'phenobarbital'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # phenytoin 3: 1*2
+    drug = 'phenytoin'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # pramipexole 3: if '*', 1*2 (otherwise 1st)
+    drug = 'pramipexole'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # prednisolone 3: when 'Pack of 56', 56; when '*', 1*2; otherwise 1st; NA: if 'ml', 1st; otherwise 1st*2nd
+    drug = 'prednisolone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('Pack of 56')), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # prochlorperazine 42000 and 30000 are bogus; 3: when 'Pack of 56', 56; when '*', 1*2; otherwise 1st; NA: if 'ml' or 'ampoul', 1st; otherwise 1st*2nd
+    drug = 'prochlorperazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 42000), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 30000), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('Pack of 56')), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('ampoul', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('ampoul', na=False)), 'number_a1']).copy()
+
+    # procyclidine 3: 1*2 (unless 'ml', then 1st)
+    drug = 'procyclidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # promazine 3: if '*' 1*2 (otherwise 1st)
+    drug = 'promazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # promethazine 3136 is 56, 2500 is 50; 3: 1*2 (unless 'ml', then 1st)
+    drug = 'promethazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3136), 'number'] = 36
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 2500), 'number'] = 25
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # propantheline 3: 1*2
+    drug = 'propantheline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # pyrilamine 
+    # quetiapine 3:if '*', 1*2; NA: if '*', 1st*2nd
+    drug = 'quetiapine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # ranitidine 3: 1*2 (unless 'ml', then 1st)
+    drug = 'ranitidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # sertraline if '2*28', 56; otherwise 1*2; NA: if'*', 1st*2nd; if 'ml', 1st; if 'Pack of 28', 28
+    drug = 'sertraline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('2*28')), 'number'] = 56
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('Pack of 28', na=False)), 'number'] = 28
+
+    # sumatriptan 3: 1st (unless if '*', then 1*2); NA: if '*' or 'x', 1st*2nd; otherwise 1st
+    drug = 'sumatriptan'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('6', na=False)), 'number'] = 6
+
+    # temazepam 3: 1*2 (unless 'ml', then 1st)
+    drug = 'temazepam'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # theophylline 3: when '*', 1*2; otherwise 56; NA: if '*', 1st*2nd; if 'ml', 1st; if 'days', 56
+    drug = 'theophylline'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('days', na=False)), 'number'] = 56
+
+    # thioridazine
+    # tizanidine; NA: if 'ml', 1st
+    drug = 'tizanidine'
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # tobramycin
+    # tolterodine if 'mnth' OR 'MONTHS', 1st*28; 3:1*2
+    drug = 'tolterodine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('mnth')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('mnth')), 'number_a1']).copy() * 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # tramadol 'mnth' is 1st*60; 3: if '*', 1*2; otherwise 1
+    drug = 'tramadol'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('mnth')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('mnth')), 'number_a1']).copy() * 60
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # trandolapril 1 is 28; 3: if '*', 1*2; otherwise 1
+    drug = 'trandolapril'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # trazodone 'month' or 'pack' is 28; 3: if '*', 1*2; otherwise 1
+    drug = 'trazodone'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('month')), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack')), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # triamcinolone 3: 1st
+    drug = 'triamcinolone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # trifluoperazine 3: 1st (unless if '*', then 1*2)
+    drug = 'trifluoperazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] < 10) & (~meds['number_a2'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] < 10) & (~meds['number_a2'].isnull()), 'number_a1']) * ((meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] < 10) & (~meds['number_a2'].isnull()), 'number_a2'])).copy()
+
+    # trihexyphenidyl 3: 1*2
+    drug = 'trihexyphenidyl'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # triprolidine
+    # valproate '2 MONTHS' is 56; 3: 1*2 (unless 'ml', then 1st)
+    drug = 'valproate'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('2 MONTHS')), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # venlafaxine 3: 1*2
+    drug = 'venlafaxine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # warfarin '2 MONTHS' is 56; 3:1*2; NA: if 'ml', 1st; otherwise 1st*2nd
+    drug = 'warfarin'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('2 MONTHS')), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 28), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 28), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 28), 'number_a2']).copy()
+    meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 42), 'number'] = (meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 42), 'number_a1']).copy() * (meds.loc[missing & (meds['aa_name'] == drug) & (meds['number_a2'] == 42), 'number_a2']).copy()
+
+    # zolmitriptan 3: 1*2
+    drug = 'zolmitriptan'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # zuclopenthixol 3: if 'x', 1*2; otherwise 1; NA: if '10', 10; otherwise 1
+    drug = 'zuclopenthixol'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 1
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('10', na=False)), 'number'] = 10
+
+    # clomipramine 'MONTH' is 28; 3136 is 56; 3: 1st (unless if '*', then 1*2)
+    drug = 'clomipramine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTH')), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3136), 'number'] = 56
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # metoclopramide if 'months' or 'box', 28*1st; 1764 is 40; 3600 is 60; 3: 'Pack of 42' is 42; '*', 1*2; otherwise 1st; if with paracetamol, 5mg
+    drug = 'metoclopramide'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('months')), 'number'] = 28 * (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('months')), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 1764), 'number'] = 40
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3600), 'number'] = 60
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('Pack of 42')), 'number'] = 42
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # chlorphenamine 3600 is 60; 3: '1 pack of 5' is 1*2; '*' is 1*2; otherwise 1st
+    drug = 'chlorphenamine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['number_a1'] == 3600), 'number'] = 60
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('1 pack of 5')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('1 pack of 5')), 'number_a1']) * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('1 pack of 5')), 'number_a2']).copy()
+
+    # carbidopa/levodopa 3: 1st (unless if '*', then 1*2)
+    drug = 'carbidopa/levodopa'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # carbidopa/levodopa 3: 1st (unless if '*', then 1*2)
+    drug = 'carbidopa'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # chlortalidone 3: 1*2
+    drug = 'chlortalidone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # codeine 3: 'x' or '*' is 1*2; otherwise 1st
+    drug = 'codeine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a2']).copy()
+
+    # diphenhydramine 3: 1*2
+    drug = 'diphenhydramine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # diphenoxylate 'pack' is 20
+    drug = 'diphenoxylate'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack')), 'number'] = 20
+
+    # atropine 'pack' is 20
+    drug = 'atropine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack')), 'number'] = 20
+
+    # entacapone 3: 1st
+    drug = 'entacapone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # fluphenazine 3: 'x' is 1*2; otherwise 1st; NA: if 'X', 1st*2nd; otherwise 1st
+    drug = 'fluphenazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity'].str.contains('x')), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False, regex = False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a2']).copy()
+
+    # furosemide 'MONTHS' is 1st*28; 3: *' is 1*2; otherwise 1st
+    drug = 'furosemide'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number_a1']).copy() * 28
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # lansoprazole 3: '*' is 1*2; otherwise 2nd; NA: if '*', 1st*2nd; otherwise 28
+    drug = 'lansoprazole'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = 28
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # levodopa 3: '*' is 1*2; otherwise 1st
+    drug = 'levodopa'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # morphine 'pack of 20' is 1st*20; if '*', 1*2; otherwise 1st
+    drug = 'morphine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack of 20')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack of 20')), 'number_a1']).copy() * 20
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # nifedipine 3: if '*', 1*2, otherwise 1st
+    drug = 'nifedipine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # perphenazine 3: 1st
+    drug = 'perphenazine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # pseudoephedrine 3: 1st; NA: if 'ml', 1st
+    drug = 'pseudoephedrine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (has_route(meds['quantity_route'], 'liquid')), 'number_a1']).copy()
+
+    # methadone
+    # methotrexate 'MONTHS' is 1st*24; 3: if '*', 1*2, otherwise 1st
+    drug = 'methotrexate'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTHS')), 'number_a1']).copy() * 24
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()) & (meds['quantity_multiplier']), 'number_a2']).copy()
+
+    # paracetamol/codeine 'pack' or 'MONTH' is nan
+    drug = 'paracetamol/codeine'
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('MONTH')), 'number'] = np.nan
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('pack')), 'number'] = np.nan
+
+    # risperidone 3: 1*2
+    drug = 'risperidone'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy() * (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a2']).copy()
+
+    # rotigotine 3: 1st
+    drug = 'rotigotine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # pethidine 3: 1st
+    drug = 'pethidine'
+    meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (~meds['number_a3'].isnull()), 'number_a1']).copy()
+
+    # ipratropium
+        # when with salbutamol, take 1st if not greater than 5
+        # if quantity=NA and 'inhaler' in prescription, 200
+        # ipratropium, ~nebuliser:
+        # when (1 or 100 or 200), 200; when (2 or 400), 400; (600 or 3), 600; , (800 or 4), 800; 120 is 120
+        # ipratropium, nebuliser:
+        # when contains (28 or 40 or 60 or 80 or 120 or 100 or 112), is the number
+        # when contains "3 packs of 60", 180
+        # NA: if '120', 120; if '200', 200; if '100', 100;
+            # 1st: if 1st==1, 200; if 1st==2, 400  
+    drug = 'ipratropium'
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'inhaler')) & (meds['quantity'].isnull()), 'number'] = 200
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 1), 'number'] = 200
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 100), 'number'] = 200
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 200), 'number'] = 200
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 2), 'number'] = 400
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 400), 'number'] = 400
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 3), 'number'] = 600
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 600), 'number'] = 600
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 4), 'number'] = 800
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 800), 'number'] = 800
+    meds.loc[found & (meds['aa_name'] == drug) & (~has_route(meds['route'], 'nebuliser')) & (meds['number_a1'] == 120), 'number'] = 120
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('28')), 'number'] = 28
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('40')), 'number'] = 40
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('60')), 'number'] = 60
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('80')), 'number'] = 80
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('100')), 'number'] = 100
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('112')), 'number'] = 112
+    meds.loc[found & (meds['aa_name'] == drug) & (has_route(meds['route'], 'nebuliser')) & (meds['quantity'].str.contains('120')), 'number'] = 120
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] <= 5), 'number'] = (meds.loc[found & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] <= 5), 'number_a1']).copy() * 60
+    meds.loc[found & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] > 5), 'number'] = np.nan
+    meds.loc[unfound & (meds['aa_name'] == drug), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug), 'number_a1']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('x', na=False)), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('X', na=False)), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a1']).copy() * (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity_multiplier']), 'number_a2']).copy()
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('120', na=False)), 'number'] = 120
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('200', na=False)), 'number'] = 200
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['quantity'].str.contains('100', na=False)), 'number'] = 100
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 1), 'number'] = 200
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['number_a1'] == 2), 'number'] = 400
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] <= 5), 'number'] = (meds.loc[unfound & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] <= 5), 'number_a1']).copy() * 60
+    meds.loc[unfound & (meds['aa_name'] == drug) & (meds['prescription'].str.contains('salbutamol', na=False)) & (meds['number_a1'] > 5), 'number'] = np.nan
@@ -0,0 +1,846 @@
+# -*- coding: utf-8 -*-
+"""
+Helper code shared by the numbered scripts.
+
+1. DrugMatcher: finds all word-bounded occurrences of a list of drug names in a prescription in a single scan (Aho-Corasick automaton).
+2. encode/decode/map_unique: dictionary encoding of text columns, so that text processing runs once per distinct string instead of once per row.
+3. SubstitutionCache: on-disk cache of the brand-name substitutions, so that a re-run only substitutes new prescriptions and those affected by changes to the brand-name dictionary.
+4. MatchCache: on-disk cache of the prescription x drug matches, so that re-scoring after a change of the scales only searches the prescriptions for the added drugs.
+5. save_scale_table/ScaleTable: binary, memory-mapped version of the combined anticholinergic scales (aas_combined.csv), rebuilt from the .csv if it changed.
+6. tokenize_doses/dose_in_mg: doses (number and unit of mass) in the prescriptions and quantities, parsed once per distinct text and converted to mg.
+7. classify_routes/has_route: bit flags for the administration route and formulation terms in the prescriptions, computed once per distinct prescription.
+8. sum_scores: anticholinergic scores of the prescriptions as the product of the sparse prescription x drug match matrix and the drug x scale score matrix.
+9. parse_quantities: numbers in the quantities (as floats) and flags for units, multiplications and packs, parsed once per distinct quantity.
+10. apply_rules: table-driven manual corrections, applied per drug to that drug's rows only (in rule order, the last rule wins), with hit counts and timing per rule.
+11. split_combos: table-driven assignment of the compounds, doses and units of combination products, matching the rows to the strengths of each product at once.
+12. SectionCheckpoints: typed on-disk checkpoints of the data frames at the end of each section of a script, so that a re-run resumes with the first changed section.
+13. value_sample/concat_layout/write_part: writing a table in parts with the columns and types of their concatenation, without building it in memory.
+14. run_per_drug: runs per-drug corrections on blocks of whole drugs in a process pool and writes the columns they change back.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import time
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+# a drug name counts as found only if it is not preceded or followed by a letter (same as the regex used throughout the scripts: r'([^a-zA-Z]+|^)(drug)([^a-zA-Z]+|$)')
+LETTERS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+# names containing any of these characters were used as regular expressions by the scripts; they are matched with that regex instead of the automaton
+REGEX_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+
+
+## Multi-pattern matcher for drug names
+
+class DrugMatcher:
+
+    # build the automaton once from the list of names; the position of the name in the list is what gets reported
+    # end_bounded=False only requires the name not to be preceded by a letter (as the regex r'([^a-zA-Z]+|^)' + drug in 3_getDose.py)
+    def __init__(self, names, end_bounded=True):
+        self.names = list(names)
+        self.end_bounded = end_bounded
+        self.goto = [{}] # transitions of each state
+        self.fail = [0] # failure link of each state
+        self.output = [[]] # (name index, name length) of names that end in each state
+        self.regex_names = [] # (name index, compiled regex) for names that have to be matched as regular expressions
+        for i, name in enumerate(self.names):
+            if not isinstance(name, str) or name == '':
+                continue
+            if any(char in REGEX_CHARACTERS for char in name):
+                if end_bounded:
+                    self.regex_names.append((i, re.compile(r'([^a-zA-Z]+|^)({0})([^a-zA-Z]+|$)'.format(name))))
+                else:
+                    self.regex_names.append((i, re.compile(r'([^a-zA-Z]+|^)' + name)))
+                continue
+            state = 0
+            for char in name:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            self.output[state].append((i, len(name)))
+        # breadth-first pass to add the failure links; each state also inherits the outputs of its failure state
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(char, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    # return a list of (name index, start position) for every word-bounded occurrence of a name in the text
+    def find(self, text):
+        finds = []
+        if not isinstance(text, str):
+            return finds
+        goto, fail, output, end_bounded = self.goto, self.fail, self.output, self.end_bounded
+        state = 0
+        last = len(text) - 1
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for i, length in output[state]:
+                start = pos - length + 1
+                if (start == 0 or text[start-1] not in LETTERS) and (not end_bounded or pos == last or text[pos+1] not in LETTERS):
+                    finds.append((i, start))
+        for i, pattern in self.regex_names:
+            found = pattern.search(text)
+            if found:
+                finds.append((i, found.start(2) if self.end_bounded else found.start()))
+        return finds
+
+    # return the set of name indices found in the text
+    def matched(self, text):
+        return {i for i, start in self.find(text)}
+
+    # return a sparse (CSR) texts x names matrix with a 1 where the name was found in the text (the column indices of each row are sorted,
+    # so the first one is the name that comes first in the list)
+    def match_matrix(self, texts):
+        indptr = [0]
+        indices = []
+        for text in texts:
+            indices += sorted(self.matched(text))
+            indptr.append(len(indices))
+        return sparse.csr_matrix((np.ones(len(indices), dtype=np.int8), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+                                 shape=(len(indptr) - 1, len(self.names)))
+
+
+
+
+## Dictionary encoding of text columns
+# the prescription and quantity columns contain far fewer distinct strings than rows, so the text processing is done on the table of
+# distinct strings and the results are broadcast back to the rows through the integer codes
+
+# split a column into integer codes (NaN gets -1) and a series with the distinct strings
+def encode(column):
+    codes, uniques = pd.factorize(column)
+    return codes, pd.Series(uniques, name=column.name, dtype=object)
+
+# broadcast a series/data frame indexed by the position of the distinct strings back to the rows (rows with code -1, or without a result, get NaN)
+def decode(table, codes, index):
+    table = table.reindex(codes)
+    table.index = index
+    return table
+
+# run a function on the distinct strings of a column and broadcast the results back to the rows
+# the function gets a series with the distinct strings and returns a series/data frame with the same index (it can leave out rows without results)
+def map_unique(column, func):
+    codes, uniques = encode(column)
+    return decode(func(uniques), codes, column.index)
+
+
+
+
+## Administration route and formulation flags
+# each flag stands for a group of terms (plain substrings, as searched for with str.contains by the scripts); the text of each distinct
+# prescription is classified once into an integer column of bit flags, and the scripts test the bits instead of searching the text again
+
+ROUTE_FLAGS = [['topical', ['topical', 'cream', 'oint', 'gel', 'paste', 'lotion']],
+               ['ophthalmic', ['ophthalmic', 'eye drp', 'eye susp', 'eye dro']],
+               ['otic', ['otic', 'ear drop', 'ear drops', 'ear dro']],
+               ['nasal', ['nasal', 'nose drop', 'nose drops', 'spray']],
+               ['drops', ['drops', ' dro ']],
+               ['local_drug', ['neomycin', 'pyrilamine', 'ketorolac', 'betaxolol', 'emedastine']], # drugs that are mostly given locally
+               ['liquid', ['ml']],
+               ['injectable', ['inj']],
+               ['injection', ['injection']],
+               ['transdermal', ['transdermal']],
+               ['patch', ['patch']],
+               ['inhaler', ['inhaler']],
+               ['nebuliser', ['nebuliser']],
+               ['tablet', ['tab']],
+               ['cream_abbreviated', ['crm']],
+               ['cream_prefix', [' cre']],
+               ['percentage', ['%']]]
+ROUTE_NAMES = [name for name, terms in ROUTE_FLAGS]
+# the flags of the routes that are not oral (or inhaled)
+NON_ORAL_ROUTES = ['topical', 'ophthalmic', 'otic', 'nasal', 'drops', 'local_drug']
+
+# classify a text column into an integer column of route flags (NaN gets no flags)
+def classify_routes(texts):
+    def classify(uniques):
+        routes = pd.Series(0, index=uniques.index, dtype=np.int64)
+        for bit, (name, terms) in enumerate(ROUTE_FLAGS):
+            for term in terms:
+                routes[uniques.str.contains(term, regex=False, na=False)] |= 1 << bit
+        return routes
+    return map_unique(texts, classify).fillna(0).astype(np.int64)
+
+# boolean mask of the rows that have any of the given route flags (rows without flags, e.g. NaN, get False)
+def has_route(routes, *names):
+    bits = 0
+    for name in names:
+        bits |= 1 << ROUTE_NAMES.index(name)
+    return (routes.fillna(0).astype(np.int64) & bits) != 0
+
+
+
+
+## Dose tokenizer
+# a dose is a number followed by a unit of mass; each distinct text is parsed once into its doses (as text, e.g. '10mg'), and the doses
+# are converted to mg through a table of unit factors
+
+DOSE_PATTERN = re.compile(r'([\d\.]+\s*(milligram|mg|gram[^a-zA-Z]*$|g[^a-zA-Z]*$|microgram|mcg))')
+# units and their factors to mg; the tests are applied in this order and the last one that matches sets the unit ('gram' and 'g' are
+# part of other units, hence the regex)
+DOSE_UNITS = [['milligram', 1], ['mg', 1], ['microgram', 0.001], ['mcg', 0.001], [r'[\d\.]+\s*gram', 1000], [r'[\d\.]+\s*g\W*$', 1000]]
+
+# split a text column into a data frame with one column per dose found (in the order in which they appear); texts without a dose get NaN
+def tokenize_doses(texts, columns):
+    def tokenize(uniques):
+        doses = []
+        for text in uniques:
+            found = [dose.group(1) for dose in DOSE_PATTERN.finditer(text)] if isinstance(text, str) else []
+            if len(found) > len(columns):
+                raise ValueError('more doses in "' + text + '" than the ' + str(len(columns)) + ' columns ' + str(columns))
+            doses.append(found + [np.nan] * (len(columns) - len(found)))
+        return pd.DataFrame(doses, index=uniques.index, columns=columns, dtype=object).dropna(how='all')
+    return map_unique(texts, tokenize)
+
+# convert a column of doses (as found by tokenize_doses) to mg (float64; NaN if there is no dose or no unit)
+def dose_in_mg(doses):
+    def convert(uniques):
+        factors = pd.Series(np.nan, index=uniques.index)
+        for unit, factor in DOSE_UNITS:
+            factors[uniques.str.contains(unit, regex=True, na=False)] = factor
+        numbers = pd.Series(np.nan, index=uniques.index)
+        numbers[factors.notna()] = uniques[factors.notna()].str.extract(r'([\d\.]+)').iloc[:,0].astype(float)
+        return numbers * factors
+    return map_unique(doses, convert).astype(np.float64)
+
+
+
+
+## Quantity parser
+# the numbers in a quantity (as found by the regex r'([1-9][\d\.]*\s*)' of the scripts: a digit from 1-9 followed by digits and dots) as
+# floats, and flags for the terms that decide how the numbers are combined; each distinct quantity is parsed once
+
+QUANTITY_PATTERN = re.compile(r'([1-9][\d\.]*\s*)')
+# flag, regex: a unit of dose or volume, a multiplication ('28*2') and a number of packs ('2 packs of 28')
+QUANTITY_FLAGS = [['quantity_unit', r'milligram|mg|gram|microgram|mcg|ml'], ['quantity_multiplier', r'\*'], ['quantity_pack', r'packs? of']]
+
+# parse a text column into a data frame with one float column per number found (in the order in which they appear; NaN where there are
+# fewer numbers) and a boolean column per flag of QUANTITY_FLAGS (NaN gets no numbers and no flags)
+def parse_quantities(texts, columns):
+    def parse(uniques):
+        numbers = np.full((len(uniques), len(columns)), np.nan)
+        for row, text in enumerate(uniques):
+            found = QUANTITY_PATTERN.findall(text) if isinstance(text, str) else []
+            if len(found) > len(columns):
+                raise ValueError('more numbers in "' + text + '" than the ' + str(len(columns)) + ' columns ' + str(columns))
+            if found:
+                found[0] = found[0].replace('...', '') # the first number can be followed by '...'
+                numbers[row, :len(found)] = [float(number) for number in found]
+        parsed = pd.DataFrame(numbers, index=uniques.index, columns=columns)
+        for flag, pattern in QUANTITY_FLAGS:
+            parsed[flag] = uniques.str.contains(pattern, regex=True, na=False)
+        return parsed
+    parsed = map_unique(texts, parse)
+    flags = [flag for flag, pattern in QUANTITY_FLAGS]
+    parsed[flags] = parsed[flags].fillna(False).astype(bool)
+    return parsed
+
+
+
+
+## Rule engine for the manual corrections
+# a rule sets 'column' to 'value' (or to the value of the column 'source'; the smallest one if it is a list of columns) in the rows of
+# 'drug' that contain the 'text' (regex as in str.contains; a list: all of them), have the 'route' flag (see has_route) and meet the
+# 'condition' (column, operator, number; a list: all of them; the operator 'notnull' takes no number); None means no restriction.
+# The rows are grouped by 'aa_name' once and each drug's rules only look at its own rows, in the order of the table (the last rule wins).
+
+RULE_COLUMNS = ['drug', 'frame', 'text', 'route', 'condition', 'column', 'value', 'source']
+RULE_OPERATORS = {'==': np.equal, '!=': np.not_equal, '>': np.greater, '>=': np.greater_equal, '<': np.less, '<=': np.less_equal}
+
+# listify a rule field (None, a single item, or a list of items)
+def _items(field, single):
+    if field is None:
+        return []
+    return [field] if isinstance(field, single) else list(field)
+
+# mask of the rows (of a single drug) that a rule applies to
+def _rule_mask(rows, rule):
+    mask = np.ones(len(rows), dtype=bool)
+    for text in _items(rule.text, str):
+        mask &= rows['prescription'].str.contains(text, na=False).to_numpy(dtype=bool)
+    for route in _items(rule.route, str):
+        mask &= has_route(rows['route'], route).to_numpy()
+    for condition in _items(rule.condition, tuple):
+        values = rows[condition[0]].to_numpy(dtype=np.float64)
+        if condition[1] == 'notnull':
+            mask &= ~np.isnan(values)
+        else:
+            with np.errstate(invalid='ignore'):
+                mask &= RULE_OPERATORS[condition[1]](values, condition[2])
+    return mask
+
+# apply a table of rules (see RULE_COLUMNS) to a data frame in place (only to the rows of a partition, a boolean array, if given);
+# returns the number of rows each rule changed ('hits') and the time it took ('seconds'), with the index of the rules
+def apply_rules(frame, rules, partition=None):
+    report = pd.DataFrame({'hits': 0, 'seconds': 0.0}, index=rules.index)
+    drug_rows = frame.groupby('aa_name', sort=False).indices
+    for drug, drug_rules in rules.groupby('drug', sort=False):
+        if drug not in drug_rows:
+            continue
+        positions = drug_rows[drug] if partition is None else drug_rows[drug][partition[drug_rows[drug]]]
+        if len(positions) == 0:
+            continue
+        rows = frame.iloc[positions].copy()
+        for index, rule in zip(drug_rules.index, drug_rules.itertuples()):
+            start = time.perf_counter()
+            mask = _rule_mask(rows, rule)
+            if mask.any():
+                if rule.source is None:
+                    value = rule.value
+                elif isinstance(rule.source, str):
+                    value = rows.loc[mask, rule.source].copy()
+                else:
+                    value = rows.loc[mask, rule.source].min(axis=1)
+                selected = np.zeros(len(frame), dtype=bool)
+                selected[positions[mask]] = True
+                frame.loc[selected, rule.column] = value
+                rows.loc[mask, rule.column] = value
+                report.loc[index, 'hits'] = mask.sum()
+            report.loc[index, 'seconds'] = time.perf_counter() - start
+    return report
+
+
+
+
+## Splitter for combination products
+# a combination product is identified by the drug that goes to 'combo_drug_1'; 'compounds' lists the compound that goes to each slot
+# ('combo_drug_<slot>') if all the names in 'requires' are found in the prescription (preceded by a non-letter, as r'([^a-zA-Z]+|^)' + name),
+# with a fixed 'dose' or NaN; 'strengths' gives the doses and units of the compounds ('dose_<slot>', 'units_<slot>'; None: not set by that
+# row; a column name: the value of that column) of the rows of 'product' (with 'drug_2' in the 2nd slot, if given) that have 'strength'
+# in 'dose_a1_number' or 'dose_a2_number' (if given), no dose at all (if 'no_dose') and the 'text' in the prescription (if given)
+
+COMBO_SLOTS = [1, 2, 3]
+COMBO_COMPOUND_COLUMNS = ['product', 'slot', 'compound', 'requires', 'dose']
+COMBO_STRENGTH_COLUMNS = ['product', 'drug_2', 'strength', 'no_dose', 'text', 'dose_1', 'dose_2', 'dose_3', 'units_1', 'units_2', 'units_3']
+
+# set the strengths of the rows of one product; the strength rows are matched to the prescriptions at once (rows x strengths), and for
+# each column the last strength row that matches and sets it wins
+def _apply_strengths(frame, rows, strengths):
+    sub = frame.loc[rows]
+    applies = np.ones((len(sub), len(strengths)), dtype=bool)
+    for j, strength in enumerate(strengths.itertuples()):
+        if pd.notna(strength.drug_2):
+            applies[:, j] &= (sub['combo_drug_2'] == strength.drug_2).to_numpy()
+        if strength.no_dose:
+            applies[:, j] &= sub['dose_a1_number'].isnull().to_numpy()
+        if pd.notna(strength.text):
+            applies[:, j] &= sub['prescription'].str.contains(strength.text, na=False).to_numpy(dtype=bool)
+    values = strengths['strength'].to_numpy(dtype=np.float64)
+    observed = sub[['dose_a1_number', 'dose_a2_number']].to_numpy(dtype=np.float64)
+    applies &= np.isnan(values) | (observed[:, [0]] == values) | (observed[:, [1]] == values)
+    positions = np.flatnonzero(rows)
+    for slot in COMBO_SLOTS:
+        for field, column in [['dose_' + str(slot), 'combo_dose_' + str(slot)], ['units_' + str(slot), 'combo_dose_units_' + str(slot)]]:
+            sets = applies & strengths[field].notna().to_numpy()
+            has_value = sets.any(axis=1)
+            if not has_value.any():
+                continue
+            last = len(strengths) - 1 - np.argmax(sets[:, ::-1], axis=1)
+            for j in np.unique(last[has_value]):
+                value = strengths[field].iloc[j]
+                winners = has_value & (last == j)
+                if field.startswith('dose_') and isinstance(value, str):
+                    value = sub.loc[winners, value].to_numpy() # the dose is in another column
+                selected = np.zeros(len(frame), dtype=bool)
+                selected[positions[winners]] = True
+                frame.loc[selected, column] = value
+
+# assign the compounds, doses and units of the combination products (see above) to the combo_drug_<slot>, combo_dose_<slot> and
+# combo_dose_units_<slot> columns of a data frame in place; the products are handled in the order of the table, so a later product
+# overwrites the slots it assigns in rows that contain several products
+def split_combos(frame, compounds, strengths):
+    names = list(dict.fromkeys(name for requires in compounds['requires'] for name in requires))
+    codes, prescriptions = encode(frame['prescription'])
+    found = DrugMatcher(names, end_bounded=False).match_matrix(prescriptions).toarray() > 0
+    found = np.vstack([found, np.zeros((1, len(names)), dtype=bool)])[codes] # rows without a prescription (code -1) have no names
+    for product in compounds['product'].unique():
+        for compound in compounds.loc[compounds['product'] == product].itertuples():
+            rows = found[:, [names.index(name) for name in compound.requires]].all(axis=1)
+            frame.loc[rows, 'combo_drug_' + str(compound.slot)] = compound.compound
+            if not pd.isnull(compound.dose):
+                frame.loc[rows, 'combo_dose_' + str(compound.slot)] = compound.dose
+        rows = (frame['combo_drug_1'] == product).to_numpy()
+        product_strengths = strengths.loc[strengths['product'] == product]
+        if rows.any() and len(product_strengths) > 0:
+            _apply_strengths(frame, rows, product_strengths)
+
+
+
+
+## On-disk cache of brand-name substitutions
+# the results are stored in an SQLite file with the prescription and a fingerprint (SHA-256) of the brand-name dictionary as the key;
+# the fingerprint does not depend on the machine or the Python session, so the file can be copied and re-used
+
+class SubstitutionCache:
+
+    # bump this whenever the substitution rules change, so that results of the old rules are not re-used
+    VERSION = 1
+
+    # open (or create) the cache file for a brand-name dictionary; max_entries limits the number of stored substitutions (None: no limit)
+    def __init__(self, path, name_dict, max_entries=None):
+        self.names = [[brand, generic] for brand, generic in name_dict.items()]
+        self.dictionary = hashlib.sha256(json.dumps([self.VERSION, self.names]).encode('utf-8')).hexdigest()
+        self.max_entries = max_entries
+        self.connection = sqlite3.connect(path, timeout=600)
+        with self.connection:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS dictionaries (dictionary TEXT PRIMARY KEY, names TEXT, last_used REAL)')
+            self.connection.execute('CREATE TABLE IF NOT EXISTS substitutions (prescription TEXT, dictionary TEXT, result TEXT, last_used REAL, PRIMARY KEY (prescription, dictionary))')
+            self.connection.execute('CREATE INDEX IF NOT EXISTS substitutions_last_used ON substitutions (last_used)')
+            # the dictionary that was used before this one (results for prescriptions not affected by the changes can be carried over)
+            self.previous = self.connection.execute('SELECT dictionary, names FROM dictionaries WHERE dictionary != ? ORDER BY last_used DESC LIMIT 1', (self.dictionary,)).fetchone()
+            self.connection.execute('INSERT OR REPLACE INTO dictionaries VALUES (?, ?, ?)', (self.dictionary, json.dumps(self.names), time.time()))
+        self.changed_matcher = None
+
+    # substitute a series of distinct prescriptions: cached results are re-used and only the rest is passed to func (which returns a series in the same order)
+    def substitute(self, prescriptions, func):
+        now = time.time()
+        results = self._lookup(prescriptions, self.dictionary, now)
+        missing = [prescription for prescription in prescriptions if prescription not in results]
+        new_results = {}
+        if len(missing) > 0:
+            # carry over the results of the previous dictionary for prescriptions that contain none of the changed brand names
+            matcher = self._changedMatcher()
+            if matcher is not None:
+                for prescription, result in self._lookup(missing, self.previous[0]).items():
+                    if len(matcher.find(prescription)) == 0:
+                        new_results[prescription] = result
+            # substitute the rest
+            rest = pd.Series([prescription for prescription in missing if prescription not in new_results], dtype=object)
+            if len(rest) > 0:
+                new_results.update(zip(rest, func(rest)))
+            with self.connection:
+                self.connection.executemany('INSERT OR REPLACE INTO substitutions VALUES (?, ?, ?, ?)',
+                                            ((prescription, self.dictionary, result, now) for prescription, result in new_results.items()))
+            self._evict()
+        results.update(new_results)
+        return prescriptions.map(results)
+
+    # fetch the stored results of a dictionary for a list of prescriptions (and mark them as used, if a time is given)
+    def _lookup(self, prescriptions, dictionary, now=None):
+        with self.connection:
+            self.connection.execute('CREATE TEMP TABLE IF NOT EXISTS wanted (prescription TEXT PRIMARY KEY)')
+            self.connection.execute('DELETE FROM wanted')
+            self.connection.executemany('INSERT OR IGNORE INTO wanted VALUES (?)', ((prescription,) for prescription in prescriptions))
+            if now is not None:
+                self.connection.execute('UPDATE substitutions SET last_used = ? WHERE dictionary = ? AND prescription IN (SELECT prescription FROM wanted)', (now, dictionary))
+            found = self.connection.execute('SELECT substitutions.prescription, substitutions.result FROM substitutions JOIN wanted ON substitutions.prescription = wanted.prescription '
+                                            'WHERE substitutions.dictionary = ?', (dictionary,)).fetchall()
+        return dict(found)
+
+    # build a matcher for the brand names that were added, removed, or given a different generic name since the previous dictionary
+    # the result of a prescription only depends on the brand names found in it, their order, and their generic names; if the order of the
+    # unchanged brand names is not the same, nothing can be carried over (None is returned)
+    def _changedMatcher(self):
+        if self.previous is None:
+            return None
+        if self.changed_matcher is None:
+            old_pairs = [json.dumps(pair) for pair in json.loads(self.previous[1])]
+            new_pairs = [json.dumps(pair) for pair in self.names]
+            unchanged = set(old_pairs) & set(new_pairs)
+            if [pair for pair in old_pairs if pair in unchanged] != [pair for pair in new_pairs if pair in unchanged]:
+                self.previous = None
+                return None
+            changed = [json.loads(pair)[0] for pair in set(old_pairs) ^ set(new_pairs)]
+            self.changed_matcher = DrugMatcher(changed)
+        return self.changed_matcher
+
+    # remove the least recently used substitutions if there are more than max_entries
+    def _evict(self):
+        if self.max_entries is None:
+            return
+        with self.connection:
+            excess = self.connection.execute('SELECT COUNT(*) FROM substitutions').fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.connection.execute('DELETE FROM substitutions WHERE rowid IN (SELECT rowid FROM substitutions ORDER BY last_used LIMIT ?)', (excess,))
+                self.connection.execute('DELETE FROM dictionaries WHERE dictionary NOT IN (SELECT DISTINCT dictionary FROM substitutions) AND dictionary != ?', (self.dictionary,))
+
+
+
+
+## On-disk cache of the drug matches
+# 2_aa_score.py keeps the prescription x drug match matrix of its last run (<path>.matches.npz, with the prescriptions and drug names of
+# its rows and columns in <path>.prescriptions.npy and <path>.names.npy); when the scales change, the matches of the known prescriptions
+# are re-used, and only the prescriptions that contain an added drug name (and new prescriptions) are searched, so that re-scoring after
+# a correction of the scales does not have to search all prescriptions again
+
+class MatchCache:
+
+    def __init__(self, path):
+        self.path = path
+
+    # return the match matrix (see DrugMatcher.match_matrix) of a series of distinct prescriptions, re-using the stored matches, and store the new one
+    # (match is the function that searches a list of prescriptions for all names; by default matcher.match_matrix)
+    def match_matrix(self, matcher, prescriptions, match=None):
+        match = matcher.match_matrix if match is None else match
+        prescriptions = [str(prescription) for prescription in prescriptions]
+        stored = self._load()
+        if stored is None:
+            matches = match(prescriptions)
+        else:
+            matches = self._update(matcher, match, prescriptions, *stored)
+        sparse.save_npz(self.path + '.matches.npz', matches)
+        np.save(self.path + '.prescriptions.npy', np.array(prescriptions, dtype=str))
+        np.save(self.path + '.names.npy', np.array(matcher.names, dtype=str))
+        return matches
+
+    # the stored matches, prescriptions, and drug names (None if there are none)
+    def _load(self):
+        try:
+            return (sparse.load_npz(self.path + '.matches.npz').tocsr(), [str(prescription) for prescription in np.load(self.path + '.prescriptions.npy')],
+                    [str(name) for name in np.load(self.path + '.names.npy')])
+        except (OSError, ValueError):
+            return None
+
+    # build the match matrix from the stored one: the matches of drug names that are still in the list are kept for the known prescriptions,
+    # the known prescriptions are searched only for the added names, and the new prescriptions are searched for all names
+    def _update(self, matcher, match, prescriptions, stored_matches, stored_prescriptions, stored_names):
+        stored_rows = dict(zip(stored_prescriptions, range(len(stored_prescriptions))))
+        stored_columns = dict(zip(stored_names, range(len(stored_names))))
+        row_map = np.array([stored_rows.get(prescription, -1) for prescription in prescriptions], dtype=np.int64)
+        column_map = np.full(len(stored_names), -1, dtype=np.int64) # stored column -> new column
+        added = [] # new columns of the added names
+        for j, name in enumerate(matcher.names):
+            if name in stored_columns:
+                column_map[stored_columns[name]] = j
+            else:
+                added.append(j)
+        known = np.flatnonzero(row_map >= 0)
+        # matches of the known prescriptions for the names that are still in the list
+        kept = stored_matches[row_map[known]].tocoo()
+        keep = column_map[kept.col] >= 0
+        rows = [known[kept.row[keep]]]
+        columns = [column_map[kept.col[keep]]]
+        # known prescriptions that contain an added name (only those that contain the text of the name are searched)
+        if len(added) > 0 and len(known) > 0:
+            known_texts = pd.Series([prescriptions[i] for i in known], dtype=object)
+            candidates = np.zeros(len(known), dtype=bool)
+            for j in added:
+                name = matcher.names[j]
+                candidates |= known_texts.str.contains(name, regex=any(char in REGEX_CHARACTERS for char in name), na=False).to_numpy()
+            added_matcher = DrugMatcher([matcher.names[j] for j in added])
+            for i in np.flatnonzero(candidates):
+                found = [added[k] for k in added_matcher.matched(known_texts[i])]
+                rows.append(np.full(len(found), known[i], dtype=np.int64))
+                columns.append(np.array(found, dtype=np.int64))
+        # new prescriptions
+        new = np.flatnonzero(row_map < 0)
+        if len(new) > 0:
+            new_matches = match([prescriptions[i] for i in new]).tocoo()
+            rows.append(new[new_matches.row])
+            columns.append(new_matches.col.astype(np.int64))
+        rows = np.concatenate(rows)
+        columns = np.concatenate(columns)
+        matches = sparse.csr_matrix((np.ones(len(rows), dtype=np.int8), (rows, columns)), shape=(len(prescriptions), len(matcher.names)))
+        matches.sort_indices()
+        return matches
+
+
+
+
+## Checkpoints of the sections of a script
+# 3_getDose.py writes the data frames it has at the end of each section to <path>/<section>/: one .npy file per column (numeric and
+# date columns as they are, so that they can be memory-mapped; text columns dictionary-encoded as integer codes and the distinct strings;
+# anything else pickled) and a manifest.json with the columns and their types; each checkpoint is keyed by a fingerprint (SHA-256) of
+# the input files, helpers.py, the code before the first section, and the code of the section and all sections before it, so that a
+# re-run loads the last valid checkpoint and resumes with the first section whose code (or input) changed
+
+class SectionCheckpoints:
+
+    # bump this whenever the format of the checkpoints changes
+    VERSION = 1
+
+    # script: the file with the code; sections: [name, first line (indentation is ignored)] of each section in the order of the script (the last section is never
+    # checkpointed, so it always runs); inputs: the files the script reads; path None disables the checkpoints (every section runs)
+    def __init__(self, path, script, sections, inputs):
+        self.path = path
+        self.names = [name for name, header in sections]
+        self.keys = self._keys(script, [header for name, header in sections], inputs) if path is not None else []
+        # the sections up to the last one with a valid checkpoint (and all checkpoints before it) are skipped
+        self.start = 0
+        while path is not None and self.start < len(self.names) - 1 and self._manifest(self.start).get('key') == self.keys[self.start]:
+            self.start += 1
+        if self.start > 0:
+            print('Resuming after section ' + self.names[self.start - 1] + ' (checkpoint in ' + os.path.join(path, self.names[self.start - 1]) + ').')
+
+    # whether a section has to run
+    def runs(self, name):
+        return self.names.index(name) >= self.start
+
+    # the data frames of the last valid checkpoint (a frame that did not change is only stored by the first section that saved it)
+    def load(self, *frames):
+        loaded = []
+        for frame in frames:
+            for i in range(self.start - 1, -1, -1):
+                manifest = self._manifest(i)
+                if frame in manifest['frames']:
+                    loaded.append(self._load_frame(os.path.join(self.path, self.names[i]), frame, manifest['frames'][frame]))
+                    break
+            else:
+                raise KeyError('No checkpoint has the data frame ' + frame)
+        return loaded
+
+    # write the data frames at the end of a section (the manifest comes last, so an interrupted write leaves no valid checkpoint)
+    def save(self, name, **frames):
+        if self.path is None:
+            return
+        directory = os.path.join(self.path, name)
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory)
+        manifest = {'key': self.keys[self.names.index(name)], 'frames': {}}
+        for frame, data in frames.items():
+            manifest['frames'][frame] = self._save_frame(directory, frame, data)
+        with open(os.path.join(directory, 'manifest.json'), 'w') as file:
+            json.dump(manifest, file)
+
+    # fingerprint of each section: the hash of the inputs and the code is updated section by section (lines are compared without trailing
+    # white space and line endings)
+    def _keys(self, script, headers, inputs):
+        with open(script, 'rb') as file:
+            lines = [line.rstrip() for line in file.read().split(b'\n')]
+        starts = [next(i for i, line in enumerate(lines) if line.lstrip().startswith(header.encode('utf-8'))) for header in headers] + [len(lines)]
+        fingerprint = hashlib.sha256(json.dumps([self.VERSION]).encode('utf-8'))
+        for path in list(inputs) + [__file__]:
+            with open(path, 'rb') as file:
+                for block in iter(lambda: file.read(1 << 24), b''):
+                    fingerprint.update(block)
+        fingerprint.update(b'\n'.join(lines[:starts[0]]))
+        keys = []
+        for i in range(len(headers)):
+            fingerprint.update(b'\n'.join(lines[starts[i]:starts[i + 1]]))
+            keys.append(fingerprint.hexdigest())
+        return keys
+
+    def _manifest(self, i):
+        try:
+            with open(os.path.join(self.path, self.names[i], 'manifest.json')) as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    # each column is stored as 'array' (numeric, boolean and date columns), 'text' (text columns with NaN for missing values) or 'pickle'
+    def _save_frame(self, directory, frame, data):
+        kinds = []
+        for j in range(data.shape[1]):
+            column = data.iloc[:, j]
+            file = os.path.join(directory, '{0}.{1}'.format(frame, j))
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in 'biufcmM':
+                np.save(file + '.npy', column.to_numpy())
+                kinds.append('array')
+            elif column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) in ['string', 'empty']:
+                codes, uniques = encode(column)
+                np.save(file + '.npy', codes.astype(np.int32 if len(uniques) < 2**31 else np.int64))
+                np.save(file + '.text.npy', uniques.to_numpy().astype(str))
+                kinds.append('text')
+            else:
+                pd.to_pickle(column.array, file + '.pkl')
+                kinds.append('pickle')
+        if data.index.dtype == np.int64:
+            np.save(os.path.join(directory, frame + '.index.npy'), data.index.to_numpy())
+            index = 'array'
+        else:
+            pd.to_pickle(data.index, os.path.join(directory, frame + '.index.pkl'))
+            index = 'pickle'
+        return {'columns': [str(column) for column in data.columns], 'kinds': kinds, 'index': index}
+
+    def _load_frame(self, directory, frame, manifest):
+        if manifest['index'] == 'array':
+            index = pd.Index(np.load(os.path.join(directory, frame + '.index.npy')))
+        else:
+            index = pd.read_pickle(os.path.join(directory, frame + '.index.pkl'))
+        columns = {}
+        for j, kind in enumerate(manifest['kinds']):
+            file = os.path.join(directory, '{0}.{1}'.format(frame, j))
+            if kind == 'array':
+                columns[j] = np.load(file + '.npy', mmap_mode='r')
+            elif kind == 'text':
+                uniques = np.append(np.load(file + '.text.npy').astype(object), np.nan)
+                columns[j] = uniques[np.load(file + '.npy', mmap_mode='r')]
+            else:
+                columns[j] = pd.read_pickle(file + '.pkl')
+        data = pd.DataFrame(columns, index=index)
+        data.columns = manifest['columns']
+        return data
+
+
+
+
+## Writing a table in parts
+# 3_getDose.py does not concatenate its parts (the rows it processed and the rows it passes through, streamed from the input) into one
+# table before writing it, but writes them one after the other with the columns and types of that concatenation. pd.concat ignores the
+# parts in which a column has no values when it chooses the type of the column, so the types are taken from the concatenation of small
+# samples that, for each column, contain the first row of the part with a value in it (see value_sample).
+
+# the rows of a data frame with the first value of each column
+def value_sample(frame):
+    has_value = frame.notna().to_numpy()
+    columns = has_value.any(axis=0)
+    return frame.iloc[np.unique(has_value[:, columns].argmax(axis=0))]
+
+# the columns and types (a series of dtypes indexed by the columns) of the concatenation of the parts that the samples come from
+def concat_layout(samples):
+    return pd.concat(samples).dtypes
+
+# write a part with the columns and types of the layout, after the parts before it (first: create the file and write the header); the rows
+# are converted and written in slices of chunk_rows, so that only one slice is copied at a time
+def write_part(frame, path, layout, first, chunk_rows=100000, **kwargs):
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        rows = frame.iloc[start:start + chunk_rows].reindex(columns=layout.index)
+        for column, dtype in layout.items():
+            if rows[column].dtype != dtype:
+                rows[column] = rows[column].astype(dtype)
+        rows.to_csv(path, mode='w' if first and start == 0 else 'a', header=first and start == 0, **kwargs)
+
+
+
+
+## Per-drug execution in a process pool
+# corrections that only look at the rows of one drug at a time (every statement is conditioned on 'aa_name') give the same result on any set
+# of whole drugs. With a pool, the rows are grouped into n_blocks blocks of whole drugs (the drugs with the most rows first, each to the block
+# with the fewest rows so far; within a block, the rows of a drug are contiguous), the function corrects each block in a worker process, and
+# the columns it changes are written back. The function has to be importable by the workers (see dose_corrections.py).
+
+# correct a block of rows in a worker process; returns the changed columns and the function's result
+def _run_block(task):
+    function, columns, rows = task
+    result = function(rows)
+    return rows[columns], result
+
+# run a function that corrects the rows of a data frame in place (and may return a result) per drug in a pool of processes (None: on the
+# whole data frame in this process); columns: the columns the function may change; returns the results of the function (one per block)
+def run_per_drug(frame, function, columns, pool=None, n_blocks=1):
+    if pool is None or n_blocks <= 1:
+        return [function(frame)]
+    drugs = pd.factorize(frame['aa_name'])[0] + 1 # 0: no drug
+    sizes = np.bincount(drugs)
+    block_of_drug = np.zeros(len(sizes), dtype=np.int64)
+    block_rows = np.zeros(n_blocks, dtype=np.int64)
+    for drug in np.argsort(-sizes, kind='stable'):
+        block_of_drug[drug] = block_rows.argmin()
+        block_rows[block_of_drug[drug]] += sizes[drug]
+    order = np.lexsort((drugs, block_of_drug[drugs]))
+    blocks = [block for block in np.split(order, np.cumsum(block_rows)[:-1]) if len(block) > 0]
+    outputs = pool.map(_run_block, [(function, columns, frame.iloc[block]) for block in blocks])
+    changed = pd.concat([output[0] for output in outputs])
+    changed.index = np.concatenate(blocks)
+    changed = changed.sort_index()
+    for column in columns:
+        frame[column] = changed[column].to_numpy()
+    return [output[1] for output in outputs]
+
+
+
+
+## Binary look-up table of the anticholinergic scales
+# 0b_combine_scales.py also writes the combined scales as .npy files next to aas_combined.csv: the drug names (sorted), the position of
+# each drug in aas_combined.csv, the drug x scale matrix of scores (float32), the names of the scale columns, and flags for the drug
+# combinations (names with a '/'); the files are memory-mapped when they are loaded, so all scores of a drug are read in one row look-up.
+# The SHA-256 of aas_combined.csv is stored with them ('source'); a table that does not match the .csv (e.g. the .csv was edited by hand,
+# or 0b_combine_scales.py stopped between writing the two) or that is missing is rebuilt from the .csv when it is loaded
+
+SCALE_TABLE_PARTS = ['drugs', 'order', 'scores', 'columns', 'combos']
+
+# SHA-256 of a file (hex)
+def _file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 24), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+# write the parts of the table to <path>.<part>.npy; duplicate drugs are dropped (the first entry is kept, as in the scripts reading the .csv);
+# <path>.csv has to be written before (its hash is written last, so an interrupted write leaves a table that does not match)
+def save_scale_table(path, scales, columns):
+    scales = scales[~scales.duplicated(['drug'])]
+    drugs = scales['drug'].to_numpy().astype(str)
+    order = np.argsort(drugs, kind='stable')
+    scores = scales[list(columns)].to_numpy(dtype=np.float64)[order]
+    # the scores are stored as float32 only if that does not change them (scale scores are halves and whole numbers)
+    if np.array_equal(scores.astype(np.float32), scores, equal_nan=True):
+        scores = scores.astype(np.float32)
+    parts = {'drugs': drugs[order],
+             'order': order.astype(np.int32),
+             'scores': scores,
+             'columns': np.array(columns, dtype=str),
+             'combos': np.char.find(drugs[order], '/') >= 0}
+    for part in SCALE_TABLE_PARTS:
+        np.save('{0}.{1}.npy'.format(path, part), parts[part])
+    np.save('{0}.source.npy'.format(path), np.array(_file_sha256(path + '.csv')))
+
+class ScaleTable:
+
+    # load (memory-map) the parts of the table written by save_scale_table; if they are missing or do not match <path>.csv, they are
+    # written again from the .csv first (with all its score columns)
+    def __init__(self, path):
+        if not os.path.exists(path + '.csv'):
+            raise FileNotFoundError(path + '.csv does not exist; run 0b_combine_scales.py to write the combined scales')
+        if not self._matches(path, _file_sha256(path + '.csv')):
+            scales = pd.read_csv(path + '.csv', header=0, dtype={'drug': str})
+            save_scale_table(path, scales, [column for column in scales.columns if column != 'drug'])
+        for part in SCALE_TABLE_PARTS:
+            setattr(self, part, np.load('{0}.{1}.npy'.format(path, part), mmap_mode='r'))
+        self.columns = [str(column) for column in self.columns]
+
+    # whether all parts of the table exist and were written from the .csv with this hash
+    @staticmethod
+    def _matches(path, source):
+        if not all(os.path.exists('{0}.{1}.npy'.format(path, part)) for part in SCALE_TABLE_PARTS + ['source']):
+            return False
+        return str(np.load('{0}.source.npy'.format(path))) == source
+
+    def __len__(self):
+        return len(self.drugs)
+
+    # the drug names in the order of aas_combined.csv
+    def drugs_in_order(self):
+        return [str(drug) for drug in self.drugs[np.argsort(self.order)]]
+
+    # row of a drug in the table (-1 if the drug is not in it)
+    def position(self, drug):
+        i = int(np.searchsorted(self.drugs, drug))
+        if i < len(self.drugs) and self.drugs[i] == drug:
+            return i
+        return -1
+
+    # the scores of a drug as a dictionary with the scale columns as keys; scales that scored the drug with 0 (or not at all) are left out
+    def scores_of(self, drug, columns=None):
+        i = self.position(drug)
+        if i < 0:
+            return {}
+        scores = np.asarray(self.scores[i], dtype=np.float64)
+        return {column: scores[j] for j, column in enumerate(self.columns) if scores[j] != 0 and (columns is None or column in columns)}
+
+    # the drug x scale matrix of scores (float64) with the drugs in the order of aas_combined.csv and the scale columns in the given order
+    def score_matrix(self, columns=None):
+        columns = self.columns if columns is None else list(columns)
+        return np.asarray(self.scores, dtype=np.float64)[np.argsort(self.order)][:, [self.columns.index(column) for column in columns]]
+
+# add up the scores of all drugs found in each prescription: matches is a sparse prescriptions x drugs matrix (see DrugMatcher.match_matrix)
+# and scores a drugs x scales matrix (see ScaleTable.score_matrix); a scale column stays an integer column unless a found drug has a
+# fractional score on it (like adding the scores one drug at a time to a column of 0s)
+def sum_scores(matches, scores, columns, index):
+    totals = pd.DataFrame(matches @ scores, columns=columns, index=index)
+    found = np.asarray(matches.getnnz(axis=0) > 0)
+    fractional = (scores[found] % 1 != 0).any(axis=0)
+    for j, column in enumerate(columns):
+        if not fractional[j]:
+            totals[column] = totals[column].astype(np.int64)
+    return totals
@@ -0,0 +1,565 @@
+# -*- coding: utf-8 -*-
+"""
+Writes synthetic, UK Biobank-like input files for the Python scripts, so that the pipeline can be run (and timed) without access to the real data.
+
+The files are written into a base directory with the same layout as the real data (the base directory takes the place of 'D:\\PhD\\MAIN'):
+    - 'UK Biobank/Processed files/Tables/gp_scripts_python.csv': GP prescriptions (id, data provider, date, read-, BNF-, and dm+d codes, prescription text, quantity)
+    - 'UK Biobank/Suppl. info/Prescription codes/read-codes.csv': read-codes and the drug names they stand for
+    - 'UK Biobank/Raw files/': participant opt-outs and the covariate files (age and sex, assessment dates, education, deprivation, smoking, alcohol,
+      physical activity, BMI, assessment centre, follow-up dates)
+    - 'UK Biobank/Processed files/Suppl. files/death.csv': dates of death
+    - 'UK Biobank/Processed files/tables/meds_v2_body_system.csv' and 'meds_v2_class_lower.csv': anticholinergic burden per drug class
+    - 'UK Biobank/Processed files/tables/6_demographics_v2.csv': the prescriptions with their scores, doses and covariates, as written by
+      5_covariate_addition.py (so that the later scripts can run if that script fails)
+    - 'anticholinergic burden scales/': the 16 anticholinergic scales, the files with alternative drug names, and the list of drugs with their DDD
+
+The prescription texts are built from a catalogue of real drugs (generic and brand names, strengths, formulations) with the spelling and formatting
+variants found in GP records, which are prescribed with a Zipf-like frequency, plus one text for each manual dose correction of 3_getDose.py
+(DOSE_RULES in dose_corrections.py), so that the corrections of the scripts have rows to work on. The anticholinergic drugs of the scales are
+those of the catalogue and those that the corrections name.
+
+Usage: python synthetic_data.py <base directory> <number of participants> [prescriptions per participant] [seed]
+"""
+
+import os
+import sys
+import re
+import numpy as np
+import pandas as pd
+from dose_corrections import DOSE_RULES
+
+
+
+
+## Catalogue of drugs
+# generic name, brand names, strengths, formulations, anticholinergic (1) or not (0), defined daily dose (mg); a drug can have several
+# entries (e.g. tablets and injections)
+catalogue = [['amitriptyline', ['lentizol'], ['10mg', '25mg', '50mg'], ['tablets', 'oral solution 10mg/5ml'], 1, 75],
+             ['oxybutynin', ['ditropan', 'cystrin', 'lyrinel xl'], ['2.5mg', '5mg'], ['tablets', 'modified-release tablets'], 1, 15],
+             ['hyoscine hydrobromide', ['kwells', 'scopoderm'], ['150micrograms', '300micrograms', '1.5mg'], ['tablets', 'patch'], 1, 1.2],
+             ['hyoscine butylbromide', ['buscopan'], ['10mg', '20mg/1ml'], ['tablets', 'solution for injection ampoules'], 1, 60],
+             ['tolterodine', ['detrusitol'], ['1mg', '2mg', '4mg'], ['tablets', 'modified-release capsules'], 1, 4],
+             ['solifenacin', ['vesicare'], ['5mg', '10mg'], ['tablets'], 1, 5],
+             ['trospium', ['regurin'], ['20mg'], ['tablets'], 1, 40],
+             ['procyclidine', ['kemadrin', 'arpicolin'], ['5mg', '2.5mg/5ml'], ['tablets', 'oral solution'], 1, 15],
+             ['chlorphenamine', ['piriton'], ['4mg', '2mg/5ml'], ['tablets', 'oral solution'], 1, 12],
+             ['promethazine', ['phenergan', 'sominex'], ['10mg', '25mg'], ['tablets'], 1, 25],
+             ['hydroxyzine', ['atarax', 'ucerax'], ['10mg', '25mg'], ['tablets'], 1, 75],
+             ['cyclizine', ['valoid'], ['50mg'], ['tablets'], 1, 150],
+             ['codeine phosphate', [], ['15mg', '30mg', '60mg'], ['tablets'], 1, 100],
+             ['morphine sulfate', ['oramorph', 'zomorph', 'mst continus'], ['10mg/5ml', '10mg', '30mg'], ['oral solution', 'modified-release tablets'], 1, 100],
+             ['tramadol', ['zydol', 'zamadol'], ['50mg', '100mg'], ['capsules', 'modified-release tablets'], 1, 300],
+             ['paroxetine', ['seroxat'], ['10mg', '20mg', '30mg'], ['tablets'], 1, 20],
+             ['nortriptyline', ['allegron'], ['10mg', '25mg'], ['tablets'], 1, 75],
+             ['dosulepin', ['prothiaden'], ['25mg', '75mg'], ['capsules', 'tablets'], 1, 150],
+             ['imipramine', ['tofranil'], ['10mg', '25mg'], ['tablets'], 1, 100],
+             ['clomipramine', ['anafranil'], ['10mg', '25mg', '50mg'], ['capsules'], 1, 100],
+             ['olanzapine', ['zyprexa'], ['2.5mg', '5mg', '10mg'], ['tablets', 'orodispersible tablets'], 1, 10],
+             ['quetiapine', ['seroquel'], ['25mg', '100mg'], ['tablets'], 1, 400],
+             ['chlorpromazine', ['largactil'], ['25mg', '25mg/5ml'], ['tablets', 'oral solution'], 1, 300],
+             ['prochlorperazine', ['stemetil', 'buccastem'], ['5mg', '3mg'], ['tablets', 'buccal tablets'], 1, 100],
+             ['carbamazepine', ['tegretol'], ['100mg', '200mg'], ['tablets', 'prolonged-release tablets'], 1, 1000],
+             ['diazepam', ['valium'], ['2mg', '5mg', '10mg'], ['tablets'], 1, 10],
+             ['loperamide', ['imodium'], ['2mg'], ['capsules'], 1, 10],
+             ['ranitidine', ['zantac'], ['150mg', '300mg'], ['tablets'], 1, 300],
+             ['furosemide', ['lasix'], ['20mg', '40mg'], ['tablets'], 1, 40],
+             ['warfarin', ['marevan'], ['0.5mg', '1mg', '3mg', '5mg'], ['tablets'], 1, 7.5],
+             ['digoxin', ['lanoxin'], ['62.5micrograms', '125micrograms'], ['tablets'], 1, 0.25],
+             ['isosorbide mononitrate', ['imdur', 'monomax'], ['10mg', '20mg', '60mg'], ['tablets', 'modified-release capsules'], 1, 40],
+             ['lithium carbonate', ['priadel', 'camcolit'], ['200mg', '400mg'], ['modified-release tablets'], 1, 24],
+             ['tobramycin', ['tobi'], ['300mg/5ml'], ['nebuliser solution'], 1, 300],
+             ['paracetamol/codeine', ['co-codamol', 'kapake', 'solpadol'], ['500mg/8mg', '500mg/30mg'], ['tablets', 'effervescent tablets'], 1, 3],
+             ['paracetamol/codeine/caffeine', ['solpadeine'], ['500mg/8mg/30mg'], ['tablets'], 1, 3],
+             ['paracetamol/codeine/caffeine/doxylamine', ['syndol'], ['450mg/10mg/30mg/5mg'], ['tablets'], 1, 3],
+             ['carbidopa/levodopa', ['sinemet', 'co-careldopa'], ['12.5mg/50mg', '25mg/100mg'], ['tablets'], 1, 600],
+             ['diphenoxylate/atropine', ['lomotil', 'co-phenotrope'], ['2.5mg/25micrograms'], ['tablets'], 1, 10],
+             ['atropine', ['minims atropine'], ['1%'], ['eye drops'], 1, 1.5],
+             ['fluoxetine', ['prozac'], ['20mg'], ['capsules'], 1, 20],
+             ['citalopram', ['cipramil'], ['10mg', '20mg'], ['tablets'], 1, 20],
+             ['cetirizine', ['zirtek'], ['10mg'], ['tablets'], 1, 10],
+             ['baclofen', ['lioresal'], ['10mg'], ['tablets'], 1, 50],
+             ['metoclopramide', ['maxolon'], ['10mg'], ['tablets'], 1, 30],
+             ['prednisolone', ['deltacortril'], ['5mg', '1mg'], ['tablets', 'gastro-resistant tablets'], 1, 10],
+             ['nifedipine', ['adalat', 'coracten'], ['10mg', '20mg'], ['modified-release capsules'], 1, 30],
+             ['simvastatin', ['zocor'], ['10mg', '20mg', '40mg'], ['tablets'], 0, 30],
+             ['atorvastatin', ['lipitor'], ['10mg', '20mg', '40mg'], ['tablets'], 0, 20],
+             ['omeprazole', ['losec'], ['10mg', '20mg'], ['gastro-resistant capsules'], 0, 20],
+             ['lansoprazole', ['zoton'], ['15mg', '30mg'], ['gastro-resistant capsules'], 0, 30],
+             ['ramipril', ['tritace'], ['1.25mg', '2.5mg', '5mg', '10mg'], ['capsules'], 0, 2.5],
+             ['amlodipine', ['istin'], ['5mg', '10mg'], ['tablets'], 0, 5],
+             ['metformin', ['glucophage'], ['500mg', '850mg'], ['tablets', 'modified-release tablets'], 0, 2000],
+             ['aspirin', ['nu-seals'], ['75mg'], ['dispersible tablets', 'gastro-resistant tablets'], 0, 75],
+             ['salbutamol', ['ventolin', 'airomir'], ['100micrograms/dose'], ['inhaler', 'breath actuated inhaler'], 0, 0.8],
+             ['beclometasone', ['clenil', 'beconase'], ['50micrograms/dose', '100micrograms/dose'], ['nasal spray', 'inhaler'], 0, 0.8],
+             ['hydrocortisone', ['dioderm'], ['1%', '0.5%'], ['cream', 'ointment'], 0, 30],
+             ['levothyroxine', ['eltroxin'], ['25micrograms', '50micrograms', '100micrograms'], ['tablets'], 0, 0.15],
+             ['bendroflumethiazide', ['aprinox'], ['2.5mg'], ['tablets'], 0, 2.5],
+             ['paracetamol', ['panadol', 'calpol'], ['500mg', '120mg/5ml'], ['tablets', 'oral suspension'], 0, 3000],
+             ['ibuprofen', ['brufen', 'nurofen'], ['200mg', '400mg', '5%'], ['tablets', 'gel'], 0, 1200],
+             ['amoxicillin', ['amoxil'], ['250mg', '500mg'], ['capsules'], 1, 1500],
+             ['lisinopril', ['zestril'], ['5mg', '10mg', '20mg'], ['tablets'], 0, 10],
+             ['donepezil', ['aricept'], ['5mg', '10mg'], ['tablets'], 1, 7.5],
+             ['memantine', ['ebixa'], ['10mg', '20mg'], ['tablets'], 0, 20],
+             # drugs of the quantity corrections (B2) of 3_getDose.py
+             ['bupropion', ['zyban'], ['150mg'], ['modified-release tablets'], 1, 300],
+             ['celecoxib', ['celebrex'], ['100mg', '200mg'], ['capsules'], 1, 200],
+             ['darifenacin', ['emselex'], ['7.5mg', '15mg'], ['modified-release tablets'], 1, 7.5],
+             ['disopyramide', ['rythmodan'], ['100mg', '150mg'], ['capsules'], 1, 400],
+             ['duloxetine', ['cymbalta'], ['30mg', '60mg'], ['gastro-resistant capsules'], 1, 60],
+             ['etoricoxib', ['arcoxia'], ['30mg', '60mg', '90mg'], ['tablets'], 1, 60],
+             ['fesoterodine', ['toviaz'], ['4mg', '8mg'], ['modified-release tablets'], 1, 4],
+             ['hydralazine', ['apresoline'], ['25mg', '50mg'], ['tablets'], 1, 100],
+             ['levocetirizine', ['xyzal'], ['5mg'], ['tablets'], 1, 5],
+             ['oxcarbazepine', ['trileptal'], ['150mg', '300mg', '600mg'], ['tablets'], 1, 1000],
+             ['oxitropium', ['oxivent'], ['100micrograms/dose'], ['inhaler'], 1, 0.6],
+             ['propiverine', ['detrunorm'], ['15mg', '30mg'], ['tablets', 'modified-release capsules'], 1, 30],
+             ['reboxetine', ['edronax'], ['4mg'], ['tablets'], 1, 8],
+             ['selegiline', ['eldepryl'], ['5mg', '10mg'], ['tablets'], 1, 5],
+             ['topiramate', ['topamax'], ['25mg', '50mg', '100mg'], ['tablets'], 1, 300],
+             ['tranylcypromine', ['parnate'], ['10mg'], ['tablets'], 1, 17.5],
+             ['atropine', [], ['600micrograms'], ['tablets'], 1, 1.5],
+             # compounds of the combination products (section C)
+             ['carbidopa', ['lodosyn'], ['25mg'], ['tablets'], 1, 100],
+             ['levodopa', [], ['500mg'], ['tablets'], 1, 3500],
+             ['entacapone', ['comtess'], ['200mg'], ['tablets'], 1, 1000],
+             ['chlortalidone', ['hygroton'], ['50mg'], ['tablets'], 1, 25],
+             ['cinnarizine', ['stugeron'], ['15mg'], ['tablets'], 1, 90],
+             ['ergotamine', ['cafergot'], ['1mg'], ['tablets'], 1, 4],
+             ['triamterene', ['dytac'], ['50mg'], ['capsules'], 1, 100],
+             ['pseudoephedrine', ['galpseud'], ['60mg', '30mg/5ml'], ['tablets', 'oral solution'], 1, 240],
+             # combination products (on the scales through their compounds)
+             ['carbidopa/levodopa', [], ['10mg/100mg', '18.75mg/75mg', '31.25mg/125mg', '37.5mg/150mg', '43.75mg/175mg', '50mg/200mg', '62.5mg/250mg'],
+              ['tablets', 'modified-release tablets'], 0, 600],
+             ['carbidopa/levodopa', [], ['10/100', '12.5/50', '25/100', '62.5/250'], ['tablets'], 0, 600],
+             ['carbidopa/levodopa/entacapone', ['stalevo'], ['12.5mg/50mg/200mg', '25mg/100mg/200mg', '37.5mg/150mg/200mg'], ['tablets'], 0, 600],
+             ['atenolol/chlortalidone', ['co-tenidone', 'tenoretic'], ['50mg/12.5mg', '100mg/25mg'], ['tablets'], 0, 75],
+             ['atenolol/nifedipine', ['beta-adalat', 'tenif'], ['50mg/20mg'], ['modified-release capsules'], 0, 75],
+             ['cinnarizine/dimenhydrinate', ['arlevert'], ['20mg/40mg'], ['tablets'], 0, 90],
+             ['paracetamol/codeine/buclizine', ['migraleve'], ['500mg/8mg/6.25mg'], ['pink tablets'], 0, 3],
+             ['paracetamol/codeine', [], ['500mg/8mg'], ['yellow tablets'], 0, 3],
+             ['chlorphenamine/ephedrine', ['haymine'], ['10mg/15mg'], ['modified-release tablets'], 0, 12],
+             ['pseudoephedrine/chlorphenamine', [], ['30mg/2mg/5ml'], ['oral solution'], 0, 12],
+             ['brompheniramine/pseudoephedrine', [], ['4mg/30mg/5ml', '10mg/30mg/5ml'], ['oral solution'], 0, 24],
+             ['ergotamine/cyclizine', ['migril'], ['2mg/50mg'], ['tablets'], 0, 4],
+             ['cyclizine/morphine', ['cyclimorph'], ['50mg/10mg/1ml', '50mg/15mg/1ml'], ['solution for injection ampoules'], 0, 30],
+             ['guaifenesin/pseudoephedrine', [], ['100mg/30mg/5ml'], ['oral solution'], 0, 240],
+             ['lansoprazole/amoxicillin', ['heliclear'], ['30mg/500mg'], ['capsules'], 0, 30],
+             ['nortriptyline/fluphenazine', ['motival'], ['10mg/500micrograms'], ['tablets'], 0, 75],
+             ['amitriptyline/perphenazine', ['triptafen'], ['10mg/2mg', '25mg/2mg'], ['tablets'], 0, 75],
+             ['triamterene/furosemide', ['frusene'], ['50mg/40mg'], ['tablets'], 0, 40],
+             ['triamterene/chlortalidone', ['kalspare'], ['50mg/50mg'], ['tablets'], 0, 25],
+             ['triprolidine/pseudoephedrine', [], ['2.5mg/60mg'], ['tablets'], 0, 240],
+             ['kaolin and morphine', [], ['mixture'], ['bp'], 0, 100],
+             # formulations with their own DDD (section D)
+             ['clindamycin', ['dalacin'], ['150mg', '150mg/1ml'], ['capsules', 'solution for injection ampoules'], 1, 1200],
+             ['fentanyl', ['durogesic'], ['12micrograms/hour', '25micrograms/hour', '50micrograms/hour'], ['transdermal patches'], 1, 1.2],
+             ['fluphenazine', ['modecate'], ['25mg/1ml'], ['solution for injection ampoules'], 1, 10],
+             ['glycopyrronium', ['robinul'], ['200micrograms/1ml'], ['solution for injection ampoules'], 1, 0.3],
+             ['haloperidol', ['haldol', 'serenace'], ['500micrograms', '1.5mg', '5mg'], ['tablets'], 1, 8],
+             ['haloperidol', [], ['1mg/1ml', '5mg/1ml'], ['oral solution', 'solution for injection ampoules'], 1, 8],
+             ['ipratropium', ['atrovent'], ['20micrograms/dose'], ['inhaler'], 1, 0.12],
+             ['ipratropium', [], ['250micrograms/1ml', '500micrograms/2ml'], ['nebuliser liquid'], 1, 0.3],
+             ['isosorbide dinitrate', ['isordil'], ['10mg', '20mg'], ['tablets'], 1, 60],
+             ['isosorbide dinitrate', [], ['5mg'], ['sublingual tablets'], 1, 20],
+             ['levomepromazine', ['nozinan'], ['25mg'], ['tablets'], 1, 300],
+             ['levomepromazine', [], ['25mg/1ml'], ['solution for injection ampoules'], 1, 100],
+             ['levofloxacin', ['tavanic'], ['250mg', '500mg'], ['tablets'], 1, 500],
+             ['levofloxacin', [], ['500mg/100ml'], ['solution for infusion'], 1, 500],
+             ['methylprednisolone', ['medrone'], ['4mg', '16mg'], ['tablets'], 1, 7.5],
+             ['methylprednisolone', [], ['40mg/1ml'], ['suspension for injection vials'], 1, 20],
+             ['morphine sulfate', [], ['10mg/1ml', '30mg/1ml'], ['solution for injection ampoules'], 1, 30],
+             ['oxybutynin', ['kentera'], ['3.9mg/24hours'], ['transdermal patches'], 1, 3.9],
+             ['oxycodone', ['oxycontin'], ['10mg', '20mg'], ['modified-release tablets'], 1, 75],
+             ['oxycodone', ['oxynorm'], ['10mg/1ml'], ['solution for injection ampoules'], 1, 30],
+             ['paliperidone', ['invega'], ['3mg', '6mg'], ['modified-release tablets'], 1, 6],
+             ['paliperidone', ['xeplion'], ['100mg/1ml'], ['prolonged-release suspension for injection'], 1, 2.5],
+             ['pipotiazine', [], ['50mg/1ml'], ['oily solution for injection ampoules'], 1, 5],
+             ['prochlorperazine', [], ['12.5mg/1ml'], ['solution for injection ampoules'], 1, 50],
+             ['sumatriptan', ['imigran'], ['50mg', '100mg'], ['tablets'], 1, 50],
+             ['sumatriptan', [], ['6mg/0.5ml'], ['solution for injection pre-filled pens'], 1, 6],
+             ['tiotropium', ['spiriva'], ['18micrograms'], ['inhalation powder capsules'], 1, 0.018],
+             ['tiotropium', [], ['2.5micrograms/dose'], ['respimat inhaler'], 1, 0.005],
+             ['zuclopenthixol', ['clopixol'], ['10mg'], ['tablets'], 1, 30],
+             ['zuclopenthixol', [], ['200mg/1ml'], ['solution for injection ampoules'], 1, 15],
+             ['lithium citrate', [], ['520mg/5ml'], ['oral solution'], 1, 5038.152],
+             ['bromocriptine', ['parlodel'], ['2.5mg', '5mg', '10mg'], ['tablets', 'capsules'], 1, 20]]
+
+# catalogue names that differ from the names of the scales (and of the corrections of 3_getDose.py)
+scale_names = {'codeine phosphate': 'codeine', 'morphine sulfate': 'morphine', 'isosorbide mononitrate': 'isosorbide', 'isosorbide dinitrate': 'isosorbide',
+               'lithium carbonate': 'lithium', 'lithium citrate': 'lithium'}
+
+# share of the prescriptions with the texts of the manual dose corrections (equally often each), and the DDD (mg) of the drugs that only the
+# corrections name
+rule_share = 0.25
+rule_ddd = 10
+# words of the corrections' texts, as written in the prescriptions
+rule_words = {'evo': 'evohaler', 'accu': 'accuhaler'}
+# a value (in mg) that meets a condition of a correction
+condition_values = {'==': lambda number: number, '>=': lambda number: number, '<=': lambda number: number,
+                    '>': lambda number: number * 2 + 1, '!=': lambda number: number * 2 + 1, '<': lambda number: number / 2}
+# dose column of a condition and its position among the doses of the prescription
+condition_slots = {'dose': 1, 'dose_a1_number': 1, 'dose_a2_number': 2, 'dose_a3_number': 3}
+
+# manufacturers added to some of the prescription texts
+manufacturers = ['Accord Healthcare Ltd', 'Teva UK Ltd', 'Zentiva', 'Mylan', 'Actavis UK Ltd', 'Sandoz Ltd', 'Almus Pharmaceuticals Ltd']
+
+# abbreviations of the formulations found in GP records
+abbreviations = {'tablets': 'tab', 'capsules': 'cap', 'modified-release tablets': 'm/r tab', 'modified-release capsules': 'm/r cap',
+                 'oral solution': 'oral soln', 'gastro-resistant capsules': 'e/c cap', 'gastro-resistant tablets': 'e/c tab', 'dispersible tablets': 'disp tab'}
+
+# quantities by formulation (text, weight)
+quantities_solid = [['28', 30], ['56', 20], ['84', 5], ['28 tablet', 10], ['56 tablets', 8], ['28 capsule', 6], ['1 pack of 28 tablet(s)', 6],
+                    ['2 x 28', 3], ['100', 4], ['14 tab', 4], ['30', 3], ['1 pack', 1], ['2*28', 2], ['28 X 2', 2], ['28x3', 1], ['14+14', 1],
+                    ['2 packs of 28', 2], ['3 x 28 tablets (84)', 2], ['Pack of 56', 1], ['1 pack of 28 tablet(s) - 2 MONTHS', 1], ['56 - 2 months', 1],
+                    ['28 tabs 1 mnth', 1], ['3 X 10', 1], ['2 X 14', 1], ['112', 1], ['120', 1], ['1 pack of 5 suppositories', 1]]
+quantities_liquid = [['100 ml', 10], ['150ml', 6], ['200 millilitres', 4], ['500 ml', 3], ['1 bottle', 2], ['300 ml - 10mg/5ml', 1], ['2 x 100ml', 2],
+                     ['10 X 1 ampoules', 1], ['5 ampoule', 1]]
+quantities_other = [['1', 10], ['1 pack', 6], ['30 gram', 4], ['1 inhaler', 5], ['10 ml', 3], ['4 patch', 2], ['200 dose', 2], ['1 x 200 dose', 1],
+                    ['2 x 1 inhaler', 1], ['8 patch - 1 month', 1]]
+# prescriptions with the most strengths and numbers that the real data has
+widest = [['Paracetamol/codeine/caffeine/doxylamine 450mg/10mg/30mg/5mg tablets', '3 x 28 tablets (84) - 1 x 14 - 2 x 7 - 21 - 9'],
+          ['Paracetamol/codeine/caffeine tablets', '28 - 500mg/8mg/30mg']]
+
+# drug classes used by the scripts that compute the burden per drug class
+body_systems = ['alimentary tract and metabolism', 'antiinfectives for systemic use', 'antiparasitic products, insecticides and repellents',
+                'antineoplastic and immunomodulating agents', 'sensory organs', 'blood and blood forming organs', 'cardiovascular system',
+                'genito urinary system and sex hormones', 'musculo-skeletal system', 'nervous system', 'respiratory system',
+                'systemic hormonal preparations, excl. sex hormones and insulins']
+classes_lower = ['ace inhibitors, plain', 'aminoglycoside antibacterials', 'antiarrhythmics, class i and iii', 'anticholinergic agents',
+                 'antidepressants', 'antiepileptics', 'antigout preparations', 'antihistamines for systemic use',
+                 'antiinflammatory and antirheumatic products, non-steroids', 'antimigraine preparations', 'antipropulsives', 'antipsychotics',
+                 'antithrombotic agents', 'anxiolytics', 'arteriolar smooth muscle, agents acting on', 'belladonna and derivatives, plain',
+                 'beta-lactam antibacterials, penicillins', 'blood glucose lowering drugs, excl. insulins', 'cardiac glycosides',
+                 'corticosteroids for systemic use, plain', 'cough suppressants, excl. combinations with expectorants', 'dopaminergic agents',
+                 'drugs for constipation', 'drugs for functional gastrointestinal disorders',
+                 'drugs for peptic ulcer and gastro-oesophageal reflux disease (gord)', 'drugs for treatment of tuberculosis',
+                 'expectorants, excl. combinations with cough suppressants', 'high-ceiling diuretics', 'hypnotics and sedatives', 'immunosuppressants',
+                 'low-ceiling diuretics, excl. thiazides', 'macrolides, lincosamides and streptogramins', 'muscle relaxants, centrally acting agents',
+                 'nasal decongestants for systemic use', 'opioids', 'other antibacterials', 'other systemic drugs for obstructive airway diseases',
+                 'potassium-sparing agents', 'propulsives', 'quinolone antibacterials',
+                 'selective calcium channel blockers with direct cardiac effects', 'urologicals', 'vasodilators used in cardiac diseases']
+
+# the anticholinergic scales (file name) and the share of the anticholinergic drugs that each of them covers
+scale_files = [['Kiesel.csv', 1], ['Kiesel_Duran.csv', 0.6], ['Ancelin.csv', 0.5], ['Boustani.csv', 0.6], ['Carnahan.csv', 0.5], ['Cancelli.csv', 0.4],
+               ['Chew.csv', 0.4], ['Rudolph_Sumukadas.csv', 0.3], ['Ehrt.csv', 0.5], ['Han.csv', 0.5], ['Sittironnarit.csv', 0.4], ['Duran.csv', 0.7],
+               ['Briet.csv', 0.5], ['Bishara.csv', 0.6], ['nery.csv', 0.6], ['jun.csv', 0.5]]
+
+
+
+
+## Helper functions
+
+# a prescription text for each manual dose correction of 3_getDose.py (DOSE_RULES in dose_corrections.py): the drug, the doses that meet its
+# conditions (in mg; 'found' rules only, as the rows of 'lost' rules have no dose), the texts it looks for and a term of its route; a rule
+# that only applies after an earlier rule changed the dose can still miss its text
+def makeRuleTexts():
+    texts = {}
+    for rule in DOSE_RULES.itertuples():
+        conditions = [] if rule.condition is None else [rule.condition] if isinstance(rule.condition, tuple) else list(rule.condition)
+        words = [] if rule.text is None else [rule.text] if isinstance(rule.text, str) else list(rule.text)
+        doses = {}
+        for condition in conditions:
+            if condition[0] in condition_slots and condition[1] != 'notnull':
+                doses[condition_slots[condition[0]]] = condition_values[condition[1]](condition[2])
+        liquid = rule.route == 'liquid' or any('ml' in word for word in words)
+        if rule.frame == 'found':
+            # a number that the rule looks for is the dose, if no condition sets it
+            numbers = [word for word in words if re.fullmatch(r'[\d\.]+', word)]
+            if 1 not in doses and len(numbers) > 0:
+                doses[1] = float(numbers[0])
+                words.remove(numbers[0])
+            slots = max([1] + list(doses) + [condition_slots[condition[0]] for condition in conditions if condition[0] in condition_slots])
+            strength = '/'.join('%gmg' % doses.get(slot, 10 if slot == 1 else 1) for slot in range(1, slots + 1))
+            if liquid and not any('ml' in word for word in words):
+                strength += '/5ml'
+            parts = [rule.drug, strength]
+        else:
+            parts = [rule.drug] + (['5ml'] if liquid and not any('ml' in word for word in words) else [])
+        parts += [rule_words.get(word, word) for word in words]
+        if rule.route == 'injectable':
+            parts.append('solution for injection')
+        elif liquid:
+            parts.append('oral solution')
+        elif rule.route == 'percentage':
+            parts += ['1%', 'tablets']
+        else:
+            parts.append('tablets')
+        texts[' '.join(parts).capitalize()] = rule.drug
+    return list(texts.items())
+
+# all text variants of a drug (as written in GP records), with the weights with which they are prescribed, and the text added to the quantity
+# (some records have the strength in the quantity instead of the prescription)
+def makeVariants(generic, brands, strengths, forms, rng):
+    variants = []
+    for strength in strengths:
+        for form in forms:
+            variants.append([generic.capitalize() + ' ' + strength + ' ' + form, 10, ''])
+            variants.append([(generic + ' ' + strength + ' ' + abbreviations.get(form, form)).upper(), 4, ''])
+            variants.append([generic.capitalize() + ' ' + strength + ' ' + form + ' (' + rng.choice(manufacturers) + ')', 3, ''])
+            variants.append(['  ' + generic + ' ' + strength + ' ' + abbreviations.get(form, form), 1, ''])
+            if strength.count('/') < 3: # at most three strengths are recorded in the quantity
+                variants.append([generic.capitalize() + ' ' + form, 1, ' - ' + strength])
+            for brand in brands:
+                variants.append([brand.title() + ' ' + strength + ' ' + form, 3, ''])
+    return variants
+
+# quantity texts that fit a formulation
+def quantityPool(form):
+    if any(word in form for word in ['tablet', 'capsule']):
+        return quantities_solid
+    if any(word in form for word in ['solution', 'suspension']):
+        return quantities_liquid
+    return quantities_other
+
+# random dates (as strings in the given format) between two years
+def randomDates(rng, n, first_year, last_year, date_format):
+    days = rng.integers(0, (last_year - first_year + 1) * 365, n)
+    return (pd.Timestamp(str(first_year) + '-01-01') + pd.to_timedelta(days, unit='D')).strftime(date_format)
+
+# set a share of the values to NaN
+def blank(rng, values, share):
+    values = pd.Series(values, dtype=object)
+    values[rng.random(len(values)) < share] = np.nan
+    return values
+
+
+
+
+## Generate the data
+
+def generate(base_dir, n_participants, prescriptions_per_participant=20, seed=1):
+    rng = np.random.default_rng(seed)
+    raw_dir = os.path.join(base_dir, 'UK Biobank', 'Raw files')
+    scales_dir = os.path.join(base_dir, 'anticholinergic burden scales')
+    for directory in [raw_dir, scales_dir, os.path.join(base_dir, 'UK Biobank', 'Processed files', 'Tables'), os.path.join(base_dir, 'UK Biobank', 'Processed files', 'tables'),
+                      os.path.join(base_dir, 'UK Biobank', 'Processed files', 'Suppl. files'), os.path.join(base_dir, 'UK Biobank', 'Suppl. info', 'Prescription codes')]:
+        os.makedirs(directory, exist_ok=True)
+
+    # the anticholinergic drugs (under their names on the scales) with their DDD: those of the catalogue and those that the manual dose
+    # corrections name
+    aa_drugs = {}
+    for generic, brands, strengths, forms, aa, ddd in catalogue:
+        if aa == 1:
+            aa_drugs.setdefault(scale_names.get(generic, generic), [brands if generic not in scale_names else [], ddd]) # brands stand for the catalogue name
+    for drug in DOSE_RULES['drug'].unique():
+        aa_drugs.setdefault(drug, [[], rule_ddd])
+
+    # text variants of all drugs, each with its own read-code; the catalogue drugs are prescribed with a Zipf-like frequency, and the texts
+    # of the corrections take a fixed share of the prescriptions
+    variants = []
+    for rank, (generic, brands, strengths, forms, aa, ddd) in enumerate(catalogue):
+        drug_variants = makeVariants(generic, brands, strengths, forms, rng)
+        total = sum(weight for text, weight, suffix in drug_variants)
+        for text, weight, suffix in drug_variants:
+            variants.append([text, generic, weight / total / (rank + 1), quantityPool(text.lower()), suffix])
+    rule_texts = makeRuleTexts()
+    rule_weight = sum(variant[2] for variant in variants) * rule_share / (1 - rule_share) / len(rule_texts)
+    for text, drug in rule_texts:
+        variants.append([text, drug, rule_weight, quantityPool(text.lower()), ''])
+    codes = set()
+    while len(codes) < len(variants):
+        codes.add(''.join(rng.choice(list('abcdefghijklmnopqrstuvwxyz0123456789'), 4)) + '.')
+    variants = pd.DataFrame(variants, columns=['text', 'generic', 'weight', 'quantities', 'quantity_suffix'])
+    variants['aa_name'] = [name if name in aa_drugs else np.nan for name in variants['generic'].replace(scale_names)]
+    variants['read_code'] = sorted(codes)
+    variants['bnf'] = ['0' + str(code) for code in rng.integers(1000000, 9999999, len(variants))]
+    variants['dmd'] = [str(code) for code in rng.integers(10000000000, 99999999999, len(variants), dtype=np.int64)]
+
+    # participants
+    ids = np.arange(1000001, 1000001 + n_participants)
+    providers = rng.choice([1, 2, 3, 4], n_participants, p=[0.45, 0.1, 0.4, 0.05])
+
+    ## GP prescriptions
+    counts = rng.poisson(prescriptions_per_participant, n_participants)
+    rows = int(counts.sum())
+    row_ids = np.repeat(ids, counts)
+    row_providers = np.repeat(providers, counts)
+    picks = rng.choice(len(variants), rows, p=(variants['weight'] / variants['weight'].sum()).to_numpy())
+    prescriptions = variants['text'].to_numpy()[picks].astype(object)
+    read_codes = variants['read_code'].to_numpy()[picks].astype(object)
+    # some read-codes have two additional 0s at the end
+    with_00 = rng.random(rows) < 0.05
+    read_codes[with_00] = read_codes[with_00] + '00'
+    # the data providers record the prescriptions differently: Scotland mostly by read-code only, TPP by dm+d code, Vision by read- and BNF code
+    no_text = (row_providers == 2) & (rng.random(rows) < 0.7)
+    prescriptions[no_text] = np.nan
+    read_codes[row_providers == 3] = np.nan
+    bnf = np.where(row_providers == 1, variants['bnf'].to_numpy()[picks], None)
+    dmd = np.where(row_providers == 3, variants['dmd'].to_numpy()[picks], None)
+    # quantities that fit the formulation
+    quantity = np.empty(rows, dtype=object)
+    for pool_count, pool in enumerate([quantities_solid, quantities_liquid, quantities_other]):
+        in_pool = np.array([quantities is pool for quantities in variants['quantities']])[picks]
+        weights = np.array([weight for text, weight in pool], dtype=float)
+        quantity[in_pool] = np.array([text for text, weight in pool], dtype=object)[rng.choice(len(pool), in_pool.sum(), p=weights / weights.sum())]
+    quantity = quantity + variants['quantity_suffix'].to_numpy()[picks]
+    # dates (a few are missing or have the placeholder dates of the real data)
+    dates = randomDates(rng, rows, 1990, 2017, '%d/%m/%Y').to_numpy().astype(object)
+    placeholder = rng.random(rows) < 0.0005
+    dates[placeholder] = rng.choice(['01/01/1901', '02/02/1902', '03/03/1903', '07/07/2037'], placeholder.sum())
+    gp_scripts = pd.DataFrame({'eid': row_ids, 'data_provider': row_providers, 'issue_date': blank(rng, dates, 0.001),
+                               'read_2': read_codes, 'bnf_code': bnf, 'dmd_code': dmd, 'drug_name': prescriptions,
+                               'quantity': blank(rng, quantity, 0.02)})
+    # 3_getDose.py expects the widest texts of the real data (four strengths in a prescription, three in a quantity, nine numbers in a
+    # quantity), so the first participant gets one prescription of each
+    gp_scripts.loc[:len(widest) - 1, ['data_provider', 'issue_date', 'drug_name', 'quantity']] = \
+        [[1, '01/06/2005', text, quantity] for text, quantity in widest]
+    gp_scripts.to_csv(os.path.join(base_dir, 'UK Biobank', 'Processed files', 'Tables', 'gp_scripts_python.csv'), index=True)
+
+    # read-codes (with a few codes that do not appear among the prescriptions)
+    read_code_file = pd.DataFrame({'code': variants['read_code'], 'drug': variants['text'].str.strip(), 'status_flag': 'R'})
+    read_code_file.to_csv(os.path.join(base_dir, 'UK Biobank', 'Suppl. info', 'Prescription codes', 'read-codes.csv'), index=False)
+
+    ## Anticholinergic scales
+    # every anticholinergic drug has a 'true' score; the scales cover parts of the drugs and disagree by one point now and then (the drugs
+    # that only Kiesel's and Duran's lists have are added to those lists below)
+    add_ons = {'Kiesel.csv': [['rotigotine', 1], ['aclidinium bromide', 1], ['dimetindene', 2], ['etoricoxib', 1]], 'Duran.csv': [['ketotifen', 1]]}
+    scale_drugs = [[drug, brands] for drug, (brands, ddd) in aa_drugs.items() if drug not in [name for names in add_ons.values() for name, score in names]]
+    true_scores = rng.choice([1, 2, 3], len(scale_drugs), p=[0.6, 0.2, 0.2])
+    for file, coverage in scale_files:
+        covered = rng.random(len(scale_drugs)) < coverage
+        scale = []
+        for (name, brands), score, included in zip(scale_drugs, true_scores, covered):
+            if not included:
+                continue
+            score = int(np.clip(score + rng.choice([-1, 0, 0, 0, 1]), 0, 3))
+            # Kiesel lists every anticholinergic drug with a score, so that all of them end up in the combined scales
+            if file == 'Kiesel.csv':
+                score = max(score, 1)
+            # some scales list drugs by brand name, in capitals, or with white spaces
+            if len(brands) > 0 and rng.random() < 0.05:
+                name = brands[0]
+            if rng.random() < 0.1:
+                name = name.capitalize() + ' '
+            scale.append([name, score])
+        scale += add_ons.get(file, [])
+        pd.DataFrame(scale, columns=['drug', 'aa']).to_csv(os.path.join(scales_dir, file), index=False)
+
+    # alternative drug names (brand names and the generic names they stand for)
+    brand_names = [[brand, generic, '1' if '/' in generic else '0'] for generic, brands, strengths, forms, aa, ddd in catalogue for brand in brands]
+    pd.DataFrame(brand_names, columns=['brand', 'generic', 'combination']).to_csv(os.path.join(scales_dir, 'alternative drug names_reformatted.csv'), index=False)
+    alternative_names = pd.DataFrame([[generic] + brands[:3] + [np.nan] * (3 - len(brands[:3])) for generic, brands, strengths, forms, aa, ddd in catalogue],
+                                     columns=['generic', 'brand_1', 'brand_2', 'brand_3']).drop_duplicates('generic')
+    alternative_names.to_csv(os.path.join(scales_dir, 'alternative drug names.csv'), index=False)
+
+    # list of anticholinergic drugs with their defined daily dose
+    drug_list = pd.DataFrame([[drug, ddd] for drug, (brands, ddd) in aa_drugs.items()], columns=['drug', 'ddd'])
+    drug_list.to_csv(os.path.join(scales_dir, 'drug_list.csv'), index=False)
+
+    ## Participants
+    # opt-outs and deaths
+    pd.DataFrame({'eid': rng.choice(ids[1:], max(1, n_participants // 1000), replace=False)}).to_csv(os.path.join(raw_dir, 'participant opt-out.csv'), index=False)
+    died = rng.random(n_participants) < 0.05
+    pd.DataFrame({'eid': ids[died], 'date_of_death': randomDates(rng, died.sum(), 2008, 2020, '%Y-%m-%d'), 'cause': 'X'}).\
+        to_csv(os.path.join(base_dir, 'UK Biobank', 'Processed files', 'Suppl. files', 'death.csv'), index=False)
+
+    # age and sex
+    age_sex = pd.DataFrame({'id': ids, 'sex': rng.integers(0, 2, n_participants), 'birth_year': rng.integers(1937, 1971, n_participants),
+                            'birth_month': rng.integers(1, 13, n_participants)})
+    age_sex.to_csv(os.path.join(raw_dir, 'age_sex.csv'), index=False)
+
+    # assessment visits (everybody attended the first; fewer attended the later ones)
+    visits = pd.DataFrame({'id': ids, 'date_0': randomDates(rng, n_participants, 2006, 2010, '%Y-%m-%d'),
+                           'date_1': blank(rng, randomDates(rng, n_participants, 2012, 2013, '%Y-%m-%d'), 0.95),
+                           'date_2': blank(rng, randomDates(rng, n_participants, 2014, 2019, '%Y-%m-%d'), 0.9),
+                           'date_3': blank(rng, randomDates(rng, n_participants, 2019, 2020, '%Y-%m-%d'), 0.99)})
+    visits.to_csv(os.path.join(raw_dir, 'ass_date.csv'), index=False)
+    pd.DataFrame({'eid': ids, 'X20140.0.0': blank(rng, randomDates(rng, n_participants, 2014, 2020, '%Y-%m-%d'), 0.7)}).\
+        to_csv(os.path.join(raw_dir, 'follow_up_date.csv'), index=False)
+    pd.DataFrame({'id': ids, 'centre_0': rng.choice([11010, 11016, 11021, 11025, 11026, 11027], n_participants),
+                  'centre_1': blank(rng, rng.choice([11025, 11026], n_participants), 0.9), 'centre_2': blank(rng, rng.choice([11025, 11027], n_participants), 0.95)}).\
+        to_csv(os.path.join(raw_dir, 'assessment_centre.csv'), index=False)
+
+    # education (age completed, qualifications at four visits, year ended)
+    education = {'id': ids}
+    for visit in range(3):
+        education['age_completed_' + str(visit)] = blank(rng, rng.integers(14, 22, n_participants), 0.5)
+    for visit in range(4):
+        for answer in range(6):
+            share = 0.0 if visit == 0 and answer == 0 else (0.6 if visit == 0 else 0.95)
+            education['qualifications_' + str(visit) + '_' + str(answer)] = blank(rng, rng.choice([1, 2, 3, 4, 5, 6, -7, -3], n_participants), share)
+    education['year_ended'] = blank(rng, rng.integers(1950, 1995, n_participants), 0.5)
+    pd.DataFrame(education).to_csv(os.path.join(raw_dir, 'education.csv'), index=False)
+
+    # deprivation, smoking, alcohol, physical activity, and BMI
+    deprivation = np.round(rng.normal(-1.3, 3, n_participants), 3)
+    pd.DataFrame({'id': ids, 'deprivation': deprivation}).to_csv(os.path.join(raw_dir, 'deprivation.csv'), index=False)
+    tobacco = {'id': ids}
+    for visit in range(4):
+        tobacco['smoking_' + str(visit)] = blank(rng, rng.choice([0, 1, 2, -3], n_participants, p=[0.55, 0.34, 0.1, 0.01]), 0 if visit == 0 else 0.9)
+    for visit in range(4):
+        tobacco['age_stop_' + str(visit)] = blank(rng, rng.integers(20, 60, n_participants), 0.7)
+    pd.DataFrame(tobacco).to_csv(os.path.join(raw_dir, 'tobacco.csv'), index=False)
+    alcohol = {'id': ids}
+    for visit in range(4):
+        alcohol['alc_freq_' + str(visit)] = blank(rng, rng.choice([1, 2, 3, 4, 5, 6, -3], n_participants), 0 if visit == 0 else 0.9)
+    pd.DataFrame(alcohol).to_csv(os.path.join(raw_dir, 'alcohol.csv'), index=False)
+    activity = {'id': ids}
+    for visit in range(4):
+        for answer in range(5):
+            activity['activity_' + str(visit) + '_' + str(answer)] = blank(rng, rng.choice([1, 2, 3, 4, 5, -7, -3], n_participants), 0.3 if visit == 0 else 0.95)
+    pd.DataFrame(activity).to_csv(os.path.join(raw_dir, 'activity_type.csv'), index=False)
+    bmi = {'id': ids}
+    for visit in range(4):
+        bmi['bmi_' + str(visit)] = blank(rng, np.round(rng.normal(27.4, 4.8, n_participants), 4), 0.01 if visit == 0 else 0.9)
+    pd.DataFrame(bmi).to_csv(os.path.join(raw_dir, 'bmi.csv'), index=False)
+
+    ## Anticholinergic burden per drug class (one row for a share of the prescriptions)
+    class_rows = rng.random(rows) < 0.3
+    class_dates = randomDates(rng, class_rows.sum(), 1990, 2017, '%Y-%m-%d')
+    for file, columns in [['meds_v2_body_system.csv', body_systems], ['meds_v2_class_lower.csv', classes_lower]]:
+        burden = pd.DataFrame({'id': row_ids[class_rows], 'date': class_dates})
+        which = rng.integers(0, len(columns), class_rows.sum())
+        for count, column in enumerate(columns):
+            burden[column] = np.where(which == count, rng.choice([0.5, 1, 2, 3], class_rows.sum()), 0)
+        burden.to_csv(os.path.join(base_dir, 'UK Biobank', 'Processed files', 'tables', file), index=False)
+
+    ## Prescriptions with covariates (as written by 5_covariate_addition.py)
+    # the anticholinergic prescriptions get scores, a dose and a number; the covariates at the time of the prescription are those of the
+    # first visit
+    participant = np.repeat(np.arange(n_participants), counts)
+    aa_names = variants['aa_name'].to_numpy()[picks]
+    is_aa = pd.notna(aa_names)
+    demographics = pd.DataFrame({'id': gp_scripts['eid'], 'data_provider': gp_scripts['data_provider'],
+                                 'date': pd.to_datetime(gp_scripts['issue_date'], format='%d/%m/%Y').dt.strftime('%Y-%m-%d')})
+    for column in ['aa_ancelin', 'aa_boustani', 'aa_carnahan', 'aa_cancelli', 'aa_chew', 'aa_han', 'aa_rudolph', 'aa_ehrt', 'aa_sittironnarit',
+                   'aa_briet', 'aa_bishara', 'aa_nery', 'aa_jun', 'aa_kiesel', 'aa_duran']:
+        demographics[column] = np.where(is_aa, rng.choice([0, 1, 2, 3], rows, p=[0.4, 0.3, 0.15, 0.15]), 0).astype(float)
+    demographics['admin_oral'] = np.where(rng.random(rows) < 0.05, 0, 1)
+    demographics['aa_name'] = aa_names
+    demographics['dose'] = np.where(is_aa, rng.choice([1, 2.5, 5, 10, 20, 25, 50, 100], rows), np.nan)
+    demographics['dose_units'] = np.where(is_aa, 'mg', None)
+    demographics['number'] = np.where(is_aa, rng.choice([14, 28, 56, 84, 100], rows), np.nan)
+    demographics['ddd'] = [aa_drugs[name][1] if isinstance(name, str) else np.nan for name in aa_names]
+    demographics['dose_standardised'] = demographics['dose']
+    demographics['dose_total'] = demographics['dose'] * demographics['number']
+    demographics['ddd_total'] = demographics['dose_total'] / demographics['ddd']
+    demographics['sex'] = age_sex['sex'].to_numpy()[participant]
+    birth_dates = pd.to_datetime(pd.DataFrame({'year': age_sex['birth_year'], 'month': age_sex['birth_month'], 'day': 1}))
+    demographics['birth_date'] = birth_dates.dt.strftime('%Y-%m-%d').to_numpy()[participant]
+    demographics['med_age'] = (pd.to_datetime(demographics['date']) - birth_dates.to_numpy()[participant]).dt.total_seconds() / (24 * 3600) / 365.242
+    education_0 = rng.integers(0, 2, n_participants)
+    for name, first, third in [['education', education_0, blank(rng, education_0, 0.9)], ['deprivation', deprivation, None],
+                               ['smoking', tobacco['smoking_0'], tobacco['smoking_2']], ['alc_freq', alcohol['alc_freq_0'], alcohol['alc_freq_2']],
+                               ['activity', activity['activity_0_0'], activity['activity_2_0']], ['bmi', bmi['bmi_0'], bmi['bmi_2']]]:
+        if third is None:
+            demographics[name] = np.asarray(first)[participant]
+            continue
+        demographics[name + '_0'] = np.asarray(first)[participant]
+        demographics[name + '_2'] = np.asarray(third)[participant]
+        demographics['med_' + name] = demographics[name + '_0']
+    demographics.to_csv(os.path.join(base_dir, 'UK Biobank', 'Processed files', 'tables', '6_demographics_v2.csv'), index=False, sep='|')
+
+    return rows
+
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+    rows = generate(sys.argv[1], int(sys.argv[2]),
+                    prescriptions_per_participant = float(sys.argv[3]) if len(sys.argv) > 3 else 20,
+                    seed = int(sys.argv[4]) if len(sys.argv) > 4 else 1)
+    print('Wrote ' + str(rows) + ' prescriptions for ' + sys.argv[2] + ' participants to ' + sys.argv[1])